@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+"""Scaling benchmark for io_su2.file_read_util.tecplot_reader.
+Writes synthetic multi-zone tecplot files with 1k to 10M values and times the reader.
+The time per value should stay roughly constant if the reader scales linearly.
+
+Usage: python bench_tecplot_reader.py [max_values]
+
+Author: Jayant Mukhopadhaya
+Last updated: 10/18/2026"""
+
+from io_su2.file_read_util import *
+import numpy as np
+import os
+import sys
+import tempfile
+import time
+
+def write_tecplot_file(filename, n_values, n_vars=4, n_zones=2, delimiter=' '):
+    """Writes a synthetic tabular tecplot file with n_values values spread over n_zones zones"""
+    n_rows = max(n_values // (n_vars*n_zones), 1)
+    variables = ','.join('"var{}"'.format(i) for i in range(n_vars))
+    with open(filename, 'w') as f:
+        f.write('variables=' + variables + '\n')
+        for zone in range(n_zones):
+            f.write('zone t="zone{}"\n'.format(zone))
+            np.savetxt(f, np.random.rand(n_rows, n_vars), delimiter=delimiter, fmt='%.9e')
+    return n_rows*n_vars*n_zones
+
+def main():
+    max_values = int(float(sys.argv[1])) if len(sys.argv) > 1 else int(1e7)
+    sizes = [int(10**i) for i in range(3, 8) if 10**i <= max_values]
+
+    print('{:>12} {:>12} {:>12} {:>14}'.format('values', 'delimiter', 'time (s)', 'ns / value'))
+    with tempfile.TemporaryDirectory() as tmp:
+        for delimiter in [' ', ',']:
+            for size in sizes:
+                filename = os.path.join(tmp, 'bench.dat')
+                n_values = write_tecplot_file(filename, size, delimiter=delimiter)
+                start = time.perf_counter()
+                tecplot_reader(filename)
+                elapsed = time.perf_counter() - start
+                print('{:>12d} {:>12} {:>12.4f} {:>14.1f}'.format(n_values, repr(delimiter), elapsed, 1e9*elapsed/n_values))
+
+if __name__ == "__main__":
+    main()
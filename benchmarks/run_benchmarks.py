@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+
+"""Benchmark suite for the io_su2 readers and the vandv_tools kernels.
+
+Synthetic SU2 files are written for every scale (see synthetic_data.py, scale 1 is
+the size of the flat plate example), and every benchmark is timed with a warm page
+cache and a cold one. For cold runs the files of the benchmark data are dropped from
+the page cache with posix_fadvise before every run, which does not need root. Peak
+memory is measured with tracemalloc in a separate run, so it does not slow down the
+timed runs. Memory mapped data is not counted.
+
+Results are written as json. With --compare, the results are checked against a saved
+baseline and every benchmark that got slower than the threshold is flagged, and the
+script exits with status 1.
+
+Usage: python run_benchmarks.py [-s 1,10,100] [-r 5] [-o results.json] [-c baseline.json]
+
+Author: Jayant Mukhopadhaya
+Last updated: 10/18/2026"""
+
+from optparse import OptionParser
+from io_su2.file_read_util import *
+from io_su2.file_read_util import _MESH_METADATA_CACHE, _mesh_metadata_sidecar
+from io_su2.restart import read_restart
+from io_su2.vtu_reader import read_vtu
+from vandv_tools.pv import PVWrapper
+from vandv_tools.util import calculate_uplus_yplus
+from synthetic_data import generate
+import numpy as np
+import datetime
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+def _clear_mesh_cache(data):
+    """Removes the cached mesh metadata, so get_mesh_data scans the mesh"""
+    _MESH_METADATA_CACHE.clear()
+    sidecar = _mesh_metadata_sidecar(os.path.abspath(data['mesh']))
+    if os.path.isfile(sidecar):
+        os.remove(sidecar)
+
+def _case_files(data, name):
+    return [os.path.join(case, name) for case in data['cases']]
+
+def _read_restart(data):
+    # the solution block is memory mapped, so touch all of it
+    return np.asarray(read_restart(data['restart'])['DATA']).sum()
+
+# name, setup called before every run (not timed), benchmark
+BENCHMARKS = [
+    ('read_history_data_csv', None, lambda data: read_history_data(data['history_csv'])),
+    ('read_history_data_dat', None, lambda data: read_history_data(data['history_dat'])),
+    ('csv_reader', None, lambda data: csv_reader(data['history_csv'])),
+    ('tecplot_reader', None, lambda data: tecplot_reader(data['history_dat'])),
+    ('get_mesh_data', _clear_mesh_cache, lambda data: get_mesh_data(data['mesh'])),
+    ('read_mesh', None, lambda data: read_mesh(data['mesh'])),
+    ('get_final_vals', None, lambda data: [get_final_vals(f) for f in _case_files(data, 'history.csv')]),
+    ('get_final_vals_many', None, lambda data: get_final_vals_many(_case_files(data, 'history.csv'))),
+    ('get_force_data', None, lambda data: [get_force_data(f) for f in _case_files(data, 'forces_breakdown.dat')]),
+    ('read_forces_breakdown_many', None, lambda data: read_forces_breakdown_many(data['cases'])),
+    ('read_restart', None, _read_restart),
+    ('read_vtu', None, lambda data: read_vtu(data['vtu'])),
+    ('PVWrapper_native_along_axis', None,
+     lambda data: PVWrapper(data['vtu'], backend='native').extract_variables_along_axis(data['probe'], 'y')),
+    ('organize_airfoil_data', None, lambda data: organize_airfoil_data(*data['airfoil'])),
+    ('calculate_uplus_yplus', None, lambda data: calculate_uplus_yplus(*data['profile'])),
+]
+
+def drop_page_cache(folder):
+    """Drops the files in folder from the page cache. Returns False if this is not supported."""
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    for root, folders, files in os.walk(folder):
+        for name in files:
+            fd = os.open(os.path.join(root, name), os.O_RDONLY)
+            try:
+                os.fsync(fd)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+    return True
+
+def time_benchmark(setup, func, data, repeat, cold=False):
+    """Returns the run times in seconds of repeat runs of func"""
+    times = []
+    for i in range(repeat):
+        if setup is not None:
+            setup(data)
+        if cold:
+            drop_page_cache(data['folder'])
+        start = time.perf_counter()
+        func(data)
+        times.append(time.perf_counter() - start)
+    return times
+
+def peak_memory(setup, func, data):
+    """Returns the peak memory in bytes allocated by one run of func"""
+    if setup is not None:
+        setup(data)
+    tracemalloc.start()
+    try:
+        func(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run(scales, repeat=5, names=None, data_folder=None, verbose=True):
+    """Runs the benchmarks for every scale
+
+    Keyword arguments:
+    scales -- list of scales, see synthetic_data.generate
+    repeat -- number of timed runs of every benchmark, with warm and with cold cache (default 5)
+    names -- list of benchmark names to run, None runs all (default None)
+    data_folder -- folder the synthetic data is written to and kept in. None uses a
+                   temporary folder that is removed afterwards (default None)
+    verbose -- print a table of the results (default True)
+
+    Return value:
+    results -- dictionary with the machine information and one entry per benchmark and scale
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    cold_supported = hasattr(os, 'posix_fadvise')
+    results = {'machine' : {'python' : platform.python_version(), 'numpy' : np.__version__,
+                            'platform' : platform.platform(), 'processor' : platform.processor(),
+                            'cpu_count' : os.cpu_count(), 'cold_cache' : cold_supported},
+               'date' : datetime.datetime.now().isoformat(timespec='seconds'),
+               'repeat' : repeat,
+               'benchmarks' : []}
+
+    root = data_folder or tempfile.mkdtemp(prefix='io_su2_bench_')
+    try:
+        if verbose:
+            print('{:<30} {:>7} {:>12} {:>12} {:>12}'.format('benchmark', 'scale', 'warm (ms)', 'cold (ms)', 'peak (MB)'))
+        for scale in scales:
+            data = generate(os.path.join(root, 'scale_' + str(scale)), scale)
+            for name, setup, func in BENCHMARKS:
+                if names and name not in names:
+                    continue
+                # the first run warms the page cache and the imports
+                time_benchmark(setup, func, data, 1)
+                warm = time_benchmark(setup, func, data, repeat)
+                cold = time_benchmark(setup, func, data, repeat, cold=True) if cold_supported else []
+                entry = {'name' : name, 'scale' : scale,
+                         'warm_min' : min(warm), 'warm_median' : float(np.median(warm)),
+                         'cold_min' : min(cold) if cold else None,
+                         'cold_median' : float(np.median(cold)) if cold else None,
+                         'peak_bytes' : peak_memory(setup, func, data)}
+                results['benchmarks'].append(entry)
+                if verbose:
+                    print('{:<30} {:>7} {:>12.3f} {:>12} {:>12.2f}'.format(name, scale, 1e3*entry['warm_median'],
+                          '-' if not cold else '{:.3f}'.format(1e3*entry['cold_median']), entry['peak_bytes']/2**20))
+    finally:
+        if data_folder is None:
+            shutil.rmtree(root, ignore_errors=True)
+    return results
+
+def compare(results, baseline, threshold=0.2, min_time=1e-3, verbose=True):
+    """Compares results against a baseline and returns the benchmarks that got slower
+
+    A benchmark is flagged if its median time, warm or cold, is more than threshold
+    (relative) and more than min_time seconds slower than in the baseline, or if
+    its peak memory grew by more than threshold.
+
+    Keyword arguments:
+    results -- dictionary from run
+    baseline -- dictionary from run, e.g. loaded from a saved results file
+    threshold -- relative slowdown that is flagged (default 0.2)
+    min_time -- smallest absolute slowdown in seconds that is flagged, to ignore noise
+                in very short benchmarks (default 1e-3)
+    verbose -- print a table of the comparison (default True)
+
+    Return value:
+    regressions -- list of (name, scale, metric, baseline value, new value) tuples
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    reference = dict(((entry['name'], entry['scale']), entry) for entry in baseline['benchmarks'])
+    regressions = []
+    if verbose:
+        print('{:<30} {:>7} {:>12} {:>12} {:>12}'.format('benchmark', 'scale', 'metric', 'ratio', ''))
+    for entry in results['benchmarks']:
+        old = reference.get((entry['name'], entry['scale']))
+        if old is None:
+            continue
+        for metric in ['warm_median', 'cold_median', 'peak_bytes']:
+            if entry.get(metric) is None or old.get(metric) is None or not old[metric]:
+                continue
+            ratio = entry[metric]/old[metric]
+            slower = ratio > 1 + threshold
+            if metric != 'peak_bytes':
+                slower = slower and entry[metric] - old[metric] > min_time
+            if slower:
+                regressions.append((entry['name'], entry['scale'], metric, old[metric], entry[metric]))
+            if verbose:
+                print('{:<30} {:>7} {:>12} {:>12.2f} {:>12}'.format(entry['name'], entry['scale'], metric, ratio,
+                                                                    'SLOWER' if slower else ''))
+    return regressions
+
+def main():
+    parser = OptionParser(usage='usage: %prog [options]')
+    parser.add_option("-s", "--scales", dest="scales", default="1,10,100",
+                      help="comma separated list of scales relative to the flat plate example")
+    parser.add_option("-r", "--repeat", dest="repeat", type="int", default=5,
+                      help="number of timed runs of every benchmark")
+    parser.add_option("-b", "--benchmarks", dest="benchmarks", default="",
+                      help="comma separated list of benchmarks to run, all by default")
+    parser.add_option("-o", "--output", dest="output", default="benchmark_results.json",
+                      help="json file the results are written to")
+    parser.add_option("-c", "--compare", dest="baseline", default="",
+                      help="json file with baseline results to compare against")
+    parser.add_option("-t", "--threshold", dest="threshold", type="float", default=0.2,
+                      help="relative slowdown against the baseline that is flagged")
+    parser.add_option("-d", "--data", dest="data_folder", default=None,
+                      help="keep the synthetic data in this folder")
+    parser.add_option("-l", "--list", dest="list", action="store_true", default=False,
+                      help="list the benchmarks and exit")
+    (options, args) = parser.parse_args()
+
+    if options.list:
+        for name, setup, func in BENCHMARKS:
+            print(name)
+        return 0
+
+    scales = [float(s) if '.' in s else int(s) for s in options.scales.split(',')]
+    names = [name for name in options.benchmarks.split(',') if name]
+    results = run(scales, options.repeat, names, options.data_folder)
+
+    with open(options.output, 'w') as fp:
+        json.dump(results, fp, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as fp:
+            baseline = json.load(fp)
+        regressions = compare(results, baseline, options.threshold)
+        if regressions:
+            print(str(len(regressions)) + ' benchmarks are slower than the baseline')
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+
+"""Writers for synthetic SU2 files used by the benchmarks.
+
+The files follow the layout SU2 writes, and their sizes are given as a scale factor
+relative to the flat plate example in examples/flatplate:
+scale 1 -- a 5000 row history (about L1), the 137x97 L3 mesh, restart and volume
+           solution, 10 cases with a forces breakdown and history each, and a
+           200 point airfoil
+scale 100 -- 100 times the rows, points and cases of scale 1
+
+Usage: python synthetic_data.py [scale] [folder]
+
+Author: Jayant Mukhopadhaya
+Last updated: 10/18/2026"""
+
+from io_su2.restart import write_restart
+import numpy as np
+import math
+import os
+import sys
+
+# sizes at scale 1
+HISTORY_ROWS = 5000
+MESH_SIZE = (137, 97)
+NCASES = 10
+CASE_HISTORY_ROWS = 1000
+AIRFOIL_POINTS = 200
+
+HISTORY_VARIABLES = ['Time_Iter', 'Outer_Iter', 'Inner_Iter', 'rms[Rho]', 'rms[RhoU]', 'rms[RhoV]',
+                     'rms[RhoE]', 'rms[nu]', 'Min DT', 'Max DT', 'Min CFL', 'Max CFL', 'Avg CFL',
+                     'CD', 'CL', 'CSF', 'CMx', 'CMy', 'CMz', 'CFx', 'CFy', 'CFz']
+
+RESTART_VARIABLES = ['x', 'y', 'Density', 'Momentum_x', 'Momentum_y', 'Energy', 'Nu_Tilde',
+                     'Pressure', 'Temperature', 'Mach', 'Pressure_Coefficient', 'Laminar_Viscosity',
+                     'Skin_Friction_Coefficient_x', 'Skin_Friction_Coefficient_y', 'Heat_Flux', 'Y_Plus',
+                     'Eddy_Viscosity']
+
+def history_values(n_rows, seed=0):
+    """Array of shape (n_rows, 22) with converging residuals and coefficients"""
+    rng = np.random.default_rng(seed)
+    it = np.arange(n_rows, dtype=float)
+    values = np.empty((n_rows, len(HISTORY_VARIABLES)))
+    values[:, 0] = 0
+    values[:, 1] = 0
+    values[:, 2] = it
+    decay = -8.0*it/max(n_rows - 1, 1)
+    for i in range(3, 8):
+        values[:, i] = -3.0 - i*0.1 + decay + 0.05*rng.standard_normal(n_rows)
+    values[:, 8:10] = [4.2e-07, 0.029]
+    values[:, 10:13] = 12.0
+    converge = np.exp(-10.0*it/max(n_rows, 1))
+    values[:, 13] = 0.00286 + 0.8*converge
+    values[:, 14] = -0.00075 - 0.4*converge
+    values[:, 15:18] = 0.0
+    values[:, 18] = -0.00027*(1 - converge) - 0.4*converge
+    values[:, 19] = values[:, 13]
+    values[:, 20] = values[:, 14]
+    values[:, 21] = 0.0
+    return values
+
+def write_history(filename, n_rows, seed=0):
+    """Writes a SU2 history file. The format follows the extension: .csv or tecplot .dat"""
+    values = history_values(n_rows, seed)
+    header = ','.join('"' + var + '"' for var in HISTORY_VARIABLES)
+    fmt = ['%12d']*3 + ['%18.10g']*(len(HISTORY_VARIABLES) - 3)
+    with open(filename, 'w') as f:
+        if filename.endswith('.dat'):
+            f.write('VARIABLES = \\\n' + header + '\n')
+            np.savetxt(f, values, fmt=fmt, delimiter=',')
+        else:
+            f.write(header + '\n')
+            np.savetxt(f, values, fmt=fmt, delimiter=',')
+
+def structured_points(nx, ny):
+    """Points of a flat plate like mesh, clustered towards the wall and the leading edge"""
+    x = -0.33333 + 2.33333*(1 - np.cos(np.linspace(0, math.pi/2, nx)))
+    y = (np.expm1(3.0*np.linspace(0, 1, ny))/math.expm1(3.0))
+    X, Y = np.meshgrid(x, y)
+    return np.column_stack([X.ravel(), Y.ravel()])
+
+def structured_quads(nx, ny):
+    """Point indices of the quadrilaterals of an nx by ny structured mesh"""
+    i, j = np.meshgrid(np.arange(nx - 1), np.arange(ny - 1))
+    first = (j*nx + i).ravel()
+    return np.column_stack([first, first + 1, first + nx + 1, first + nx])
+
+def write_mesh(filename, nx, ny):
+    """Writes a 2D SU2 mesh of nx by ny points with the flat plate markers"""
+    points = structured_points(nx, ny)
+    quads = structured_quads(nx, ny)
+    n = np.arange(nx*ny).reshape(ny, nx)
+    markers = [('farfield', n[-1, ::-1]), ('inlet', n[::-1, 0]), ('outlet', n[:, -1]),
+               ('symmetry', n[0, :nx//4]), ('wall', n[0, nx//4 - 1:])]
+
+    with open(filename, 'w') as f:
+        f.write('%\n% Problem dimension\n%\nNDIME= 2\n%\n% Inner element connectivity\n%\n')
+        f.write('NELEM= ' + str(len(quads)) + '\n')
+        np.savetxt(f, np.column_stack([np.full(len(quads), 9), quads, np.arange(len(quads))]), fmt='%d', delimiter='   ')
+        f.write('%\n% Node coordinates\n%\nNPOIN= ' + str(len(points)) + '\n')
+        np.savetxt(f, np.column_stack([points, np.arange(len(points))]), fmt=['%.16f', '%.16f', '%d'], delimiter='   ')
+        f.write('%\n% Boundary elements\n%\nNMARK= ' + str(len(markers)) + '\n')
+        for name, line in markers:
+            f.write('MARKER_TAG= ' + name + '\nMARKER_ELEMS= ' + str(len(line) - 1) + '\n')
+            np.savetxt(f, np.column_stack([np.full(len(line) - 1, 3), line[:-1], line[1:]]), fmt='%d', delimiter='   ')
+
+def solution_values(points, seed=0):
+    """Array with a value for every field of RESTART_VARIABLES at the points"""
+    rng = np.random.default_rng(seed)
+    solution = np.empty((len(points), len(RESTART_VARIABLES)))
+    solution[:, :2] = points
+    profile = np.tanh(points[:, 1]*50.0)
+    solution[:, 2] = 1.0 + 0.01*rng.standard_normal(len(points))
+    solution[:, 3] = 0.2366*profile
+    solution[:, 4] = 1e-4*profile
+    solution[:, 5:] = 1.0 + 0.1*rng.random((len(points), len(RESTART_VARIABLES) - 5))
+    return solution
+
+def write_vtu(filename, points, quads, point_data):
+    """Writes a VTK XML unstructured grid with raw appended Float32 data, like SU2"""
+    arrays = [('Float32', '', 3, np.column_stack([points, np.zeros(len(points))]).astype('<f4')),
+              ('Int32', 'connectivity', 1, quads.astype('<i4')),
+              ('Int32', 'offsets', 1, (4*np.arange(1, len(quads) + 1)).astype('<i4')),
+              ('UInt8', 'types', 1, np.full(len(quads), 9, dtype='u1'))]
+    arrays += [('Float32', name, 1, np.asarray(values, dtype='<f4')) for name, values in point_data.items()]
+
+    tags = []
+    offset = 0
+    for vtk_type, name, ncomp, values in arrays:
+        tags.append('<DataArray type="' + vtk_type + '" Name="' + name + '" NumberOfComponents= "' + str(ncomp) +
+                    '" offset="' + str(offset) + '" format="appended"/>\n')
+        offset += 8 + values.nbytes
+
+    with open(filename, 'wb') as f:
+        f.write(('<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64">\n'
+                 '<UnstructuredGrid>\n<Piece NumberOfPoints="' + str(len(points)) + '" NumberOfCells="' +
+                 str(len(quads)) + '">\n<Points>\n' + tags[0] + '</Points>\n<Cells>\n' + ''.join(tags[1:4]) +
+                 '</Cells>\n<PointData>\n' + ''.join(tags[4:]) + '</PointData>\n</Piece>\n</UnstructuredGrid>\n'
+                 '<AppendedData encoding="raw">\n _').encode('utf-8'))
+        for vtk_type, name, ncomp, values in arrays:
+            f.write(np.array([values.nbytes], dtype='<u8').tobytes())
+            f.write(np.ascontiguousarray(values).tobytes())
+        f.write(b'\n</AppendedData>\n</VTKFile>\n')
+
+def write_forces_breakdown(filename, n_markers=1, seed=0):
+    """Writes a SU2 forces breakdown file with n_markers wall markers"""
+    rng = np.random.default_rng(seed)
+    names = ['CL', 'CD', 'CL/CD', 'CMz', 'CFx', 'CFy']
+
+    def rows(label_width, percent):
+        lines = []
+        for name in names:
+            p, v = rng.normal(scale=1e-3, size=2)
+            label = 'Total ' + name.ljust(label_width)
+            if percent:
+                label += '(  100%)'
+            lines.append(label + ': %11.6f | Pressure (   99%%): %11.6f | Friction (    0%%): %11.6f | '
+                         'Momentum (    0%%): %11.6f\n' % (p + v, p, v, 0.0))
+        return ''.join(lines)
+
+    with open(filename, 'w') as f:
+        f.write('Problem definition:\n\nCompressible RANS equations.\nTurbulence model: Spalart Allmaras\n'
+                'Mach number: 0.2.\nAngle of attack (AoA): 0 deg, and angle of sideslip (AoS): 0 deg.\n'
+                'Reynolds number: 5e+06.\nThe reference area is 2 m^2.\nThe reference length is 1 m.\n\n\n'
+                'Forces breakdown:\n\nCenter of Pressure: X=-3.831980Y+0.358417 m.\n\n'
+                'NOTE: Multiply forces by the non-dimensional factor: 0.056000, and the reference factor: '
+                '114454.649260\nto obtain the dimensional force.\n\n')
+        f.write(rows(0, False))
+        for i in range(n_markers):
+            f.write('\n\nSurface name: wall' + str(i) + '\n\n')
+            f.write(rows(6, True))
+
+def airfoil_points(n_points, thickness=0.12):
+    """x and z coordinates of a NACA 00xx airfoil, ordered like a SU2 surface slice"""
+    n_side = n_points//2 + 1
+    x = 0.5*(1 - np.cos(np.linspace(0, math.pi, n_side)))
+    z = 5*thickness*(0.2969*np.sqrt(x) - 0.1260*x - 0.3516*x**2 + 0.2843*x**3 - 0.1036*x**4)
+    # upper surface from the trailing edge, lower surface back to the trailing edge
+    xs = np.concatenate([x[::-1], x[1:-1]])
+    zs = np.concatenate([z[::-1], -z[1:-1]])
+    return xs, zs
+
+def wall_profile(n_points, seed=0):
+    """y, density, velocity and viscosity of a boundary layer profile in random order"""
+    rng = np.random.default_rng(seed)
+    y = np.expm1(np.linspace(0, 8, n_points))*1e-6
+    u = 0.2366*np.tanh(y*2000.0)
+    rho = np.ones(n_points)
+    mu = np.full(n_points, 4.73e-8)
+    order = rng.permutation(n_points)
+    return y[order], rho[order], u[order], mu[order]
+
+def generate(folder, scale=1):
+    """Writes all synthetic files for the given scale into folder
+
+    Keyword arguments:
+    folder -- folder the files are written to, created if needed
+    scale -- size relative to the flat plate example (default 1)
+
+    Return value:
+    data -- dictionary with the file names and in-memory inputs of the benchmarks
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    factor = math.sqrt(scale)
+    nx = max(int(round(MESH_SIZE[0]*factor)), 3)
+    ny = max(int(round(MESH_SIZE[1]*factor)), 3)
+
+    data = {'folder' : folder, 'scale' : scale,
+            'history_csv' : os.path.join(folder, 'history.csv'),
+            'history_dat' : os.path.join(folder, 'history.dat'),
+            'mesh' : os.path.join(folder, 'mesh.su2'),
+            'restart' : os.path.join(folder, 'restart.dat'),
+            'vtu' : os.path.join(folder, 'vol_solution.vtu'),
+            'cases' : []}
+
+    n_rows = int(HISTORY_ROWS*scale)
+    write_history(data['history_csv'], n_rows)
+    write_history(data['history_dat'], n_rows)
+    write_mesh(data['mesh'], nx, ny)
+
+    points = structured_points(nx, ny)
+    solution = solution_values(points)
+    write_restart(data['restart'], RESTART_VARIABLES, solution)
+    write_vtu(data['vtu'], points, structured_quads(nx, ny),
+              dict((var, solution[:, i]) for i, var in enumerate(RESTART_VARIABLES[2:], 2)))
+
+    for i in range(int(NCASES*scale)):
+        case = os.path.join(folder, 'cases', 'case' + str(i))
+        if not os.path.isdir(case):
+            os.makedirs(case)
+        write_history(os.path.join(case, 'history.csv'), CASE_HISTORY_ROWS, seed=i)
+        write_forces_breakdown(os.path.join(case, 'forces_breakdown.dat'), seed=i)
+        data['cases'].append(case)
+
+    data['airfoil'] = airfoil_points(int(AIRFOIL_POINTS*scale))
+    data['profile'] = wall_profile(ny*10)
+    data['probe'] = (float(points[nx//2, 0]), 0.0)
+    return data
+
+if __name__ == "__main__":
+    scale = float(sys.argv[1]) if len(sys.argv) > 1 else 1
+    folder = sys.argv[2] if len(sys.argv) > 2 else 'synthetic_data'
+    generate(folder, scale)
@@ -11,12 +11,28 @@ import os, sys, shutil, copy, os.path
 sys.path.append(os.environ['SU2_RUN'])
 import SU2
 from SU2.io import redirect_folder, redirect_output
+from io_su2.file_read_util import mesh_metadata
+from vandv_tools.scheduler import Case, run_cases
+from vandv_tools.prolongation import prolongate_level
+from vandv_tools.monitor import ConvergenceMonitor
 
 def main():
 # Command Line Options
     parser = OptionParser()
     parser.add_option("-f", "--file", dest="filename",
                       help="read config from FILE", metavar="FILE")
+    parser.add_option("-c", "--cores", dest="cores", type="int", default=0,
+                      help="run cases concurrently using at most CORES cores in total", metavar="CORES")
+    parser.add_option("-o", "--order", dest="order", default="largest",
+                      help="order in which concurrent cases are started: largest (NUMBER_PART) or cost (NPOIN)")
+    parser.add_option("-s", "--solver-command", dest="solver_command", default="",
+                      help="command used to run concurrent cases, {cores} is replaced by NUMBER_PART")
+    parser.add_option("-p", "--prolongate", dest="prolongate", action="store_true", default=False,
+                      help="start each mesh level from the interpolated solution of the next coarser level")
+    parser.add_option("-m", "--monitor", dest="monitor", action="store_true", default=False,
+                      help="follow the history of concurrent cases and flag them as converged, stalled or diverged")
+    parser.add_option("--stop-on", dest="stop_on", default="diverged",
+                      help="comma separated statuses for which a monitored case is stopped early, e.g. converged,stalled,diverged")
 
     (options, args)=parser.parse_args()
 
@@ -40,6 +56,32 @@ def main():
     grads = {'gg' : 'GREEN_GAUSS'}
     recon_grads = ['']
     diverged_cases = []
+    scheduled_cases = []
+    chained_cases = {}
+
+    # Command used in scheduler mode, the same one SU2.run.CFD uses
+    solver_command = options.solver_command
+    if not solver_command:
+        mpi_command = os.environ.get('SU2_MPI_COMMAND', 'mpirun -n %i %s')
+        solver = os.path.join(os.environ['SU2_RUN'], 'SU2_CFD') + ' config_CFD.cfg'
+        solver_command = mpi_command.replace('%i', '{cores}').replace('%s', solver)
+    # Convergence monitoring of the concurrent cases, using the Cauchy settings of the config
+    monitor_options = {}
+    if options.monitor:
+        if not options.cores:
+            print('--monitor is only used when cases are run concurrently with --cores')
+        tecplot = 'TECPLOT' in config.get('TABULAR_FORMAT', 'CSV').upper()
+        history_name = os.path.splitext(config.get('CONV_FILENAME', 'history'))[0] + ('.dat' if tecplot else '.csv')
+        residual_min = config.get('CONV_RESIDUAL_MINVAL', None)
+        def case_monitor(case):
+            return ConvergenceMonitor(os.path.join(case.run_folder, history_name),
+                                      window = int(config.get('CONV_CAUCHY_ELEMS', 100)),
+                                      cauchy_eps = float(config.get('CONV_CAUCHY_EPS', 1e-6)),
+                                      residual_min = None if residual_min is None else float(residual_min),
+                                      start_iter = int(config.get('CONV_STARTITER', 0)))
+        monitor_options = {'monitor' : case_monitor,
+                           'stop_on' : [status.strip() for status in options.stop_on.split(',') if status.strip()]}
+
     num_cores = {'L5': 1, 'L4' : 1, 'L3' : 4, 'L2' : 18, 'L1' : 18}
 
     for model in models:
@@ -52,6 +94,7 @@ def main():
                 else:
                     recon = '2nd_order'
                     print('\t\tUsing second order reconstructions')
+                coarse_folder = None
                 for level in mesh_folders:
                     curr_mesh = ''
                     for mesh in mesh_files:
@@ -78,6 +121,24 @@ def main():
                     link = []
                     link.append(ztate.FILES['MESH'])
 
+                    # the coarser level of the same family, used with --prolongate
+                    previous_folder = coarse_folder
+                    coarse_folder = run_folder
+
+                    # scheduler mode: set up the run folder now and run it concurrently later
+                    if options.cores:
+                        with redirect_folder(run_folder,[],link, force=False) as push:
+                            konfig.dump('config_CFD.cfg')
+                        case = Case(run_folder, run_folder, solver_command,
+                                    cores = num_cores[level],
+                                    cost = mesh_metadata(curr_mesh).get('NPOIN', 0))
+                        scheduled_cases.append(case)
+                        chained_cases[case.name] = (level, konfig, previous_folder, curr_mesh)
+                        continue
+
+                    if options.prolongate and previous_folder and previous_folder not in diverged_cases:
+                        prolongate_level(konfig, previous_folder, run_folder, curr_mesh)
+
                     with redirect_folder(run_folder,[],link, force=False) as push:
                         with redirect_output('log.out'):
                             try:
@@ -92,5 +153,25 @@ def main():
                     print("Following cases diverged: ")
                     print(diverged_cases)
 
+    # Run the scheduled cases, packing them into the core budget
+    if options.cores and options.prolongate:
+        # one level after the other, coarse to fine, so that each level can start from the coarser one
+        for level in mesh_folders:
+            level_cases = [case for case in scheduled_cases if chained_cases[case.name][0] == level]
+            for case in level_cases:
+                level, konfig, previous_folder, curr_mesh = chained_cases[case.name]
+                if previous_folder and previous_folder not in diverged_cases:
+                    if prolongate_level(konfig, previous_folder, case.run_folder, curr_mesh):
+                        konfig.dump(os.path.join(case.run_folder, 'config_CFD.cfg'))
+            print('Running ' + str(len(level_cases)) + ' ' + level + ' cases using ' + str(options.cores) + ' cores')
+            diverged_cases += run_cases(level_cases, options.cores, options.order, **monitor_options)
+        print("Following cases diverged: ")
+        print(diverged_cases)
+    elif options.cores:
+        print('Running ' + str(len(scheduled_cases)) + ' cases using ' + str(options.cores) + ' cores')
+        diverged_cases += run_cases(scheduled_cases, options.cores, options.order, **monitor_options)
+        print("Following cases diverged: ")
+        print(diverged_cases)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,358 @@
+import numpy as np
+from io_su2.file_read_util import read_mesh, geo_locations, read_constraints, organize_airfoil_data_batch
+from io_su2.vtu_reader import read_vtu
+
+# index of the spanwise axis, and of the chordwise and thickness axes in the section plane
+_AXES = {'x' : (0, 1, 2), 'y' : (1, 0, 2), 'z' : (2, 0, 1)}
+
+def surface_edges(offsets, connectivity):
+    """Unique edges of surface polygons given in CSR form.
+
+    Keyword arguments:
+    offsets -- array of size ncells+1, the points of cell i are connectivity[offsets[i]:offsets[i+1]]
+    connectivity -- flat array with the point indices of all cells
+
+    Return value:
+    edges -- numpy array of shape (nedges, 2) with the point indices of every edge, smaller index first
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    connectivity = np.asarray(connectivity, dtype=np.int64)
+    following = np.arange(1, connectivity.size + 1)
+    # the last point of every cell connects back to the first one
+    following[offsets[1:] - 1] = offsets[:-1]
+    a = connectivity
+    b = connectivity[following]
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    npoin = int(connectivity.max()) + 1 if connectivity.size else 0
+    keys = np.unique(lo*npoin + hi)
+    return np.column_stack([keys//npoin, keys % npoin]) if npoin else np.empty((0, 2), dtype=np.int64)
+
+def slice_surface(points, edges, stations, axis = 'y'):
+    """Cuts a surface at planes of constant coordinate, all stations at once.
+
+    Every edge is intersected with all stations between its two points, so the
+    sections are found with a few array operations over the edges.
+
+    Keyword arguments:
+    points -- numpy array of shape (npoin, 3) with the point coordinates
+    edges -- numpy array of shape (nedges, 2), see surface_edges
+    stations -- values of the axis coordinate at which the surface is cut
+    axis -- spanwise axis, normal to the planes (default 'y')
+
+    Return value:
+    chord -- flat numpy array with the chordwise coordinate of the points of all sections
+    thickness -- flat numpy array with the coordinate in the thickness direction
+    offsets -- array of size nstations+1, the points of station i are chord[offsets[i]:offsets[i+1]]
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    span, c1, c2 = _AXES[axis]
+    points = np.asarray(points, dtype=float)
+    stations = np.asarray(stations, dtype=float).ravel()
+    order = np.argsort(stations, kind='stable')
+    sorted_stations = stations[order]
+
+    ya = points[edges[:, 0], span]
+    yb = points[edges[:, 1], span]
+    lo = np.minimum(ya, yb)
+    hi = np.maximum(ya, yb)
+    # stations in [lo, hi), so a point on a plane is only taken from the edges above it
+    first = np.searchsorted(sorted_stations, lo, side='left')
+    count = np.where(hi > lo, np.searchsorted(sorted_stations, hi, side='left') - first, 0)
+
+    edge = np.repeat(np.arange(edges.shape[0]), count)
+    start = np.zeros(count.size + 1, dtype=np.int64)
+    np.cumsum(count, out=start[1:])
+    station = np.repeat(first, count) + np.arange(edge.size) - np.repeat(start[:-1], count)
+
+    pa = points[edges[edge, 0]]
+    pb = points[edges[edge, 1]]
+    t = (sorted_stations[station] - pa[:, span])/(pb[:, span] - pa[:, span])
+    x = pa[:, c1] + t*(pb[:, c1] - pa[:, c1])
+    z = pa[:, c2] + t*(pb[:, c2] - pa[:, c2])
+
+    # back to the order of the stations given, and without the duplicated points on a plane
+    station = order[station]
+    keep = np.lexsort((z, x, station))
+    station, x, z = station[keep], x[keep], z[keep]
+    unique = np.ones(station.size, dtype=bool)
+    unique[1:] = (station[1:] != station[:-1]) | (x[1:] != x[:-1]) | (z[1:] != z[:-1])
+    station, x, z = station[unique], x[unique], z[unique]
+
+    offsets = np.zeros(stations.size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(station, minlength=stations.size), out=offsets[1:])
+    return x, z, offsets
+
+def _surface_with_ends(surface, surface_offsets, le, te):
+    """Adds the leading and trailing edge points to every section of one surface and
+    returns the section index and the points, sorted by section and chordwise coordinate"""
+    nsec = le.shape[0]
+    counts = np.diff(surface_offsets)
+    section = np.concatenate([np.repeat(np.arange(nsec), counts), np.arange(nsec), np.arange(nsec)])
+    x = np.concatenate([surface['x'], le[:, 0], te[:, 0]])
+    z = np.concatenate([surface['z'], le[:, 1], te[:, 1]])
+    order = np.lexsort((x, section))
+    return section[order], x[order], z[order]
+
+def _leading_edge_radius(data, valid, le_points):
+    """Radius of the circle fitted through the leading edge point and le_points points
+    on each surface, with the algebraic (Kasa) least squares fit. All sections are
+    solved together as a batch of 3x3 systems."""
+    upper, lower = data['UPPER_ALL'], data['LOWER_ALL']
+    uo, lo = data['UPPER_OFFSETS'], data['LOWER_OFFSETS']
+    nsec = uo.size - 1
+    radius = np.full(nsec, np.nan)
+    if not np.any(valid):
+        return radius
+
+    # the leading edge is the first point of the upper surface
+    k = np.arange(le_points + 1)
+    iu = np.minimum(uo[:-1, None] + k, np.maximum(uo[1:, None] - 1, 0))
+    il = np.minimum(lo[:-1, None] + k[:-1], np.maximum(lo[1:, None] - 1, 0))
+    x = np.concatenate([upper['x'][iu[valid]], lower['x'][il[valid]]], axis=1)
+    z = np.concatenate([upper['z'][iu[valid]], lower['z'][il[valid]]], axis=1)
+
+    # shift to the leading edge for a better conditioned fit
+    x = x - x[:, :1]
+    z = z - z[:, :1]
+    A = np.stack([x, z, np.ones_like(x)], axis=2)
+    b = -(x**2 + z**2)
+    AtA = np.einsum('nki,nkj->nij', A, A)
+    Atb = np.einsum('nki,nk->ni', A, b)
+    with np.errstate(invalid='ignore'):
+        solvable = np.abs(np.linalg.det(AtA)) > 0
+        coeff = np.full(Atb.shape, np.nan)
+        coeff[solvable] = np.linalg.solve(AtA[solvable], Atb[solvable][..., None])[..., 0]
+        radius[valid] = np.sqrt(coeff[:, 0]**2/4 + coeff[:, 1]**2/4 - coeff[:, 2])
+    return radius
+
+def section_geometry(chord, thickness, offsets, n_dist = 101, le_points = 2):
+    """Geometry metrics of many airfoil sections, vectorized over all sections
+
+    Every section is split into upper and lower surfaces with organize_airfoil_data_batch.
+    The surfaces are interpolated to the same x/c stations of all sections with a single
+    call of numpy.interp, by shifting section i to the interval [2i, 2i+1].
+
+    Keyword arguments:
+    chord -- flat numpy array with the chordwise coordinate of the points of all sections
+    thickness -- flat numpy array with the coordinate in the thickness direction
+    offsets -- array of size nsections+1, the points of section i are chord[offsets[i]:offsets[i+1]]
+    n_dist -- number of x/c stations of the thickness and camber distributions, with
+              cosine spacing (default 101)
+    le_points -- number of points on each surface used with the leading edge point for
+                 the leading edge radius (default 2)
+
+    Return value:
+    table -- Dictionary with one entry per section in every column, organized as:
+    table = {   'NPOINTS' : number of points of the section,
+                'LE_X', 'LE_Z' : coordinates of the leading edge (smallest chordwise coordinate),
+                'TE_X', 'TE_Z' : coordinates of the trailing edge (largest chordwise coordinate),
+                'CHORD' : chord length,
+                'MAX_THICKNESS' : maximum thickness, normal to the chordwise axis,
+                'MAX_THICKNESS_LOCATION' : x/c of the maximum thickness,
+                'THICKNESS_RATIO' : maximum thickness divided by the chord,
+                'MAX_CAMBER' : largest distance of the camber line from the chord line, signed,
+                'MAX_CAMBER_LOCATION' : x/c of the maximum camber,
+                'AREA' : area enclosed by the section,
+                'LE_RADIUS' : leading edge radius,
+                'X_C' : numpy array of size n_dist with the x/c stations of the distributions,
+                'THICKNESS' : numpy array of shape (nsections, n_dist), thickness distribution,
+                'CAMBER' : numpy array of shape (nsections, n_dist), camber line relative to the chord line}
+    Sections with no points on the upper or lower surface get NaN.
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+    nsec = offsets.size - 1
+    data = organize_airfoil_data_batch(np.asarray(chord, dtype=float), np.asarray(thickness, dtype=float), offsets)
+    upper, lower = data['UPPER_ALL'], data['LOWER_ALL']
+    uo, lo = data['UPPER_OFFSETS'], data['LOWER_OFFSETS']
+    valid = (np.diff(uo) > 0) & (np.diff(lo) > 0)
+
+    # the leading edge is the first upper point, the trailing edge the last point of either surface
+    le = np.full((nsec, 2), np.nan)
+    te = np.full((nsec, 2), np.nan)
+    le[valid, 0] = upper['x'][uo[:-1][valid]]
+    le[valid, 1] = upper['z'][uo[:-1][valid]]
+    last_upper = np.stack([upper['x'][uo[1:][valid] - 1], upper['z'][uo[1:][valid] - 1]], axis=1)
+    last_lower = np.stack([lower['x'][lo[1:][valid] - 1], lower['z'][lo[1:][valid] - 1]], axis=1)
+    te[valid] = np.where((last_lower[:, 0] > last_upper[:, 0])[:, None], last_lower, last_upper)
+    chord_length = te[:, 0] - le[:, 0]
+
+    x_c = 0.5*(1 - np.cos(np.linspace(0, np.pi, n_dist)))
+    query = (2*np.arange(nsec)[:, None] + x_c[None, :]).ravel()
+    surfaces = []
+    area = np.zeros(nsec)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for sign, surface, surface_offsets in [(1, upper, uo), (-1, lower, lo)]:
+            section, x, z = _surface_with_ends(surface, surface_offsets, le, te)
+            ok = valid[section]
+            section, x, z = section[ok], x[ok], z[ok]
+            keys = 2*section + (x - le[section, 0])/chord_length[section]
+            surfaces.append(np.interp(query, keys, z).reshape(nsec, n_dist) if keys.size else
+                            np.full((nsec, n_dist), np.nan))
+
+            # trapezoidal integral of the surface, segments between sections are left out
+            same = section[1:] == section[:-1]
+            segment = 0.5*(x[1:] - x[:-1])*(z[1:] + z[:-1])
+            area += sign*np.bincount(section[1:][same], weights=segment[same], minlength=nsec)
+
+    z_upper, z_lower = surfaces
+    thickness_dist = z_upper - z_lower
+    chord_line = le[:, 1:2] + (te[:, 1:2] - le[:, 1:2])*x_c[None, :]
+    camber = 0.5*(z_upper + z_lower) - chord_line
+    thickness_dist[~valid] = np.nan
+    camber[~valid] = np.nan
+
+    rows = np.arange(nsec)
+    i_thick = np.argmax(np.where(valid[:, None], thickness_dist, -np.inf), axis=1)
+    i_camber = np.argmax(np.where(valid[:, None], np.abs(camber), -np.inf), axis=1)
+    area[~valid] = np.nan
+
+    table = {'NPOINTS' : np.diff(offsets),
+             'LE_X' : le[:, 0],
+             'LE_Z' : le[:, 1],
+             'TE_X' : te[:, 0],
+             'TE_Z' : te[:, 1],
+             'CHORD' : chord_length,
+             'MAX_THICKNESS' : np.where(valid, thickness_dist[rows, i_thick], np.nan),
+             'MAX_THICKNESS_LOCATION' : np.where(valid, x_c[i_thick], np.nan),
+             'MAX_CAMBER' : np.where(valid, camber[rows, i_camber], np.nan),
+             'MAX_CAMBER_LOCATION' : np.where(valid, x_c[i_camber], np.nan),
+             'AREA' : area,
+             'LE_RADIUS' : _leading_edge_radius(data, valid, le_points),
+             'X_C' : x_c,
+             'THICKNESS' : thickness_dist,
+             'CAMBER' : camber}
+    with np.errstate(invalid='ignore', divide='ignore'):
+        table['THICKNESS_RATIO'] = table['MAX_THICKNESS']/chord_length
+    return table
+
+def read_surface(filename, markers = None):
+    """Reads the surface points and polygons of a .vtu surface solution or a .su2 mesh
+
+    Keyword arguments:
+    filename -- Name of the .vtu file (e.g. surface_flow.vtu) or .su2 mesh file
+    markers -- list of markers that are read from a .su2 mesh. None reads all markers (default None)
+
+    Return value:
+    points -- numpy array of shape (npoin, 3) with the point coordinates
+    offsets -- array of size ncells+1 with the start of every cell in connectivity
+    connectivity -- flat array with the point indices of all cells
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    if filename.endswith('.vtu'):
+        data = read_vtu(filename)
+        offsets = np.concatenate([[0], np.asarray(data['OFFSETS'], dtype=np.int64)])
+        return np.asarray(data['POINTS'], dtype=float), offsets, data['CONNECTIVITY']
+
+    data = read_mesh(filename)
+    assert data['NDIME'] == 3, "Sections can only be cut from 3D meshes"
+    names = list(data['MARKERS'].keys()) if markers is None else markers
+    offsets, connectivity = [np.zeros(1, dtype=np.int64)], []
+    shift = 0
+    for name in names:
+        marker = data['MARKERS'][name]
+        offsets.append(marker['OFFSETS'][1:] + shift)
+        connectivity.append(marker['CONNECTIVITY'])
+        shift += marker['CONNECTIVITY'].size
+    return data['POINTS'], np.concatenate(offsets), np.concatenate(connectivity)
+
+def station_geometry(filename, config = 'config.cfg', axis = 'y', markers = None, n_dist = 101, le_points = 2):
+    """Geometry metrics of the sections at the GEO_LOCATION stations of a config file
+
+    The surface is cut at every station at once (see slice_surface) and the metrics of
+    all sections are computed together (see section_geometry). The location of a
+    station is its value on the spanwise axis if it is given as (x, y, z), otherwise
+    its first value.
+
+    Keyword arguments:
+    filename -- surface solution (.vtu) or mesh (.su2) that is cut
+    config -- SU2 config file with GEO_DESCRIPTION and GEO_LOCATION (default 'config.cfg')
+    axis -- spanwise axis, normal to the section planes (default 'y')
+    markers -- markers used from a .su2 mesh, None uses all markers (default None)
+    n_dist -- number of x/c stations of the thickness and camber distributions (default 101)
+    le_points -- number of points on each surface used for the leading edge radius (default 2)
+
+    Return value:
+    table -- Dictionary of columns, see section_geometry, with the additional columns
+             'NAME' (list with the GEO_DESCRIPTION of every station) and 'LOCATION'
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    geo = geo_locations(config)
+    names = list(geo.keys())
+    span = _AXES[axis][0]
+    location = np.array([loc[span] if loc.size == 3 else loc[0] for loc in geo.values()], dtype=float)
+
+    points, offsets, connectivity = read_surface(filename, markers)
+    chord, thickness, section_offsets = slice_surface(points, surface_edges(offsets, connectivity), location, axis)
+    table = section_geometry(chord, thickness, section_offsets, n_dist, le_points)
+    table['NAME'] = names
+    table['LOCATION'] = location
+    return table
+
+# column of the geometry table that a constraint refers to, found from the constraint name
+_CONSTRAINT_COLUMNS = [('RADIUS', 'LE_RADIUS'), ('AREA', 'AREA'), ('CHORD', 'CHORD'),
+                       ('CAMBER', 'MAX_CAMBER'), ('RATIO', 'THICKNESS_RATIO'), ('THICKNESS', 'MAX_THICKNESS')]
+
+def check_constraints(table, constraints, columns = None):
+    """Checks geometric constraints against a geometry table, for all constraints at once
+
+    A constraint refers to the station with the same name in table['NAME']. The
+    metric is taken from the column given in columns, or else found from the
+    constraint name: RADIUS, AREA, CHORD, CAMBER, RATIO or THICKNESS. Constraints
+    that do not match a station are left out.
+
+    Keyword arguments:
+    table -- Dictionary from station_geometry
+    constraints -- Dictionary from read_constraints, or the name of a config file
+    columns -- Dictionary with the table column of each constraint name (default None)
+
+    Return value:
+    result -- Dictionary of columns with one entry per constraint:
+    result = {  'NAME' : list of constraint names,
+                'VALUE' : value of the metric,
+                'LIMIT' : value of the constraint,
+                'SIGN' : list with '<', '>' or '=',
+                'MARGIN' : distance to the limit, negative if the constraint is violated
+                           (always <= 0 for '='),
+                'SATISFIED' : boolean array}
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    if isinstance(constraints, str):
+        constraints = read_constraints(constraints)
+    columns = columns or {}
+    station = dict((name, i) for i, name in enumerate(table['NAME']))
+
+    names, values, limits, signs = [], [], [], []
+    for name, constraint in constraints.items():
+        if name not in station:
+            continue
+        column = columns.get(name)
+        if column is None:
+            column = next((col for key, col in _CONSTRAINT_COLUMNS if key in name.upper()), 'MAX_THICKNESS')
+        names.append(name)
+        values.append(table[column][station[name]])
+        limits.append(constraint['Value'])
+        signs.append(constraint['Sign'])
+
+    values = np.asarray(values, dtype=float)
+    limits = np.asarray(limits, dtype=float)
+    sign = np.asarray(signs)
+    margin = np.where(sign == '>', values - limits, np.where(sign == '<', limits - values, -np.abs(values - limits)))
+    result = {'NAME' : names,
+              'VALUE' : values,
+              'LIMIT' : limits,
+              'SIGN' : signs,
+              'MARGIN' : margin,
+              'SATISFIED' : np.where(sign == '=', np.isclose(values, limits), margin >= 0)}
+    return result
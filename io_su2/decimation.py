@@ -0,0 +1,121 @@
+import numpy as np
+
+def _buckets(values, nbuckets):
+    """Reshapes values into at most nbuckets rows of equal length. The last row is padded
+    by repeating the last value, so padded entries never win an argmin or argmax against
+    the real values of the row. Returns the rows and the row length."""
+    size = -(-len(values)//nbuckets)
+    nbuckets = -(-len(values)//size)
+    padded = np.empty(nbuckets*size, dtype=float)
+    padded[:len(values)] = values
+    padded[len(values):] = values[-1]
+    return padded.reshape(nbuckets, size), size
+
+def minmax_indices(y, n_out):
+    """Indices of the points kept by min-max decimation
+
+    The series is split into at most n_out//2 buckets of equal length, and the smallest and
+    largest value of every bucket are kept, so spikes survive decimation no matter
+    how short they are. The first and last points are always kept.
+
+    Keyword arguments:
+    y -- numpy array with the values of the series
+    n_out -- largest number of points that are kept
+
+    Return value:
+    indices -- sorted numpy array with the indices of the kept points
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out or n_out < 4:
+        return np.arange(n)
+
+    inner = y[1:-1]
+    rows, size = _buckets(inner, (n_out - 2)//2)
+    start = np.arange(rows.shape[0])*size
+    # padded entries map back to the last inner point
+    inner = np.minimum(np.concatenate([start + np.argmin(rows, axis=1), start + np.argmax(rows, axis=1)]), n - 3) + 1
+    indices = np.concatenate([[0], inner, [n - 1]])
+    return np.unique(indices)
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets decimation
+
+    The inner points are split into at most n_out-2 buckets. Going from left to right, every
+    bucket keeps the point that forms the largest triangle with the point kept in the
+    previous bucket and the mean of the next bucket. This keeps the visual shape of
+    the series better than min-max decimation for the same number of points. The
+    areas are computed for a whole bucket at a time, only the walk over the buckets
+    is sequential.
+
+    Keyword arguments:
+    x -- numpy array with the x values of the series, e.g. the iterations
+    y -- numpy array with the values of the series
+    n_out -- largest number of points that are kept
+
+    Return value:
+    indices -- sorted numpy array with the indices of the kept points
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    rows_x, size = _buckets(x[1:-1], n_out - 2)
+    rows_y, size = _buckets(y[1:-1], n_out - 2)
+    nbuckets = rows_x.shape[0]
+    counts = np.minimum(size, (n - 2) - np.arange(nbuckets)*size)
+
+    # mean of every bucket, followed by the last point for the last bucket
+    mean_x = np.append(rows_x.sum(axis=1) - (size - counts)*x[-2], x[-1])
+    mean_y = np.append(rows_y.sum(axis=1) - (size - counts)*y[-2], y[-1])
+    mean_x[:-1] /= counts
+    mean_y[:-1] /= counts
+
+    # twice the triangle area is linear in the point p of the bucket
+    chosen = np.empty(nbuckets, dtype=np.int64)
+    ax, ay = x[0], y[0]
+    for i in range(nbuckets):
+        cx, cy = mean_x[i + 1], mean_y[i + 1]
+        area = np.abs((ax - cx)*rows_y[i] + (cy - ay)*rows_x[i] + (cx*ay - ax*cy))
+        j = int(np.argmax(area))
+        chosen[i] = j
+        ax, ay = rows_x[i, j], rows_y[i, j]
+
+    indices = np.minimum(np.arange(nbuckets)*size + chosen, n - 3) + 1
+    return np.concatenate([[0], indices, [n - 1]])
+
+def decimate(x, y, n_out, method = 'minmax'):
+    """Decimates a series for plotting
+
+    Keyword arguments:
+    x -- numpy array with the x values of the series
+    y -- numpy array with the values of the series
+    n_out -- largest number of points that are kept. 0 or None keeps all points
+    method -- 'minmax' to keep the extremes of every bucket, or 'lttb' for
+              Largest-Triangle-Three-Buckets (default 'minmax')
+
+    Return value:
+    x -- decimated x values
+    y -- decimated values
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    assert method in ['minmax', 'lttb'], "method has to be 'minmax' or 'lttb'"
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if not n_out or len(y) <= n_out:
+        return x, y
+    if method == 'minmax':
+        indices = minmax_indices(y, n_out)
+    else:
+        indices = lttb_indices(x, y, n_out)
+    return x[indices], y[indices]
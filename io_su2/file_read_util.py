@@ -1,23 +1,74 @@
 import numpy as np
+import hashlib
+import json
+import mmap
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io_su2.profiling import instrumented
 
-def read_last_line(f):
+def read_last_line(f, block_size=4096, max_block_size=65536):
     """Returns last line of file.
     
+    The file is read backwards in blocks, starting with block_size bytes and doubling
+    up to max_block_size, until the start of the last line is found. Trailing line
+    endings and empty lines are skipped, so files with or without a final newline and
+    with LF or CRLF line endings give the same result.
+    
     Keyword arguments:
-    f -- file object
+    f -- file object opened in binary mode
+    block_size -- size in bytes of the first block read from the end (default 4096)
+    max_block_size -- largest block size in bytes (default 65536)
 
     Return value:
-    last -- string representing the last line in the file
-    
-    Author: https://stackoverflow.com/questions/3346430/what-is-the-most-efficient-way-to-get-first-and-last-line-of-a-text-file/3346788
-    Last updated: 09/08/2020"""
-    
-    f.seek(-2, 2)              # Jump to the second last byte.
-    while f.read(1) != b"\n":  # Until EOL is found ...
-        f.seek(-2, 1)          # ... jump back, over the read byte plus one more.
-    return f.read().decode('utf-8')            # Read all data from this point on.
+    last -- string representing the last line in the file, without the line ending
     
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    pos = f.seek(0, 2)
+    tail = b''
+    while pos > 0:
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        tail = f.read(step) + tail
+        # the last line starts after the last newline that is followed by content
+        stripped = tail.rstrip(b'\r\n')
+        start = stripped.rfind(b'\n')
+        if start >= 0:
+            return stripped[start+1:].rstrip(b'\r').decode('utf-8')
+        block_size = min(2*block_size, max_block_size)
+    return tail.rstrip(b'\r\n').decode('utf-8')
+
+def _split_values(line):
+    """Splits a line of a history file into its values, comma or white space delimited"""
+    if ',' in line:
+        return [val.strip() for val in line.split(',')]
+    return line.split()
+
+def _final_values(filename):
+    """Returns the variable names and an array with the last row of a history file.
+    The values are NaN if the file has no complete data row yet."""
+    file_extension = os.path.splitext(filename)[1]
+    with open(filename, "rb") as f:
+        variables, nlines = _read_history_header(f, file_extension)
+        if variables is None:
+            return [], np.empty(0)
+        last = read_last_line(f)
+    
+    values = np.full(len(variables), np.nan)
+    try:
+        vals = np.array(_split_values(last), dtype=float)
+    except ValueError:
+        # only the header has been written
+        return variables, values
+    n = min(len(vals), len(variables))
+    values[:n] = vals[:n]
+    return variables, values
+
+@instrumented
 def get_final_vals(filename = "history.csv"):
     """Returns last value of variables defined in the file
     
@@ -28,59 +79,237 @@ def get_final_vals(filename = "history.csv"):
     data_dict -- Dictionary where keys are variables names and values are their final values.
     
     Author: Jayant Mukhopadhaya
-    Last updated: 09/08/2020"""
+    Last updated: 10/18/2026"""
     
     file_name, file_extension = os.path.splitext(filename)
     
-    # if tecplot file, use tecplot reader
-    if file_extension == ".dat":
-        with open(filename, "r") as f:
-            line = f.readline()
-            while line:
-                if "variable" in line.lower():
-                    line = line.split('=',1)[1]
-                    if '\\' in line:
-                        line = f.readline()
-                        variables = [ var.strip().strip("\"") for var in line.split(",")]
-                    else:
-                        variables = [ var.strip().strip("\"") for var in line.split(",")]
-                    break
-        with open(filename,"rb") as f:
-            vals = read_last_line(f)
-            
-        if ',' in vals:
-            vals= [val.strip() for val in vals.split(',')]
-        else:
-            vals = vals.split()
-    
-    # if csv file, use csv reader
-    elif file_extension == ".csv":
-        with open(filename,"r") as fp:
-            line = fp.readline()
-            # Check for comments
-            if '#' in line:
-                line_parts = line.split('#')
-                if not line_parts[0]:
-                    line = fp.readline()
-            # Read variable list
-            else:
-                variables = [i.strip().strip('\""') for i in line.split(",")]
-        
-        with open(filename,"rb") as f:
-            vals = read_last_line(f)
-        vals= [val.strip() for val in vals.split(',')]
-    
     # invalid file extension
-    else:
+    if file_extension not in [".dat", ".csv"]:
         print("This function can only read tabular tecplot or csv data")
         return 0
     
+    # header and last line are read from the same file object
+    variables, values = _final_values(filename)
+    
     data_dict = {}
     for i,var in enumerate(variables):
-        data_dict[var] = float(vals[i])
+        data_dict[var] = float(values[i])
     
     return data_dict     
+
+@instrumented
+def get_final_vals_many(paths, threads = 1):
+    """Returns the last value of the variables of several history files
+    
+    Keyword arguments:
+    paths -- list of history files (.dat or .csv)
+    threads -- number of threads used to read the files. None uses the default of
+               concurrent.futures.ThreadPoolExecutor, 1 reads serially (default 1)
+
+    Return value:
+    data_dict -- Dictionary where keys are variable names and values are arrays with
+                 one final value per file, in the order of paths. Variables that are
+                 missing from a file and files without data rows give NaN.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    paths = list(paths)
+    if threads == 1 or len(paths) < 2:
+        results = [_final_values(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(_final_values, paths))
+    
+    # stack the values, variables are ordered by first appearance
+    data_dict = {}
+    for i, (variables, values) in enumerate(results):
+        for var, value in zip(variables, values):
+            if var not in data_dict:
+                data_dict[var] = np.full(len(paths), np.nan)
+            data_dict[var][i] = value
+    
+    return data_dict
+    
+# In-memory cache of the mesh metadata, organized as {path : (size, mtime_ns, data)}
+_MESH_METADATA_CACHE = {}
+
+def _skip_lines(mm, pos, nlines, chunk_bytes=1<<24):
+    """Returns the byte position right after the next nlines lines starting at pos.
+    
+    Only newline characters are counted, the content of the lines is never converted.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    size = len(mm)
+    while nlines > 0 and pos < size:
+        chunk = mm[pos:pos + chunk_bytes]
+        n = chunk.count(b'\n')
+        if n >= nlines:
+            newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10)
+            return pos + int(newlines[nlines-1]) + 1
+        nlines -= n
+        pos += len(chunk)
+    return min(pos, size)
+
+def _mesh_metadata_sidecar(filename):
+    """Returns the name of the metadata sidecar file of a mesh.
+    The name does not contain the mesh extension so it is not mistaken for a mesh."""
+    path, name = os.path.split(os.path.abspath(filename))
+    return os.path.join(path, '.' + os.path.splitext(name)[0] + '_mesh_metadata.json')
+
+def _scan_mesh_keywords(mm, read_block):
+    """Goes through the keyword lines of a memory-mapped SU2 mesh file. Used by both
+    scan_mesh_metadata and read_mesh, which only differ in how they handle the data blocks.
+    
+    Keyword arguments:
+    mm -- memory-mapped mesh file
+    read_block -- function read_block(data, word, tag, count, pos) that handles the count
+                  lines of the NPOIN, NELEM or MARKER_ELEMS block starting at byte pos,
+                  stores the result in data and returns the byte position after the block.
+                  tag is the current MARKER_TAG.
     
+    Return value:
+    data -- dictionary with NDIME, NELEM, NPOIN, NMARK, an empty MARKERS dictionary for
+            meshes with markers, and everything stored by read_block
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    data = {}
+    pos = 0
+    tag = None
+    size = len(mm)
+    while pos < size:
+        end = mm.find(b'\n', pos)
+        if end < 0:
+            end = size
+        line = mm[pos:end].decode('utf-8').strip()
+        pos = end + 1
+        
+        # If comment or not a named property, skip
+        if not line or line[0] == '%' or not '=' in line:
+            continue
+        word, value = [text.strip() for text in line.split('=', 1)]
+        
+        if word in ['NDIME', 'NMARK']:
+            data[word] = int(value)
+        elif word in ['NELEM', 'NPOIN']:
+            data[word] = int(value.split()[0])
+            pos = read_block(data, word, tag, data[word], pos)
+        elif word == 'MARKER_TAG':
+            tag = value
+            if not 'MARKERS' in data.keys():
+                data['MARKERS'] = {}
+        elif word == 'MARKER_ELEMS':
+            if not 'MARKERS' in data.keys():
+                data['MARKERS'] = {}
+            pos = read_block(data, word, tag, int(value), pos)
+    return data
+
+@instrumented
+def scan_mesh_metadata(filename = 'mesh.su2'):
+    """Reads the header data of a SU2 mesh file without reading the points and elements.
+    
+    The NELEM, NPOIN and MARKER_ELEMS counts are used to jump over the data blocks, 
+    so only the keyword lines are parsed.
+    
+    Keyword arguments:
+    filename -- name of mesh file.
+    
+    Return value:
+    data -- dictionary that contains all the mesh data organized as: 
+
+    data =  {   NDIME = ...,
+                NELEM = ...,
+                NPOIN = ...,
+                NMARK = ...,
+                MARKERS= { marker_name0 : marker_elem0,
+                           marker_name1 : marker_elem1,
+                           .
+                           .
+                        marker_nameN : marker_elemN}
+            }
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # skip the data blocks, only the marker sizes are kept
+            def skip_block(data, word, tag, count, pos):
+                if word == 'MARKER_ELEMS':
+                    data['MARKERS'][tag] = count
+                return _skip_lines(mm, pos, count)
+            data = _scan_mesh_keywords(mm, skip_block)
+        finally:
+            mm.close()
+    return data
+
+@instrumented
+def mesh_metadata(filename = 'mesh.su2', cache = True):
+    """Returns the header data of a SU2 mesh file, see scan_mesh_metadata.
+    
+    Results are cached in memory and in a sidecar json file next to the mesh. Both are 
+    keyed on the path, size and modification time of the mesh, so repeated queries only 
+    stat the mesh file and a changed mesh is scanned again.
+    
+    Keyword arguments:
+    filename -- name of mesh file.
+    cache -- if False, always scan the mesh file and do not update the cache (default True)
+    
+    Return value:
+    data -- dictionary that contains all the mesh data, see scan_mesh_metadata. A new 
+            dictionary is returned on every call so it can be modified safely.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    if not cache:
+        return scan_mesh_metadata(filename)
+    
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    key = (stat.st_size, stat.st_mtime_ns)
+    
+    # in-memory cache
+    if path in _MESH_METADATA_CACHE and _MESH_METADATA_CACHE[path][:2] == key:
+        data = _MESH_METADATA_CACHE[path][2]
+    else:
+        data = None
+        
+        # sidecar file
+        sidecar = _mesh_metadata_sidecar(path)
+        try:
+            with open(sidecar) as fp:
+                entry = json.load(fp)
+            if entry['path'] == path and (entry['size'], entry['mtime_ns']) == key:
+                data = entry['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        # scan the mesh and save the result
+        if data is None:
+            data = scan_mesh_metadata(path)
+            try:
+                tmp = sidecar + '.' + str(os.getpid())
+                with open(tmp, 'w') as fp:
+                    json.dump({'path' : path, 'size' : key[0], 'mtime_ns' : key[1], 'data' : data}, fp)
+                os.replace(tmp, sidecar)
+            except OSError:
+                pass
+        _MESH_METADATA_CACHE[path] = key + (data,)
+    
+    data = dict(data)
+    if 'MARKERS' in data:
+        data['MARKERS'] = dict(data['MARKERS'])
+    return data
+
+@instrumented
 def get_mesh_data(filename = 'mesh.su2', var = ''):
     """Goes through mesh file and can extract NELEM or NPOIN based on input var.
     
@@ -105,107 +334,388 @@ def get_mesh_data(filename = 'mesh.su2', var = ''):
                         marker_nameN : marker_elemN}
             }
     
+    The header values are served from mesh_metadata, which skips over the points and
+    elements and caches the result.
+    
     Author: Jayant Mukhopadhaya
-    Last updated: 08/12/2020"""
-    keywords = ['NELEM', 'NPOIN','NDIME','NMARK','MARKER_TAG']
+    Last updated: 10/18/2026"""
+    
+    # header data, served from the metadata cache
+    if not var:
+        return mesh_metadata(filename)
+    if var in ['NELEM', 'NPOIN', 'NDIME', 'NMARK']:
+        return mesh_metadata(filename).get(var, 0)
+    
     N = 0
-    data = {}
     with open(filename) as fp:
         # Read file line by line so that we can exit before reading the whole file
         line = fp.readline()
 
-        # Reading all data from the mesh file
-        if not var:
-            while line:
-                # If comment or not a named property, skip
-                if line[0] == '%' or not '=' in line:
-                    line=fp.readline()
-                    continue
+        # Reading only specified value
+        while line:
+            # If comment or not a named property, skip
+            if line[0] == '%' or not '=' in line:
+                line=fp.readline()
+                continue
+            # If chosen variable, save value and break loop
+            if line.split("=")[0] == var:
                 split_text = line.split("=")
-                word = split_text[0].strip()
-
-                # Ensure word is in list of keywords
-                if word in keywords:
-                    # if not marker information, save info directly in dict
-                    if not 'MARKER' in word:
-                        data[word] = int(split_text[-1].strip())
-                    # if marker information...
-                    else:
-                        # initialize marker data in dict
-                        if not 'MARKERS' in data.keys():
-                            data['MARKERS'] = {}
-                        # add tag and elem data
-                        if 'TAG' in word:
-                            tag = split_text[-1].strip()
-                            # elem data associated with current tag
-                            while not 'MARKER_ELEMS' in line:
-                                line = fp.readline()
-                            split_text = line.split("=")
-                            elems = int(split_text[-1].strip())
-                            data['MARKERS'][tag] = elems
+                N = int(split_text[-1].strip())
+                break
+            line=fp.readline()
 
-                line=fp.readline()
-            return data
+    return N
+
+# Number of nodes for each VTK element type used in the SU2 mesh format
+_SU2_ELEM_NODES = {3: 2, 5: 3, 9: 4, 10: 4, 12: 8, 13: 6, 14: 5}
+_SU2_ELEM_NODES_TABLE = np.full(max(_SU2_ELEM_NODES)+1, -1, dtype=np.int64)
+for _elem_type, _elem_nodes in _SU2_ELEM_NODES.items():
+    _SU2_ELEM_NODES_TABLE[_elem_type] = _elem_nodes
 
-        # Reading only specified value 
+def _read_numeric_block(mm, pos, nlines, dtype=float, chunk_bytes=1<<24):
+    """Converts nlines lines of numeric text starting at byte pos into a flat array.
+    
+    The block is processed in chunks of roughly chunk_bytes that end on a line boundary.
+    Each chunk is converted with a single call to np.fromstring, and the number of values
+    on each line is found from the positions of the token starts, so no Python code runs
+    per line.
+    
+    Keyword arguments:
+    mm -- memory-mapped file (or bytes)
+    pos -- byte position of the first line of the block
+    nlines -- number of lines in the block
+    dtype -- data type of the values (default float)
+    chunk_bytes -- approximate number of bytes converted at a time (default 16 MiB)
+    
+    Return value:
+    values -- flat numpy array with all values in the block
+    counts -- numpy array with the number of values on each line
+    pos -- byte position right after the block
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    values = []
+    counts = []
+    size = len(mm)
+    while nlines > 0:
+        if pos >= size:
+            raise ValueError("Unexpected end of file while reading numeric block")
+        end = min(pos + chunk_bytes, size)
+        chunk = mm[pos:end]
+        newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == 10)
+        
+        # cut the chunk at a line boundary
+        if newlines.size >= nlines:
+            cut = newlines[nlines-1] + 1
+            n = nlines
+        elif end == size:
+            cut = len(chunk)
+            n = newlines.size + (1 if newlines.size == 0 or newlines[-1] != cut-1 else 0)
+            if n < nlines:
+                raise ValueError("Unexpected end of file while reading numeric block")
+        elif newlines.size == 0:
+            # single line longer than the chunk, try again with a larger chunk
+            chunk_bytes *= 2
+            continue
         else:
-            while line:
-                # If comment or not a named property, skip
-                if line[0] == '%' or not '=' in line:
-                    line=fp.readline()
-                    continue
-                # If chosen variable, save value and break loop
-                if line.split("=")[0] == var:
-                    split_text = line.split("=")
-                    N = int(split_text[-1].strip())
-                    break
-                line=fp.readline()
+            cut = newlines[-1] + 1
+            n = newlines.size
+        chunk = chunk[:cut]
+        
+        # count the values on each line from the token starts
+        arr = np.frombuffer(chunk, dtype=np.uint8)
+        space = arr <= 32
+        start = ~space
+        start[1:] &= space[:-1]
+        line_id = np.cumsum(arr == 10)
+        line_counts = np.bincount(line_id[start], minlength=n)[:n]
+        
+        vals = np.fromstring(chunk, dtype=dtype, sep=' ')
+        if vals.size != line_counts.sum():
+            raise ValueError("Could not convert numeric block starting at byte " + str(pos))
+        values.append(vals)
+        counts.append(line_counts)
+        nlines -= n
+        pos += cut
+    
+    if not values:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=np.int64), pos
+    return np.concatenate(values), np.concatenate(counts), pos
 
-    if not var:
-        return data
-    else:
-        return N
+def _elements_to_csr(values, counts):
+    """Turns flat element lines (type, node0, node1, ..., [index]) into CSR-style arrays.
+    
+    Return value:
+    offsets -- numpy array of size nelem+1, nodes of element i are connectivity[offsets[i]:offsets[i+1]]
+    connectivity -- flat numpy array containing the node indices of all elements
+    types -- numpy array containing the VTK type of each element
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    line_start = np.zeros(counts.size, dtype=np.int64)
+    np.cumsum(counts[:-1], out=line_start[1:])
+    types = values[line_start]
+    
+    if types.size and (types.min() < 0 or types.max() >= _SU2_ELEM_NODES_TABLE.size):
+        raise ValueError("Unknown element type in mesh file")
+    nnodes = _SU2_ELEM_NODES_TABLE[types]
+    if np.any(nnodes < 0):
+        raise ValueError("Unknown element type in mesh file: " + str(types[nnodes < 0][0]))
+    if np.any(counts < nnodes + 1):
+        raise ValueError("Element line with too few nodes in mesh file")
+    
+    offsets = np.zeros(types.size + 1, dtype=np.int64)
+    np.cumsum(nnodes, out=offsets[1:])
+    inds = np.repeat(line_start + 1 - offsets[:-1], nnodes) + np.arange(offsets[-1])
+    return offsets, values[inds], types
 
+@instrumented
+def read_mesh(filename = 'mesh.su2', chunk_bytes = 1<<24):
+    """Reads the full geometry of a SU2 mesh file: coordinates, elements and markers.
+    
+    The file is memory-mapped and only the keyword lines are handled in Python. The point,
+    element and marker blocks are converted in bulk, chunk by chunk, so large meshes
+    load at close to the speed of the numeric conversion itself. Only single-zone meshes
+    are supported.
+    
+    Keyword arguments:
+    filename -- name of mesh file.
+    chunk_bytes -- approximate number of bytes converted at a time (default 16 MiB)
+    
+    Return value:
+    data -- dictionary that contains all the mesh data organized as: 
+
+    data =  {   NDIME = ...,
+                NELEM = ...,
+                NPOIN = ...,
+                NMARK = ...,
+                POINTS = numpy array of shape (NPOIN, NDIME) with the point coordinates,
+                ELEM_OFFSETS = numpy array of size NELEM+1,
+                ELEM_CONNECTIVITY = flat numpy array with the node indices of all elements,
+                ELEM_TYPES = numpy array with the VTK type of each element,
+                MARKERS= { marker_name0 : { OFFSETS = ...,
+                                            CONNECTIVITY = ...,
+                                            TYPES = ...},
+                           .
+                           .
+                           marker_nameN : {...}}
+            }
+    
+    The nodes of element i are ELEM_CONNECTIVITY[ELEM_OFFSETS[i]:ELEM_OFFSETS[i+1]]. 
+    Marker elements are organized the same way.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    with open(filename, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # convert the data blocks in bulk
+            def read_block(data, word, tag, count, pos):
+                if word == 'NPOIN':
+                    assert 'NDIME' in data, "NDIME has to be defined before NPOIN"
+                    values, counts, pos = _read_numeric_block(mm, pos, count, float, chunk_bytes)
+                    if np.any(counts < data['NDIME']):
+                        raise ValueError("Point line with too few coordinates in mesh file")
+                    line_start = np.zeros(counts.size, dtype=np.int64)
+                    np.cumsum(counts[:-1], out=line_start[1:])
+                    data['POINTS'] = values[line_start[:,None] + np.arange(data['NDIME'])]
+                    return pos
+                
+                values, counts, pos = _read_numeric_block(mm, pos, count, np.int64, chunk_bytes)
+                offsets, connectivity, types = _elements_to_csr(values, counts)
+                if word == 'NELEM':
+                    data['ELEM_OFFSETS'], data['ELEM_CONNECTIVITY'], data['ELEM_TYPES'] = \
+                        offsets, connectivity, types
+                else:
+                    data['MARKERS'][tag] = {'OFFSETS' : offsets,
+                                           'CONNECTIVITY' : connectivity,
+                                           'TYPES' : types}
+                return pos
+            data = _scan_mesh_keywords(mm, read_block)
+        finally:
+            mm.close()
+    
+    return data
+
+@instrumented
 def get_force_data(filename = 'forces_breakdown.dat'):
     """Goes through force breakdown file to extract component force coefficient data
-    Currently only extracts C_L and C_D data seperated into pressure and viscous parts
+    Extracts the total coefficients of the whole configuration seperated into pressure
+    and viscous parts. Use read_forces_breakdown for the momentum parts, the values 
+    of each marker and the free-stream conditions.
     
     Keyword arguments:
     filename -- Name of forces breakdown file. Default is forces_breakdown.dat
     
     Return value:
-    force_dict -- Dictionary containing extracted force data 
+    force_dict -- Dictionary containing extracted force data, e.g. CL, CLp (pressure)
+                  and CLv (viscous)
     
     Author: Jayant Mukhopadhaya
-    Last updated: 08/12/2020"""
+    Last updated: 10/18/2026"""
 
-    force_dict = {}
-    with open(filename) as fp:
-        line = fp.readline()
-        while line:
-            if "Total" in line.split(":")[0]:
-                coeff = line.split(":")[0].split("Total ")[1]
-                split_text = line.split("|")
-                for chunk in split_text:
-                    if "Total" in chunk:
-                        force_dict[coeff] = float(chunk.strip().split()[-1])
-                    elif "Pressure" in chunk:
-                        force_dict[coeff + 'p'] = float(chunk.strip().split()[-1])
-                    elif "Friction" in chunk:
-                        force_dict[coeff + 'v'] = float(chunk.strip().split()[-1])
-                if 'CFy' in line:
-                    break
-            line=fp.readline()
+    total = read_forces_breakdown(filename, conditions=False)['TOTAL']
+    force_dict = dict((key, val) for key, val in total.items() if not (key.endswith('m') and key[:-1] in total))
 
     return force_dict
 
+# Patterns of the forces breakdown file. Coefficient lines look like
+# Total CL    (  100%):   -0.000715 | Pressure (   99%):   -0.000714 | Friction (    0%):   -0.000000 | Momentum (    0%):    0.000000
+# where the share in brackets after the coefficient name is only printed for the markers
+# and the momentum part is missing in older versions of SU2.
+_FORCES_COEFF = re.compile(r'^Total\s+(\S+?)\s*(?:\(\s*\S+%\))?:\s*(\S+)'
+                           r'\s*\|\s*Pressure\s*\([^)\n]*\):\s*(\S+)'
+                           r'\s*\|\s*Friction\s*\([^)\n]*\):\s*(\S+)'
+                           r'(?:[ \t]*\|\s*Momentum\s*\([^)\n]*\):\s*(\S+))?', re.M)
+_FORCES_TOTAL = re.compile(r'^Total\s', re.M)
+_FORCES_SURFACE = re.compile(r'^Surface name:[ \t]*(.*?)[ \t]*$', re.M)
+_FORCES_FACTORS = re.compile(r'non-dimensional factor:\s*(\S+?),\s*and the reference factor:\s*(\S+)')
+_FORCES_OPTION = re.compile(r'^([A-Za-z][^:\n]*?):[ \t]*(.+?)[ \t]*$', re.M)
+_FORCES_NUMBER = re.compile(r'^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+_FORCES_VECTOR = re.compile(r'^\(([^)]*)\)')
+
+def _forces_value(text):
+    """Converts the value of a 'name: value unit.' line to a float, a numpy array for
+    vectors like (69.4448, 0), or the string itself if it is not numeric"""
+    match = _FORCES_VECTOR.match(text)
+    if match:
+        return np.array([float(val) for val in match.group(1).split(',')])
+    match = _FORCES_NUMBER.match(text)
+    if match:
+        return float(match.group(0))
+    return text.rstrip('.').strip()
+
+@instrumented
+def read_forces_breakdown(filename = 'forces_breakdown.dat', conditions = True):
+    """Reads all the data of a SU2 forces breakdown file in a single pass
+    
+    Keyword arguments:
+    filename -- Name of forces breakdown file (default 'forces_breakdown.dat')
+    conditions -- If False, only the coefficients are read and 'CONDITIONS' and 'FACTORS'
+                  are empty, which is faster when many files are read (default True)
+    
+    Return value:
+    data -- Dictionary organized as:
+    data = {    'TOTAL' : { 'CL' : total value, 'CLp' : pressure part, 'CLv' : friction 
+                            (viscous) part, 'CLm' : momentum part, 'CD' : ...} for every 
+                          coefficient of the whole configuration,
+                'MARKERS' : { marker name : dictionary like 'TOTAL' for the marker, ...},
+                'CONDITIONS' : { name : value } for the 'name: value' lines of the problem
+                               definition, e.g. 'Free-stream pressure (non-dim)' or 
+                               'Reference velocity'. Values are floats, numpy arrays for
+                               vectors, or strings,
+                'FACTORS' : { 'Non-dimensional factor' : value, 'Reference factor' : value }}
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    assert filename, "Please pass filename as an argument to the function"
+    
+    with open(filename) as fp:
+        text = fp.read()
+    
+    # the file is split into the part before the first marker and one part per marker
+    sections = _FORCES_SURFACE.split(text)
+    
+    def coefficients(section):
+        coeffs = {}
+        for match in _FORCES_COEFF.finditer(section):
+            coeff = match.group(1)
+            for suffix, val in zip(['', 'p', 'v', 'm'], match.groups()[1:]):
+                if val is not None:
+                    coeffs[coeff + suffix] = float(val)
+        return coeffs
+    
+    total = coefficients(sections[0])
+    markers = dict((sections[i], coefficients(sections[i+1])) for i in range(1, len(sections), 2))
+    
+    # problem definition and free-stream conditions, before the coefficients
+    options = {}
+    factors = {}
+    if conditions:
+        match = _FORCES_TOTAL.search(sections[0])
+        head = sections[0][:match.start()] if match else sections[0]
+        options = dict((match.group(1), _forces_value(match.group(2))) for match in _FORCES_OPTION.finditer(head))
+        match = _FORCES_FACTORS.search(head)
+        if match:
+            factors['Non-dimensional factor'] = float(match.group(1))
+            factors['Reference factor'] = float(match.group(2))
+    
+    data = {'TOTAL' : total,
+            'MARKERS' : markers,
+            'CONDITIONS' : options,
+            'FACTORS' : factors}
+    return data
+
+@instrumented
+def read_forces_breakdown_many(paths, marker = None, threads = 1):
+    """Collects the coefficients of the forces breakdown files of several runs into a table
+    
+    Keyword arguments:
+    paths -- list of forces breakdown files, or run folders that contain forces_breakdown.dat
+    marker -- name of a marker to collect the coefficients of that marker instead of the
+              whole configuration (default None)
+    threads -- number of threads used to read the files. None uses the default of
+               concurrent.futures.ThreadPoolExecutor, 1 reads serially (default 1)
+    
+    Return value:
+    table -- Dictionary where keys are coefficient names (CL, CLp, CLv, CLm, ...) and values
+             are arrays with one value per path, in the order of paths. Coefficients that
+             are missing from a file and files that could not be read give NaN.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    paths = [os.path.join(path, 'forces_breakdown.dat') if os.path.isdir(path) else path for path in paths]
+    
+    def read_one(filename):
+        try:
+            data = read_forces_breakdown(filename, conditions=False)
+        except (OSError, ValueError):
+            return {}
+        return data['TOTAL'] if marker is None else data['MARKERS'].get(marker, {})
+    
+    if threads == 1 or len(paths) < 2:
+        results = [read_one(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(read_one, paths))
+    
+    # coefficients are ordered by first appearance
+    table = {}
+    for i, coeffs in enumerate(results):
+        for coeff, value in coeffs.items():
+            if coeff not in table:
+                table[coeff] = np.full(len(paths), np.nan)
+            table[coeff][i] = value
+    
+    return table
+
+def _parse_performance_lines(lines):
+    """Converts the 'name: value | name: value' lines of a SU2 performance summary into a dictionary"""
+    perf_dict = {}
+    for line in lines:
+        if "|" in line:
+            split_text = line.split("|")
+            for chunk in split_text:
+                if not chunk.strip():
+                    continue
+                var = chunk.split(":")[0].strip()
+                perf_dict[var] = float(chunk.strip().split()[-1])
+    return perf_dict
+
+@instrumented
 def get_performance_data(filename = 'performance_data.dat'):
     """Returns performance metrics as a dictionary
     
     Keyword arguments:
     filename -- Name of performance data file. This needs to be created 
                 from the output log. Usually it is the last 25 lines of 
-                the output log.
+                the output log. Use read_log to get the same data directly
+                from the output log.
     
     Return value:
     perf_dict -- Dictionary containing performance data 
@@ -213,56 +723,376 @@ def get_performance_data(filename = 'performance_data.dat'):
     Author: Jayant Mukhopadhaya
     Last updated: 21/12/2020"""
 
-    perf_dict = {}
     with open(filename) as fp:
-        line = fp.readline()
-        while line:
-            if "|" in line:
-                split_text = line.split("|")
-                for chunk in split_text:
-                    if not chunk.strip():
-                        continue
-                    var = chunk.split(":")[0].strip()
-                    perf_dict[var] = float(chunk.strip().split()[-1])
-                    
-            line=fp.readline()
+        perf_dict = _parse_performance_lines(fp)
     return perf_dict
 
-def read_history_data(filename=''):
+# Lines of the SU2 geometry preprocessing output with the partitioning information
+_LOG_PARTITION = [(re.compile(r'^(\d+) grid points( before partitioning)?\.'), 'NPOIN'),
+                  (re.compile(r'^(\d+) volume elements( before partitioning)?\.'), 'NELEM'),
+                  (re.compile(r'partitioning complete \((\d+) edge cuts\)'), 'EDGE_CUTS'),
+                  (re.compile(r'^(\d+) vertices including ghost points'), 'NPOIN_HALO'),
+                  (re.compile(r'^(\d+) interior elements including halo cells'), 'NELEM_HALO')]
+_LOG_RELEASE = re.compile(r'Release\s+(.+?)\s*\|')
+_LOG_OPTION = re.compile(r'^([A-Za-z][^:|]*?)\s*:\s*(.+?)\.?\s*$')
+
+def _find_performance_summary(f, tail_bytes=1<<20, block_size=16384):
+    """Searches backwards from the end of a log for the performance summary.
+    
+    Return value:
+    pos -- byte position of the start of the summary, the file size if it is not found
+    lines -- list with the lines of the summary
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    size = f.seek(0, 2)
+    pos = size
+    tail = b''
+    while pos > max(size - tail_bytes, 0):
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        tail = f.read(step) + tail
+        found = tail.rfind(b'Performance Summary')
+        if found >= 0:
+            start = tail.rfind(b'\n', 0, found) + 1
+            lines = tail[start:].decode('utf-8', 'replace').splitlines()
+            # the summary ends at the first line of dashes
+            for i, line in enumerate(lines[1:]):
+                if line.startswith('---'):
+                    lines = lines[:i+1]
+                    break
+            return pos + start, lines
+        block_size *= 2
+    return size, []
+
+@instrumented
+def read_log(filename = 'log.out', residuals = True, tail_bytes = 1<<20, chunk_rows = 4096):
+    """Reads the screen output of a SU2 run
+    
+    The performance summary is found by searching backwards from the end of the file,
+    so it is read without going through the whole log. The header and the residual
+    table are then read in a single streaming pass that stops at the summary. The 
+    residual rows are converted in blocks of chunk_rows rows, repeated table headers 
+    and other tables printed during the run are skipped.
+    
+    Keyword arguments:
+    filename -- Name of the log file (default 'log.out')
+    residuals -- If False, only the header, partition info and performance summary
+                 are read and the residual table is skipped (default True)
+    tail_bytes -- Number of bytes at the end of the file that are searched for the
+                  performance summary (default 1 MiB)
+    chunk_rows -- Number of residual rows converted at once (default 4096)
+    
+    Return value:
+    log_dict -- Dictionary organized as:
+    log_dict = {    'HEADER' : {'Release' : SU2 version, option : value, ...} for the
+                               'option: value' lines printed before the solver starts,
+                    'PARTITION' : {'NPOIN', 'NELEM', 'EDGE_CUTS', 'NPOIN_HALO', 'NELEM_HALO'}
+                                  for the values found in the log,
+                    'RESIDUALS' : {screen output field : numpy array, ...},
+                    'PERFORMANCE' : dictionary as returned by get_performance_data,
+                                    empty if the run has not finished,
+                    'SUCCESS' : True if the log ends with Exit Success }
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    assert filename, "Please pass filename as an argument to the function"
+    
+    header = {}
+    partition = {}
+    variables = None
+    buf = None
+    rows = []
+    
+    with open(filename, 'rb') as f:
+        perf_pos, perf_lines = _find_performance_summary(f, tail_bytes)
+        # the exit message is printed after the summary, at the very end of the log
+        f.seek(max(f.seek(0, 2) - 4096, 0))
+        success = b'Exit Success' in f.read()
+        f.seek(0)
+        
+        pos = 0
+        in_solver = False
+        for raw_line in f:
+            pos += len(raw_line)
+            if pos > perf_pos:
+                break
+            line = raw_line.decode('utf-8', 'replace')
+            
+            # header and partition info before the solver starts
+            if not in_solver:
+                if 'Begin Solver' in line and line.startswith('-'):
+                    in_solver = True
+                    if not residuals:
+                        break
+                    continue
+                match = _LOG_RELEASE.search(line)
+                if match and 'Release' not in header:
+                    header['Release'] = match.group(1)
+                    continue
+                match = _LOG_OPTION.match(line)
+                if match:
+                    header[match.group(1)] = match.group(2)
+                for regex, key in _LOG_PARTITION:
+                    match = regex.search(line)
+                    if match:
+                        partition[key] = int(match.group(1))
+                continue
+            
+            # residual table, the first row of the table holds the field names
+            if not line.startswith('|'):
+                continue
+            fields = line.strip().strip('|').split('|')
+            if variables is None:
+                variables = [field.strip() for field in fields]
+                buf = _ColumnBuffer(len(variables))
+            elif len(fields) == len(variables) and fields[0].strip().isdigit():
+                rows.append(line.replace('|', ' '))
+                if len(rows) >= chunk_rows:
+                    buf.append(_parse_rows(rows, len(variables)))
+                    rows = []
+    
+    if buf is not None and rows:
+        buf.append(_parse_rows(rows, len(variables)))
+    
+    log_dict = {'HEADER' : header,
+                'PARTITION' : partition,
+                'RESIDUALS' : dict((var, buf.column(i).copy()) for i, var in enumerate(variables)) if variables else {},
+                'PERFORMANCE' : _parse_performance_lines(perf_lines[1:]),
+                'SUCCESS' : success}
+    return log_dict
+
+def _read_history_header(fp, file_extension):
+    """Reads the variable names from the header of a SU2 history file
+    
+    Keyword arguments:
+    fp -- file object opened in binary mode, positioned at the start of the file
+    file_extension -- ".dat" for tecplot history files or ".csv" for csv history files
+    
+    Return value:
+    variables -- list of variable names, None if the header is not complete yet
+    nlines -- number of header lines. fp is positioned right after the header.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    nlines = 0
+    line = fp.readline()
+    nlines += 1
+    
+    # tecplot history files: VARIABLES = ..., where the list can be on the next line
+    if file_extension == ".dat":
+        if not line.endswith(b'\n'):
+            return None, nlines
+        line = line.decode('utf-8').split('=',1)[-1]
+        if '\\' in line:
+            line = fp.readline()
+            nlines += 1
+            if not line.endswith(b'\n'):
+                return None, nlines
+            line = line.decode('utf-8')
+        variables = [ var.strip().strip("\"") for var in line.split(",")]
+    
+    # csv history files: optional comment lines followed by the variable list
+    else:
+        while line.lstrip().startswith(b'#') and line.endswith(b'\n'):
+            line = fp.readline()
+            nlines += 1
+        if not line.endswith(b'\n'):
+            return None, nlines
+        variables = [i.strip().strip('\"') for i in line.decode('utf-8').split(",")]
+    
+    return variables, nlines
+
+def read_history_header(filename=''):
+    """Reads only the variable names from the header of a SU2 history file
+    
+    Keyword arguments:
+    filename -- Name of history file (.dat or .csv)
+    
+    Return value:
+    variables -- list of variable names, empty if the header is not complete yet
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    assert filename, "Please pass filename as an argument to the function"
+    with open(filename, 'rb') as fp:
+        variables, nlines = _read_history_header(fp, os.path.splitext(filename)[1])
+    return variables or []
+
+# Default location and size limit of the binary history cache
+HISTORY_CACHE_DIR = os.environ.get('IO_SU2_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'io_su2'))
+HISTORY_CACHE_MAX_BYTES = 2*1024**3
+
+def _history_cache_paths(filename, cache_dir=None):
+    """Returns the names of the binary data and metadata files of the cache entry for filename"""
+    cache_dir = os.path.join(cache_dir or HISTORY_CACHE_DIR, 'history')
+    key = hashlib.sha1(os.path.abspath(filename).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, key + '.npy'), os.path.join(cache_dir, key + '.json')
+
+def _history_cache_load(filename, cache_dir=None):
+    """Returns the cached history data of filename as memory-mapped arrays, or None 
+    if there is no valid cache entry. Stale entries are removed."""
+    
+    data_file, meta_file = _history_cache_paths(filename, cache_dir)
+    try:
+        with open(meta_file) as fp:
+            meta = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    stat = os.stat(filename)
+    if meta.get('path') != os.path.abspath(filename) or \
+       (meta.get('size'), meta.get('mtime_ns')) != (stat.st_size, stat.st_mtime_ns):
+        invalidate_history_cache(filename, cache_dir)
+        return None
+    try:
+        # copy-on-write memory map, the arrays can be modified without touching the cache
+        hist_data = np.load(data_file, mmap_mode='c')
+        os.utime(data_file)
+    except (OSError, ValueError):
+        return None
+    
+    data_dict = {}
+    for i,variable in enumerate(meta['variables']):
+        data_dict[variable] = hist_data[i]
+    return data_dict
+
+def _history_cache_store(filename, data_dict, stat, cache_dir=None, max_bytes=None):
+    """Writes history data to the cache and evicts old entries if the cache is too large.
+    stat is the os.stat of the history file taken before it was parsed. Nothing is stored
+    if the file changed while it was parsed, e.g. a history file of a running case."""
+    
+    data_file, meta_file = _history_cache_paths(filename, cache_dir)
+    after = os.stat(filename)
+    if (after.st_size, after.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+        return
+    meta = {'path' : os.path.abspath(filename),
+            'size' : stat.st_size,
+            'mtime_ns' : stat.st_mtime_ns,
+            'variables' : list(data_dict.keys())}
+    try:
+        os.makedirs(os.path.dirname(data_file), exist_ok=True)
+        tmp = '.' + str(os.getpid()) + '.tmp'
+        np.save(data_file + tmp, np.asarray(list(data_dict.values())), allow_pickle=False)
+        os.replace(data_file + tmp + '.npy', data_file)
+        with open(meta_file + tmp, 'w') as fp:
+            json.dump(meta, fp)
+        os.replace(meta_file + tmp, meta_file)
+    except OSError:
+        return
+    _history_cache_evict(os.path.dirname(data_file), max_bytes)
+
+def _history_cache_evict(cache_dir, max_bytes=None):
+    """Removes the least recently used entries until the cache is smaller than max_bytes"""
+    
+    if max_bytes is None:
+        max_bytes = HISTORY_CACHE_MAX_BYTES
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith('.npy'):
+            continue
+        try:
+            stat = os.stat(os.path.join(cache_dir, name))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name[:-4]))
+        total += stat.st_size
+    
+    for mtime, size, key in sorted(entries):
+        if total <= max_bytes:
+            break
+        for ext in ['.npy', '.json']:
+            try:
+                os.remove(os.path.join(cache_dir, key + ext))
+            except OSError:
+                pass
+        total -= size
+
+def invalidate_history_cache(filename=None, cache_dir=None):
+    """Removes cached history data
+    
+    Keyword arguments:
+    filename -- Name of history file whose cache entry is removed. If None, the whole
+                history cache is cleared (default None)
+    cache_dir -- Cache directory (default HISTORY_CACHE_DIR)
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    if filename is None:
+        history_dir = os.path.join(cache_dir or HISTORY_CACHE_DIR, 'history')
+        files = [os.path.join(history_dir, f) for f in os.listdir(history_dir)] if os.path.isdir(history_dir) else []
+    else:
+        files = _history_cache_paths(filename, cache_dir)
+    for f in files:
+        try:
+            os.remove(f)
+        except OSError:
+            pass
+
+@instrumented
+def read_history_data(filename='', cache=False, cache_dir=None, cache_max_bytes=None):
     """Goes through a provided SU2 history file and sorts data into a dictionary
     
     Keyword arguments:
     filename -- Name of history file.
+    cache -- If True, keep a binary copy of the data in the cache directory and load 
+             from it on later calls, as long as the size and modification time of the 
+             history file have not changed (default False)
+    cache_dir -- Cache directory (default HISTORY_CACHE_DIR, set by the environment 
+                 variable IO_SU2_CACHE_DIR or ~/.cache/io_su2)
+    cache_max_bytes -- Size limit of the cache, least recently used entries are removed
+                       when it is exceeded (default HISTORY_CACHE_MAX_BYTES)
     
     Return value:
     data_dict -- Dictionary containing history data with variable names as keys and
                  a numpy array as its corresponding values 
     
+    When loaded from the cache, the arrays are copy-on-write memory maps of the cached
+    .npy file, so no data is copied or converted. Use invalidate_history_cache to remove
+    entries explicitly.
+    
     Author: Jayant Mukhopadhaya
-    Last updated: 08/12/2020"""
+    Last updated: 10/18/2026"""
     
     assert filename, "Please pass filename as an argument to the function"
     
     file_name, file_extension = os.path.splitext(filename)
     
+    if cache and file_extension in [".dat", ".csv"]:
+        data_dict = _history_cache_load(filename, cache_dir)
+        if data_dict is not None:
+            return data_dict
+        # the cache key is taken before parsing, so rows appended while the file is
+        # parsed are never stored under the key of the longer file
+        stat = os.stat(filename)
+    
     # if tecplot file, use tecplot reader
     if file_extension == ".dat":
         data_dict = tecplot_history_reader(filename)
         
         # for the history data, return dictionary corresponding to the first zone
         # data_dict = list(data.values())[0]
-        return data_dict
     
     # if csv file, use csv reader
     elif file_extension == ".csv":
         data_dict = csv_reader(filename)
-        return data_dict
     
     # invalid file extension
     else:
         print("This function can only read tabular tecplot or csv data")
         return 0
+    
+    if cache:
+        _history_cache_store(filename, data_dict, stat, cache_dir, cache_max_bytes)
+    return data_dict
         
+@instrumented
 def csv_reader(filename=''):
     """Reads csv file and organizes data into a dictionary and numpy arrays
     
@@ -277,19 +1107,9 @@ def csv_reader(filename=''):
     Author: Jayant Mukhopadhaya
     Last updated: 08/12/2020"""
     data_dict = {}
-    skip = 0
-    with open(filename) as fp:
-        line = fp.readline()
-        # Check for comments
-        if '#' in line:
-            line_parts = line.split('#')
-            if not line_parts[0]:
-                skip += 1
-                line = fp.readline()
-        # Read variable list
-        else:
-            variables = [i.strip().strip('\""') for i in line.split(",")]
-            skip+=1
+    with open(filename, 'rb') as fp:
+        # Read variable list, skipping any comment lines
+        variables, skip = _read_history_header(fp, ".csv")
             
     # load data into a numpy array
     hist_data = np.loadtxt(filename, delimiter=',',skiprows=skip, unpack=True)
@@ -300,12 +1120,247 @@ def csv_reader(filename=''):
     
     return data_dict
     
-def tecplot_reader(filename=''):
+class _ColumnBuffer:
+    """Growable columnar buffer used by the readers to avoid calling np.append per value.
+    
+    Data is stored as a (ncols, capacity) array so that every column is contiguous.
+    Capacity is doubled whenever a block of rows does not fit, so appending n rows
+    costs amortized O(n).
+    
+    Keyword arguments:
+    ncols -- number of columns
+    capacity -- initial number of rows to preallocate (default 1024)
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    def __init__(self, ncols, capacity=1024):
+        self.ncols = ncols
+        self.size = 0
+        self._data = np.empty((ncols, max(int(capacity),1)))
+
+    def reserve(self, capacity):
+        """Make sure the buffer can hold at least capacity rows"""
+        if capacity > self._data.shape[1]:
+            new_data = np.empty((self.ncols, capacity))
+            new_data[:, :self.size] = self._data[:, :self.size]
+            self._data = new_data
+
+    def append(self, block):
+        """Append a (nrows, ncols) block of values"""
+        nrows = block.shape[0]
+        if self.size + nrows > self._data.shape[1]:
+            self.reserve(max(2*self._data.shape[1], self.size + nrows))
+        self._data[:, self.size:self.size + nrows] = block.T
+        self.size += nrows
+
+    def column(self, i):
+        """Returns a view of the filled part of column i"""
+        return self._data[i, :self.size]
+
+    def row(self, i):
+        """Returns a view of row i"""
+        return self._data[:, i]
+
+def _parse_rows(lines, ncols):
+    """Converts a list of comma- or space-delimited text rows into a (nrows, ncols) array.
+    
+    All rows are tokenized and converted in a single call. Rows that are shorter than ncols
+    are padded with NaN, rows that are longer raise a ValueError.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    tokens = " ".join(lines).replace(',', ' ').split()
+    if len(tokens) == ncols*len(lines):
+        return np.array(tokens, dtype=float).reshape(len(lines), ncols)
+    
+    # ragged rows, fall back to converting row by row
+    block = np.full((len(lines), ncols), np.nan)
+    for i, line in enumerate(lines):
+        vals = line.replace(',', ' ').split()
+        if len(vals) > ncols:
+            raise ValueError("Row has more values than variables: " + line.strip())
+        block[i, :len(vals)] = [float(val) for val in vals]
+    return block
+
+def _parse_zone_header(line):
+    """Extracts the zone name and the number of points from a tecplot ZONE line.
+    
+    The name is taken from T="..." if present, otherwise an empty string is returned when
+    the line only holds counts. The point count is the product of the I=, J=, K= values,
+    or N= for finite element zones. None if no count is given.
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    # look for counts outside of quoted strings
+    counts = dict((key.upper(), int(val)) for key, val in
+                  re.findall(r'\b([IJKN])\s*=\s*(\d+)', re.sub(r'"[^"]*"', '', line), re.IGNORECASE))
+    
+    title = re.search(r'\bT\s*=\s*"([^"]*)"', line, re.IGNORECASE)
+    if title:
+        zone_name = title.group(1)
+    elif '=' in line and not counts:
+        zone_name = line.split("=",1)[1].strip().strip("\"")
+    else:
+        zone_name = ''
+    if 'N' in counts:
+        npts = counts['N']
+    elif 'I' in counts:
+        npts = counts['I']*counts.get('J',1)*counts.get('K',1)
+    else:
+        npts = None
+    return zone_name, npts
+
+class HistoryFollower:
+    """Incrementally reads a SU2 history file (.csv or .dat) that is still being written.
+    
+    The follower remembers the byte offset of the last complete row it has parsed. Every
+    call to update() only reads and converts the rows appended since the previous call, 
+    and stores them in growable column buffers, so polling a long running case costs 
+    time proportional to the new data rather than to the length of the file.
+    
+    The follower starts over when the file was rewritten, e.g. when a case is restarted.
+    This is detected from the inode, the header and the bytes of the last rows that were
+    parsed, so a new file that already grew past the old offset is detected as well.
+    
+    Keyword arguments:
+    filename -- Name of history file.
+    capacity -- Number of rows to preallocate (default 1024)
+    
+    Usage:
+    follower = HistoryFollower('history.csv')
+    follower.update()                   # parse new rows, returns the number of new rows
+    follower.data['CD']                 # numpy array with all rows read so far
+    for row in follower.new_rows():     # dictionaries with the rows added since last call
+        ...
+    for row in follower.follow(interval=5.0, timeout=600):
+        ...                             # blocks and yields rows as they are written
+    follower.rewrites                   # number of times the file was truncated or rewritten
+                                        # and the follower started over
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    def __init__(self, filename='', capacity=1024):
+        assert filename, "Please pass filename as an argument to the function"
+        self.filename = filename
+        self.file_extension = os.path.splitext(filename)[1]
+        assert self.file_extension in [".dat", ".csv"], "This function can only read tabular tecplot or csv data"
+        self.capacity = capacity
+        self.rewrites = 0
+        self.reset()
+    
+    def reset(self):
+        """Forget everything that has been read, the next update starts from the beginning"""
+        self.variables = None
+        self.offset = 0
+        self._buffer = None
+        self._inode = None
+        self._header = None
+        self._tail = None
+        
+    def __len__(self):
+        return self._buffer.size if self._buffer is not None else 0
+        
+    @property
+    def data(self):
+        """Dictionary with variable names as keys and numpy arrays (views) with all rows read so far"""
+        if self._buffer is None:
+            return {}
+        return dict((var, self._buffer.column(i)) for i, var in enumerate(self.variables))
+    
+    def update(self):
+        """Parses the complete rows appended to the file since the last call.
+        
+        Return value:
+        nrows -- number of new rows"""
+        
+        if not os.path.isfile(self.filename):
+            return 0
+        with open(self.filename, 'rb') as fp:
+            # file was truncated or rewritten, e.g. when a case is restarted
+            if self.variables is not None and self._rewritten(fp):
+                self.reset()
+                self.rewrites += 1
+            
+            if self.variables is None:
+                fp.seek(0)
+                variables, nlines = _read_history_header(fp, self.file_extension)
+                if variables is None:
+                    return 0
+                self.variables = variables
+                self.offset = fp.tell()
+                self._buffer = _ColumnBuffer(len(variables), self.capacity)
+                self._inode = os.fstat(fp.fileno()).st_ino
+                fp.seek(0)
+                self._header = fp.read(self.offset)
+                self._tail = self._header[-1:]
+            
+            fp.seek(self.offset)
+            chunk = fp.read()
+        
+        # only parse complete lines, a partially written row is picked up on the next call
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return 0
+        self.offset += end
+        self._tail = chunk[max(end - 256, 0):end]
+        lines = [line for line in chunk[:end].decode('utf-8').splitlines() if line.strip()]
+        if not lines:
+            return 0
+        self._buffer.append(_parse_rows(lines, len(self.variables)))
+        return len(lines)
+    
+    def _rewritten(self, fp):
+        """True if the file is not the one the rows so far were read from. The modification
+        time is not used, it changes with every row that is appended."""
+        stat = os.fstat(fp.fileno())
+        if stat.st_ino != self._inode or stat.st_size < self.offset:
+            return True
+        fp.seek(0)
+        if fp.read(len(self._header)) != self._header:
+            return True
+        # the bytes before the offset end with a newline and are the last rows parsed
+        fp.seek(self.offset - len(self._tail))
+        return fp.read(len(self._tail)) != self._tail
+    
+    def new_rows(self):
+        """Generator of the rows added since the last call, as dictionaries {variable : value}"""
+        start = len(self)
+        self.update()
+        for i in range(start, len(self)):
+            row = self._buffer.row(i)
+            yield dict((var, row[j]) for j, var in enumerate(self.variables))
+    
+    def follow(self, interval=1.0, timeout=None):
+        """Generator that keeps polling the file and yields new rows as they are written.
+        
+        Keyword arguments:
+        interval -- time in seconds between polls (default 1.0)
+        timeout -- stop after this many seconds without new rows. None polls forever (default None)"""
+        
+        last_row = time.time()
+        while True:
+            received = False
+            for row in self.new_rows():
+                received = True
+                yield row
+            if received:
+                last_row = time.time()
+            elif timeout is not None and time.time() - last_row > timeout:
+                return
+            time.sleep(interval)
+
+@instrumented
+def tecplot_reader(filename='', chunk_size=8192):
     """ASCII Tecplot reader for multiple zones. Only deals with tabular data.
     Handles tecplot files with multiple zones of tabular data.
     
     Keyword arguments:
     filename -- Name of tecplot file.
+    chunk_size -- Number of data rows that are tokenized and converted at a time (default 8192)
     
     Return value:
     data -- Dictionary containing extracted data. Organized as:
@@ -325,22 +1380,59 @@ def tecplot_reader(filename=''):
     
     Useful to read V&V files from the NASA TMR website.
     
+    The file is read in a single pass. Data rows of a zone are collected in chunks and
+    converted in bulk into a preallocated columnar buffer, so the load time grows linearly
+    with the size of the file. If the ZONE line defines I=/J=/K= or N=, the buffer is 
+    allocated to that size up front and any rows after the count (e.g. finite element 
+    connectivity) are ignored.
+    
     Author: Jayant Mukhopadhaya
-    Last updated: 08/12/2020"""
+    Last updated: 10/18/2026"""
     
     assert filename, "Please pass filename as an argument to the function"
 
     data = {}
+    zones = {}
+    zone_vars = {}
+    variables = []
+    zone_name = None
+    npts = None
+    pending = []
+    
+    def flush():
+        # convert pending rows of the current zone and add them to its buffer
+        if not pending:
+            return
+        buf = zones[zone_name]
+        if buf is None:
+            # number of columns is set by the first row, variables without values stay empty
+            ncols = len(pending[0].replace(',', ' ').split())
+            if zone_vars[zone_name] and ncols > len(zone_vars[zone_name]):
+                raise ValueError("Row has more values than variables: " + pending[0].strip())
+            buf = _ColumnBuffer(ncols, npts if npts else max(len(pending), 1024))
+            zones[zone_name] = buf
+        rows = pending
+        if npts is not None:
+            rows = rows[:max(npts - buf.size, 0)]
+        if rows:
+            buf.append(_parse_rows(rows, buf.ncols))
+        del pending[:]
+        
+    def new_zone(name):
+        # register an empty zone so that zones without data are still returned
+        data[name] = {}
+        zones[name] = None
+        zone_vars[name] = variables
+        if variables:
+            for var in variables:
+                data[name][var] = np.empty(0)
+        
     with open(filename, 'r') as a:
-        variables = []
-        lines = a.readlines()
-        for idx, line in enumerate(lines):
+        for line in a:
             
             # Ignore any comment line
             if "#" in line:
-                line = line.split("#")[0]
-                if not line:
-                    continue
+                continue
                     
             # skip title line if there is one
             elif "title" in line.lower():
@@ -348,59 +1440,52 @@ def tecplot_reader(filename=''):
             
             # If its a list of variables, read the list
             elif "variable" in line.lower():
+                flush()
                 line = line.split('=',1)[1]
                 if '\\' in line:
-                    line = lines[idx+1]
-                variables = [ var.strip().strip("\"") for var in line.split(",")]
+                    line = next(a, '')
+                if ',' in line or not '"' in line:
+                    variables = [ var.strip().strip("\"") for var in line.split(",")]
+                else:
+                    variables = re.findall(r'"([^"]*)"', line)
+                variables = [var for var in variables if var]
                 continue
             
             # Check to see if there is a new zone definition
             elif "zone" in line.lower():
-                # extract zone name
-                zone_name = line.split("=",1)[1].strip()
-                zone_name = zone_name.strip("\"")
-                data[zone_name] = {}
-                
-                # if variable names are defined, assign an empty numpy array to that variable
-                if variables:
-                    for var in variables:
-                        data[zone_name][var] = np.empty(0)
+                flush()
+                zone_name, npts = _parse_zone_header(line)
+                if not zone_name:
+                    zone_name = 'ZONE' + str(len(data))
+                new_zone(zone_name)
                 continue
             
-            # Sort data out into the different variables
+            # Collect data rows, these are converted in bulk when flushed
             else:
-                if '"' in line:
+                if '"' in line or not line.strip():
                     continue
                 # if there is no zone defined, create a dummy zone named ZONE0
-                if not 'zone_name' in locals():
+                if zone_name is None:
                     zone_name = 'ZONE0'
-                    data[zone_name] = {}
-                
-                    # if variable names are defined, assign an empty numpy array to that variable
-                    if variables:
-                        for var in variables:
-                            data[zone_name][var] = np.empty(0)
-
-                # if comma-delimited, seperate accordingly
-                if ',' in line:
-                    line_list= [val.strip() for val in line.split(',')]
-                
-                # else this is space-delimited
-                else: 
-                    line_list = line.split()
-                
-                for i,val in enumerate(line_list):
-                    if variables:
-                        data[zone_name][variables[i]] = np.append(data[zone_name][variables[i]],float(val))
-                    
-                    # if there aren't any variables defined, name them var# according to order of appearance
-                    else:
-                        if not data[zone_name]:
-                            for j in range(0,len(line.split())):
-                                data[zone_name]['var'+str(j)] = np.empty(0)
-                        data[zone_name]['var'+str(i)] = np.append(data[zone_name]['var'+str(i)],float(val))
+                    new_zone(zone_name)
+                pending.append(line)
+                if len(pending) >= chunk_size:
+                    flush()
+        flush()
+    
+    # organize the dictionary
+    for name, buf in zones.items():
+        if buf is None:
+            continue
+        names = zone_vars[name]
+        # if there aren't any variables defined, name them var# according to order of appearance
+        if not names:
+            names = ['var'+str(j) for j in range(buf.ncols)]
+        for i, var in enumerate(names[:buf.ncols]):
+            data[name][var] = buf.column(i)
     return data
 
+@instrumented
 def tecplot_history_reader(filename=''):
     """ASCII Tecplot reader for multiple zones. Only deals with tabular data.
     Handles tecplot files with multiple zones of tabular data.
@@ -432,13 +1517,10 @@ def tecplot_history_reader(filename=''):
     assert filename, "Please pass filename as an argument to the function"
 
     data_dict = {}
-    with open(filename, 'r') as a:
-        variables = []
-        line = a.readline()
-        line = a.readline()
-        variables = [ var.strip().strip("\"") for var in line.split(",")]
+    with open(filename, 'rb') as a:
+        variables, skip = _read_history_header(a, ".dat")
     # load data into a numpy array
-    hist_data = np.loadtxt(filename, delimiter=',',skiprows=2, unpack=True)
+    hist_data = np.loadtxt(filename, delimiter=',',skiprows=skip, unpack=True)
     
     # organize the dictionary
     for i,variable in enumerate(variables):
@@ -446,6 +1528,7 @@ def tecplot_history_reader(filename=''):
     
     return data_dict
 
+@instrumented
 def read_constraints(filename='config.cfg'):
     """Goes through a provided SU2 configuration file and extracts constraint data
     
@@ -501,6 +1584,7 @@ def read_constraints(filename='config.cfg'):
             line=fp.readline()
     return constraint_dict
 
+@instrumented
 def geo_locations(filename='config.cfg'):
     """Goes through a provided SU2 configuration file and extracts geometry evaluation locations
     
@@ -560,89 +1644,117 @@ def organize_airfoil_data(x,z):
     1) The coordinates are sorted using x-coordinates
     2) Initial upper and lower surfaces are sorted using the first z value. If a 
        coordinate is > z[0] then it goes into the upper surface, and vice-versa
-    3) The surface with more points is iterated through. Distance of each point
-       is checked against the last point in the upper and lower surface arrays.
-       If the point is closer to the last point in the lower surface, the point is
-       moved to the lower surface array. 
+    3) The points of the surface that extends further aft, beyond the last point of
+       the other surface, are walked in order. If a point is closer in z to the last
+       point of the other surface than to the last point kept in its own surface, it
+       is moved to the other surface.
+    
+    See organize_airfoil_data_batch, which this function calls for a single section.
  
     Author: Jayant Mukhopadhaya
-    Last updated: 08/12/2020"""
-    
-    # create numpy array with custom dtypes
-    coords= np.zeros(x.size, dtype={'names':('x', 'z'),
-                          'formats':(x.dtype,z.dtype)})
-    coords['x'] = x
-    coords['z'] = z
+    Last updated: 10/18/2026"""
     
-    # sort according to x coordinate
-    coords=np.sort(coords,order='x')
-    
-    # split coordinates into upper and lower arrays according to the first z-coordinate
-    upper = coords[coords['z'] >= coords['z'][0]]
-    lower = coords[coords['z'] < coords['z'][0]]
+    data = organize_airfoil_data_batch(x, z, [0, np.size(x)])
+    return data['UPPER'][0], data['LOWER'][0]
 
-    inds_to_delete = np.array([],dtype=np.int16)
-    last_ind = 0
+def organize_airfoil_data_batch(x, z, offsets):
+    """Organizes the coordinates of many airfoil sections into upper and lower surfaces
     
-    # determine which surface has more points that might need to be moved to other surface
-    if upper['x'][-1] < lower['x'][-1]:
+    Gives the same surfaces as organize_airfoil_data for every section. All sections
+    are sorted with a single lexsort and the initial split is vectorized, so only the
+    points aft of the end of the shorter surface, usually a few near the trailing
+    edge, are walked one at a time. Nothing is appended inside the walk.
     
-        # lower surface has more points, so iterate through each of those coordinates
-        for i,coord in enumerate(lower):
-        
-            # determine last points in the sorted surfaces
-            last_upper = upper[-1]
-            last_lower = lower[last_ind]
-            
-            # if the current coordinate is further past the last sorted upper point, find distances
-            if coord['x'] >= last_upper['x']:
-                dist_to_lower = pow(pow(coord['x'] - last_lower['x'],2) + pow(coord['z'] - last_lower['z'],2),.5)
-                dist_to_upper = pow(pow(coord['x'] - last_upper['x'],2) + pow(coord['z'] - last_upper['z'],2),.5)
-                dist_to_lower = abs(coord['z'] - last_lower['z'])
-                dist_to_upper = abs(coord['z'] - last_upper['z'])
-                
-                # if point is closer to the upper surface, append it to the upper array
-                if dist_to_upper < dist_to_lower:
-                    upper = np.append(upper, coord)
-                    inds_to_delete = np.append(inds_to_delete,i)
-                    
-                # if closer to lower surface, update last_ind for sorted lower surface
-                else:
-                    last_ind = i    
-            else:
-                last_ind = i
-                
-        # purge any coordinates that were moved
-        lower = np.delete(lower,inds_to_delete)
-
-    else:
+    Keyword arguments:
+    x -- flat numpy array with the x-coordinates of all sections
+    z -- flat numpy array with the z-coordinates of all sections
+    offsets -- array of size nsections+1, the points of section i are x[offsets[i]:offsets[i+1]]
     
-        # upper surface has more points, so iterate through each of those coordinates
-        for i,coord in enumerate(upper):
-        
-            # determine last points in the sorted surfaces
-            last_lower = lower[-1]
-            last_upper = upper[last_ind]
-            
-            # if the current coordinate is further past the last sorted lower point, find distances
-            if coord['x'] >= last_lower['x']:
-                dist_to_lower = pow(pow(coord['x'] - last_lower['x'],2) + pow(coord['z'] - last_lower['z'],2),.5)
-                dist_to_upper = pow(pow(coord['x'] - last_upper['x'],2) + pow(coord['z'] - last_upper['z'],2),.5)
-                dist_to_lower = abs(coord['z'] - last_lower['z'])
-                dist_to_upper = abs(coord['z'] - last_upper['z'])
-
-                # if point is closer to the lower surface, append it to the lower array
-                if dist_to_lower < dist_to_upper:
-                    lower = np.append(lower, coord)
-                    inds_to_delete = np.append(inds_to_delete,i)
-                
-                # if closer to upper surface, update last_ind for sorted upper surface
-                else:
-                    last_ind = i    
-            else:
-                last_ind = i
-        
-        # purge any coordinates that were moved
-        upper = np.delete(upper,inds_to_delete)
-
-    return upper,lower
+    Return value:
+    data -- Dictionary organized as:
+    data = {    'UPPER' : list with the upper surface of every section, views of UPPER_ALL,
+                'LOWER' : list with the lower surface of every section, views of LOWER_ALL,
+                'UPPER_ALL' : numpy array with the upper surfaces of all sections using 
+                              custom dtypes, keys are 'x' and 'z',
+                'UPPER_OFFSETS' : array of size nsections+1 with the start of every 
+                                  section in UPPER_ALL,
+                'LOWER_ALL' : same as UPPER_ALL for the lower surfaces,
+                'LOWER_OFFSETS' : same as UPPER_OFFSETS for the lower surfaces }
+    
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+    
+    x = np.asarray(x)
+    z = np.asarray(z)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    nsec = offsets.size - 1
+    counts = np.diff(offsets)
+    section = np.repeat(np.arange(nsec), counts)
+    
+    # sort every section by x, then z, like numpy.sort with order='x'
+    order = np.lexsort((z, x, section))
+    xs = x[order]
+    zs = z[order]
+    
+    # initial split with the z value of the first point of every section
+    first = offsets[:-1]
+    nonempty = counts > 0
+    z0 = np.zeros(nsec, dtype=zs.dtype)
+    z0[nonempty] = zs[first[nonempty]]
+    is_upper = zs >= z0[section]
+    
+    # last point of each surface, the sorted positions of the upper and lower points
+    position = np.arange(xs.size)
+    last_upper = np.full(nsec, -1)
+    last_lower = np.full(nsec, -1)
+    np.maximum.at(last_upper, section[is_upper], position[is_upper])
+    np.maximum.at(last_lower, section[~is_upper], position[~is_upper])
+    
+    # the surface with the later last point is walked from the end of the other surface on
+    both = (last_upper >= 0) & (last_lower >= 0)
+    walk_upper = ~(xs[last_upper] < xs[last_lower])
+    other_end = np.where(walk_upper, last_lower, last_upper)
+    own = is_upper == walk_upper[section]
+    tail = own & both[section] & (xs >= xs[other_end][section])
+    prev_own = np.maximum.accumulate(np.where(own, position, -1))
+    
+    moved = np.zeros(xs.size, dtype=bool)
+    current = -1
+    for j in np.nonzero(tail)[0].tolist():
+        i = section[j]
+        if i != current:
+            # z of the last point of the other surface and the last point kept in this one
+            current = i
+            z_other = zs[other_end[i]]
+            k = prev_own[j - 1] if j > first[i] else -1
+            z_own = zs[k] if k >= first[i] else zs[j]
+        if abs(zs[j] - z_other) < abs(zs[j] - z_own):
+            moved[j] = True
+            z_other = zs[j]
+        else:
+            z_own = zs[j]
+    
+    # moved points are placed after the points of the surface they were moved to
+    final_upper = is_upper != moved
+    rank = position + moved*xs.size
+    final = np.lexsort((rank, ~final_upper, section))
+    
+    coords = np.zeros(xs.size, dtype={'names':('x', 'z'), 'formats':(x.dtype,z.dtype)})
+    coords['x'] = xs[final]
+    coords['z'] = zs[final]
+    upper_all = coords[final_upper[final]]
+    lower_all = coords[~final_upper[final]]
+    
+    nupper = np.bincount(section[final_upper], minlength=nsec)
+    upper_offsets = np.zeros(nsec + 1, dtype=np.int64)
+    np.cumsum(nupper, out=upper_offsets[1:])
+    lower_offsets = np.zeros(nsec + 1, dtype=np.int64)
+    np.cumsum(counts - nupper, out=lower_offsets[1:])
+    
+    data = {'UPPER' : [upper_all[upper_offsets[i]:upper_offsets[i+1]] for i in range(nsec)],
+            'LOWER' : [lower_all[lower_offsets[i]:lower_offsets[i+1]] for i in range(nsec)],
+            'UPPER_ALL' : upper_all,
+            'UPPER_OFFSETS' : upper_offsets,
+            'LOWER_ALL' : lower_all,
+            'LOWER_OFFSETS' : lower_offsets}
+    return data
@@ -0,0 +1,275 @@
+import numpy as np
+import atexit
+import functools
+import json
+import os
+import sys
+try:
+    import resource
+except ImportError:
+    resource = None
+import threading
+import time
+
+# True while at least one Profile is collecting. Instrumented readers only check
+# this flag when profiling is off.
+_ENABLED = False
+_PROFILES = []
+_LOCAL = threading.local()
+
+def _io_counters():
+    """I/O counters of the process so far: bytes fetched from storage, including the pages
+    of memory mapped files, bytes returned by read system calls, and major page faults.
+    Counters that are not available are None.
+
+    The storage bytes come from /proc/self/io on Linux, elsewhere from the blocks read
+    in getrusage. Bytes served from the page cache are not fetched from storage."""
+    counters = {'read_bytes' : None, 'read_chars' : None, 'major_faults' : None}
+    try:
+        with open('/proc/self/io', 'rb') as f:
+            for line in f:
+                if line.startswith(b'rchar:'):
+                    counters['read_chars'] = int(line.split()[1])
+                elif line.startswith(b'read_bytes:'):
+                    counters['read_bytes'] = int(line.split()[1])
+    except OSError:
+        pass
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        counters['major_faults'] = usage.ru_majflt
+        if counters['read_bytes'] is None:
+            counters['read_bytes'] = 512*usage.ru_inblock
+    return counters
+
+def _file_bytes(args, kwargs):
+    """Name and size of the file a reader was called with"""
+    filename = kwargs.get('filename', args[0] if args else None)
+    if isinstance(filename, str) and os.path.isfile(filename):
+        return filename, os.path.getsize(filename)
+    return filename if isinstance(filename, str) else None, None
+
+def _result_stats(result, depth=3):
+    """Number of rows, number of arrays and bytes of the arrays in the result of a reader.
+
+    Views are counted once with the array that owns the data. Memory mapped data is not
+    counted, it is not allocated by the reader."""
+    owners = {}
+    rows = 0
+    stack = [(result, 0)]
+    while stack:
+        value, level = stack.pop()
+        if isinstance(value, np.ndarray):
+            rows = max(rows, value.shape[0] if value.ndim else 1)
+            owner = value
+            while isinstance(owner.base, np.ndarray):
+                owner = owner.base
+            if owner.base is None and not isinstance(owner, np.memmap):
+                owners[id(owner)] = owner.nbytes
+        elif level < depth and isinstance(value, dict):
+            stack.extend((item, level + 1) for item in value.values())
+        elif level < depth and isinstance(value, (list, tuple)):
+            if value and not isinstance(value[0], (dict, list, tuple, np.ndarray)):
+                rows = max(rows, len(value))
+            else:
+                stack.extend((item, level + 1) for item in value)
+    return rows, len(owners), sum(owners.values())
+
+def instrumented(func):
+    """Decorator that records calls of a reader while profiling is on"""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _ENABLED:
+            return func(*args, **kwargs)
+        return _profiled_call(func, name, args, kwargs)
+    return wrapper
+
+def _profiled_call(func, name, args, kwargs):
+    """Calls func and records an event with all active profiles"""
+    stack = getattr(_LOCAL, 'stack', None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    filename, file_bytes = _file_bytes(args, kwargs)
+    counters = _io_counters()
+    frame = [0.0]
+    stack.append(frame)
+    error = None
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+        return result
+    except BaseException as e:
+        result = None
+        error = type(e).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        stack.pop()
+        if stack:
+            # time spent in this call is not self time of the caller
+            stack[-1][0] += duration
+        end_counters = _io_counters()
+        io = dict((key, None if counters[key] is None or end_counters[key] is None
+                   else end_counters[key] - counters[key]) for key in counters)
+        rows, arrays, array_bytes = _result_stats(result)
+        event = {'name' : name,
+                 'start' : start,
+                 'duration' : duration,
+                 'self' : duration - frame[0],
+                 'depth' : len(stack),
+                 'thread' : threading.get_ident(),
+                 'filename' : filename,
+                 'file_bytes' : file_bytes,
+                 'read_bytes' : io['read_bytes'],
+                 'read_chars' : io['read_chars'],
+                 'major_faults' : io['major_faults'],
+                 'rows' : rows,
+                 'arrays' : arrays,
+                 'array_bytes' : array_bytes,
+                 'error' : error}
+        for profile in list(_PROFILES):
+            profile._record(event)
+
+class Profile:
+    """Collects the calls of the instrumented io_su2 readers
+
+    Every call records the wall time (total and without the instrumented readers it
+    calls), the name and size of the file, the bytes fetched from storage, the bytes
+    returned by read system calls, the major page faults, the number of rows parsed
+    and the number and size of the numpy arrays that were returned.
+
+    The bytes fetched from storage include the pages of memory mapped files, which most
+    readers use, and are 0 when the file is already in the page cache. The bytes of read
+    system calls do not include memory mapped reads. Major page faults count the mapped
+    pages that had to be fetched from storage. All I/O counters are counted for the
+    whole process, so readers running in other threads at the same time are included.
+    The wall and self times include the I/O: they do not separate the time spent
+    waiting for the disk from parsing and the conversion to numpy arrays. Compare runs
+    with a cold and a warm page cache (see benchmarks/run_benchmarks.py) for that.
+
+    Readers run in other processes, e.g. by load_campaign, are not collected.
+    Profiling can also be switched on for a whole script with the environment variable
+    IO_SU2_PROFILE: 1 prints the report when the script ends, any other value is the
+    name of the Chrome trace file that is written when the script ends.
+
+    Usage:
+    with Profile() as prof:
+        load_campaign('.', processes=1)
+    print(prof.report())
+    prof.export_chrome_trace('trace.json')
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+        self.start = None
+        self.end = None
+
+    def __enter__(self):
+        global _ENABLED
+        self.start = time.perf_counter()
+        _PROFILES.append(self)
+        _ENABLED = True
+        return self
+
+    def __exit__(self, *exc):
+        global _ENABLED
+        self.end = time.perf_counter()
+        _PROFILES.remove(self)
+        _ENABLED = bool(_PROFILES)
+        return False
+
+    def _record(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def summary(self):
+        """Aggregates the events per reader
+
+        Return value:
+        data -- Dictionary organized as:
+        data = {    reader name : { 'calls' : number of calls,
+                                    'total' : wall time in seconds,
+                                    'self' : wall time without the instrumented readers it called,
+                                    'mean' : mean wall time per call,
+                                    'max' : longest call,
+                                    'file_bytes' : size of the files read,
+                                    'read_bytes' : bytes fetched from storage, including mapped pages,
+                                    'read_chars' : bytes returned by read system calls,
+                                    'major_faults' : mapped pages fetched from storage,
+                                    'rows' : rows parsed,
+                                    'arrays' : arrays returned,
+                                    'array_bytes' : bytes of the arrays returned,
+                                    'errors' : calls that raised an exception},
+                    ...}"""
+        data = {}
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            entry = data.setdefault(event['name'], {'calls' : 0, 'total' : 0.0, 'self' : 0.0, 'mean' : 0.0,
+                                                    'max' : 0.0, 'file_bytes' : 0, 'read_bytes' : 0,
+                                                    'read_chars' : 0, 'major_faults' : 0,
+                                                    'rows' : 0, 'arrays' : 0, 'array_bytes' : 0, 'errors' : 0})
+            entry['calls'] += 1
+            entry['total'] += event['duration']
+            entry['self'] += event['self']
+            entry['max'] = max(entry['max'], event['duration'])
+            for key in ['file_bytes', 'read_bytes', 'read_chars', 'major_faults', 'rows', 'arrays', 'array_bytes']:
+                entry[key] += event[key] or 0
+            entry['errors'] += event['error'] is not None
+        for entry in data.values():
+            entry['mean'] = entry['total']/entry['calls']
+        return data
+
+    def report(self, sort = 'total'):
+        """Returns the aggregated events as a table, sorted by the column sort (default 'total')"""
+        summary = self.summary()
+        lines = ['{:<28} {:>7} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10} {:>8} {:>10} {:>8} {:>10}'.format(
+                 'reader', 'calls', 'total (s)', 'self (s)', 'mean (ms)', 'file (MB)', 'disk (MB)',
+                 'read (MB)', 'majflt', 'rows', 'arrays', 'alloc (MB)')]
+        for name, entry in sorted(summary.items(), key=lambda item: -item[1][sort]):
+            lines.append('{:<28} {:>7d} {:>10.4f} {:>10.4f} {:>10.3f} {:>10.2f} {:>10.2f} {:>10.2f} {:>8d} {:>10d} {:>8d} {:>10.2f}'.format(
+                         name, entry['calls'], entry['total'], entry['self'], 1e3*entry['mean'],
+                         entry['file_bytes']/2**20, entry['read_bytes']/2**20, entry['read_chars']/2**20,
+                         entry['major_faults'], entry['rows'], entry['arrays'], entry['array_bytes']/2**20))
+        if self.start is not None:
+            end = self.end if self.end is not None else time.perf_counter()
+            lines.append('wall time of the profile: {:.4f} s'.format(end - self.start))
+        return '\n'.join(lines)
+
+    def export_chrome_trace(self, filename = 'io_su2_trace.json'):
+        """Writes the events in the Chrome trace event format, for chrome://tracing or Perfetto"""
+        origin = self.start if self.start is not None else 0.0
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+        trace = []
+        for event in events:
+            args = dict((key, event[key]) for key in ['filename', 'file_bytes', 'read_bytes', 'read_chars',
+                                                     'major_faults', 'rows', 'arrays', 'array_bytes', 'error']
+                        if event[key] is not None)
+            trace.append({'name' : event['name'], 'cat' : 'io_su2', 'ph' : 'X', 'pid' : pid,
+                          'tid' : event['thread'], 'ts' : 1e6*(event['start'] - origin),
+                          'dur' : 1e6*event['duration'], 'args' : args})
+        with open(filename, 'w') as fp:
+            json.dump({'traceEvents' : trace, 'displayTimeUnit' : 'ms'}, fp)
+
+def _profile_from_environment():
+    """Switches profiling on for the whole process if IO_SU2_PROFILE is set"""
+    setting = os.environ.get('IO_SU2_PROFILE', '')
+    if not setting or setting == '0':
+        return None
+    profile = Profile().__enter__()
+
+    def finish():
+        if setting.lower() in ['1', 'true', 'yes']:
+            sys.stderr.write(profile.report() + '\n')
+        else:
+            profile.export_chrome_trace(setting)
+    atexit.register(finish)
+    return profile
+
+ENVIRONMENT_PROFILE = _profile_from_environment()
@@ -0,0 +1,164 @@
+import numpy as np
+import os
+from io_su2.profiling import instrumented
+
+# First value of the header of SU2 binary restart files
+RESTART_MAGIC = 535532
+# Length of the field names in binary restart files (CGNS string size)
+RESTART_NAME_LENGTH = 33
+
+def _restart_header(filename):
+    """Reads and validates the header of a SU2 binary restart file.
+
+    Return value:
+    header -- numpy array with the 5 header values: magic number, number of fields,
+              number of points, number of integer and number of double meta data values
+    variables -- list with the field names
+    offset -- byte position of the start of the solution block
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    size = os.path.getsize(filename)
+    with open(filename, 'rb') as f:
+        header = np.fromfile(f, dtype='<i4', count=5)
+        if header.size < 5 or header[0] != RESTART_MAGIC:
+            raise ValueError(filename + " is not a SU2 binary restart file")
+        nfields, npoin, nint, ndouble = [int(val) for val in header[1:]]
+        if nfields <= 0 or npoin < 0 or nint < 0 or ndouble < 0:
+            raise ValueError("Invalid header in SU2 restart file " + filename + ": " + str(header.tolist()))
+        names = f.read(nfields*RESTART_NAME_LENGTH)
+
+    offset = 5*4 + nfields*RESTART_NAME_LENGTH
+    expected = offset + 8*npoin*nfields + 4*nint + 8*ndouble
+    if size < expected:
+        raise ValueError("SU2 restart file " + filename + " is truncated: " + str(size) +
+                         " bytes instead of " + str(expected))
+
+    variables = [names[i*RESTART_NAME_LENGTH:(i+1)*RESTART_NAME_LENGTH].split(b'\0')[0].decode('utf-8')
+                 for i in range(nfields)]
+    return header, variables, offset
+
+def is_binary_restart(filename):
+    """Returns True if filename starts with the SU2 binary restart header"""
+    with open(filename, 'rb') as f:
+        header = np.fromfile(f, dtype='<i4', count=1)
+    return header.size == 1 and header[0] == RESTART_MAGIC
+
+@instrumented
+def read_restart(filename = 'restart.dat', mode = 'r'):
+    """Reads a SU2 restart file, binary or ASCII (csv)
+
+    For binary files the solution block is not loaded, it is returned as a memory map
+    so that single fields or points of very large restarts can be read cheaply. ASCII
+    restarts are read into memory.
+
+    Keyword arguments:
+    filename -- Name of the restart file (default 'restart.dat')
+    mode -- numpy.memmap mode of the solution block of binary files: 'r' for read only,
+            'r+' to change the file in place, or 'c' for copy-on-write (default 'r')
+
+    Return value:
+    data -- Dictionary organized as:
+    data = {    'VARIABLES' : list of field names, e.g. ['x', 'y', 'Density', ...],
+                'DATA' : numpy.memmap (numpy array for ASCII files) of shape (NPOIN, NFIELDS),
+                'FIELDS' : { field name : view of the column of DATA, ...},
+                'NPOIN' : number of points,
+                'NFIELDS' : number of fields,
+                'FORMAT' : 'binary' or 'ascii',
+                'ITERATION' : integer meta data after the solution block (binary files),
+                'METADATA' : double meta data after the solution block (binary files) }
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    assert filename, "Please pass filename as an argument to the function"
+
+    if is_binary_restart(filename):
+        header, variables, offset = _restart_header(filename)
+        nfields, npoin, nint, ndouble = [int(val) for val in header[1:]]
+        if npoin > 0:
+            solution = np.memmap(filename, dtype='<f8', mode=mode, offset=offset, shape=(npoin, nfields))
+        else:
+            solution = np.empty((0, nfields))
+
+        # older versions of SU2 write the iteration and meta data after the solution
+        meta_offset = offset + 8*npoin*nfields
+        with open(filename, 'rb') as f:
+            f.seek(meta_offset)
+            iteration = np.fromfile(f, dtype='<i4', count=nint)
+            metadata = np.fromfile(f, dtype='<f8', count=ndouble)
+        file_format = 'binary'
+    else:
+        variables, solution = _read_ascii_restart(filename)
+        iteration = np.empty(0, dtype=np.int32)
+        metadata = np.empty(0)
+        file_format = 'ascii'
+
+    data = {'VARIABLES' : variables,
+            'DATA' : solution,
+            'FIELDS' : dict((var, solution[:, i]) for i, var in enumerate(variables)),
+            'NPOIN' : solution.shape[0],
+            'NFIELDS' : solution.shape[1],
+            'FORMAT' : file_format,
+            'ITERATION' : iteration,
+            'METADATA' : metadata}
+    return data
+
+def _read_ascii_restart(filename):
+    """Reads an ASCII SU2 restart file. The header holds the quoted field names, the
+    values are comma, tab or space delimited. The PointID column is dropped so that
+    the fields match those of a binary restart."""
+    with open(filename, 'rb') as f:
+        header = f.readline().decode('utf-8')
+        body = f.read()
+
+    delimiter = ',' if ',' in header else None
+    variables = [var.strip().strip('"') for var in header.split(delimiter)]
+    values = np.fromstring(body.replace(b',', b' '), dtype=float, sep=' ')
+    if values.size % len(variables):
+        raise ValueError("Number of values in " + filename + " does not match the " +
+                         str(len(variables)) + " fields of the header")
+    solution = values.reshape(-1, len(variables))
+
+    if variables[0] == 'PointID':
+        # the point index is implied by the row
+        variables = variables[1:]
+        solution = solution[:, 1:]
+    return variables, solution
+
+def write_restart(filename, variables, solution, iteration = None, metadata = None, chunk_rows = 1<<16):
+    """Writes a SU2 binary restart file
+
+    Keyword arguments:
+    filename -- Name of the restart file
+    variables -- list of field names, at most 32 characters each
+    solution -- array of shape (NPOIN, NFIELDS), e.g. DATA of read_restart
+    iteration -- optional integer meta data written after the solution (default None)
+    metadata -- optional double meta data written after the solution (default None)
+    chunk_rows -- number of points written at a time, so memory maps are not loaded
+                  in full (default 65536)
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    assert filename, "Please pass filename as an argument to the function"
+
+    npoin, nfields = np.shape(solution)
+    assert nfields == len(variables), "Number of variables does not match the columns of solution"
+    iteration = np.asarray([] if iteration is None else iteration, dtype='<i4').ravel()
+    metadata = np.asarray([] if metadata is None else metadata, dtype='<f8').ravel()
+
+    names = b''
+    for var in variables:
+        name = var.encode('utf-8')
+        assert len(name) < RESTART_NAME_LENGTH, "Field name " + var + " is too long"
+        names += name.ljust(RESTART_NAME_LENGTH, b'\0')
+
+    with open(filename, 'wb') as f:
+        np.array([RESTART_MAGIC, nfields, npoin, iteration.size, metadata.size], dtype='<i4').tofile(f)
+        f.write(names)
+        for start in range(0, npoin, chunk_rows):
+            np.ascontiguousarray(solution[start:start + chunk_rows], dtype='<f8').tofile(f)
+        iteration.tofile(f)
+        metadata.tofile(f)
@@ -0,0 +1,196 @@
+import numpy as np
+import base64
+import mmap
+import re
+import zlib
+import xml.etree.ElementTree as ET
+from io_su2.profiling import instrumented
+
+# numpy type codes of the VTK data types
+_VTK_TYPES = {'Int8' : 'i1', 'UInt8' : 'u1', 'Int16' : 'i2', 'UInt16' : 'u2',
+              'Int32' : 'i4', 'UInt32' : 'u4', 'Int64' : 'i8', 'UInt64' : 'u8',
+              'Float32' : 'f4', 'Float64' : 'f8'}
+
+def _b64decode(text):
+    """Decodes base64 text, ignoring whitespace"""
+    return base64.b64decode(re.sub(rb'\s+', b'', text))
+
+def _b64_header_length(nbytes):
+    """Number of base64 characters used to encode nbytes on their own"""
+    return 4*((nbytes + 2)//3)
+
+class _VTUFile:
+    """Decodes the DataArray elements of a VTK XML file.
+
+    Keyword arguments:
+    raw -- the file contents, as bytes or a memory map
+    root -- parsed XML element tree of the file (without the appended data)
+    appended -- position of the first byte of the appended data, None if there is none
+    appended_encoding -- 'raw' or 'base64'
+    """
+
+    def __init__(self, raw, root, appended, appended_encoding):
+        self.raw = raw
+        self.appended = appended
+        self.appended_encoding = appended_encoding
+        order = '<' if root.get('byte_order', 'LittleEndian') == 'LittleEndian' else '>'
+        self.order = order
+        self.header_type = np.dtype(order + _VTK_TYPES[root.get('header_type', 'UInt32')])
+        self.compressed = root.get('compressor', '') == 'vtkZLibDataCompressor'
+
+    def array(self, element, count=None):
+        """Returns the values of a DataArray element as a numpy array of shape (n, ncomp)"""
+        dtype = np.dtype(self.order + _VTK_TYPES[element.get('type')])
+        ncomp = int(element.get('NumberOfComponents', 1))
+        form = element.get('format', 'ascii')
+
+        if form == 'ascii':
+            values = np.array((element.text or '').split(), dtype=dtype)
+        elif form == 'binary':
+            values = self._decode_base64(element.text.strip().encode('ascii'), dtype)
+        elif form == 'appended':
+            offset = self.appended + int(element.get('offset', 0))
+            if self.appended_encoding == 'raw':
+                values = self._decode_raw(offset, dtype)
+            else:
+                end = self.raw.find(b'<', offset)
+                values = self._decode_base64(bytes(self.raw[offset:end]).split()[0], dtype)
+        else:
+            raise ValueError('Unknown DataArray format: ' + form)
+
+        if count is not None:
+            values = values[:count*ncomp]
+        return values.reshape(-1, ncomp)
+
+    def _decode_raw(self, offset, dtype):
+        """Reads a raw binary appended array at offset. Uncompressed arrays are returned
+        as views of the file without copying."""
+        itemsize = self.header_type.itemsize
+        if not self.compressed:
+            nbytes = int(np.frombuffer(self.raw, self.header_type, 1, offset)[0])
+            return np.frombuffer(self.raw, dtype, nbytes//dtype.itemsize, offset + itemsize)
+
+        nblocks = int(np.frombuffer(self.raw, self.header_type, 1, offset)[0])
+        header = np.frombuffer(self.raw, self.header_type, 3 + nblocks, offset).astype(np.int64)
+        start = offset + (3 + nblocks)*itemsize
+        return self._decompress(header, self.raw, start, dtype)
+
+    def _decode_base64(self, text, dtype):
+        """Decodes a base64 array. The header can be encoded on its own or together with the data."""
+        itemsize = self.header_type.itemsize
+        if not self.compressed:
+            nchar = _b64_header_length(itemsize)
+            if text[nchar-1:nchar] == b'=':
+                # header and data encoded separately
+                nbytes = int(np.frombuffer(_b64decode(text[:nchar]), self.header_type, 1)[0])
+                data = _b64decode(text[nchar:])
+            else:
+                data = _b64decode(text)
+                nbytes = int(np.frombuffer(data, self.header_type, 1)[0])
+                data = data[itemsize:]
+            return np.frombuffer(data, dtype, nbytes//dtype.itemsize)
+
+        # read the number of blocks first, then the full header
+        nblocks = int(np.frombuffer(_b64decode(text[:_b64_header_length(3*itemsize)]), self.header_type, 1)[0])
+        header_bytes = (3 + nblocks)*itemsize
+        nchar = _b64_header_length(header_bytes)
+        if text[nchar-1:nchar] == b'=' or header_bytes % 3 == 0:
+            header = np.frombuffer(_b64decode(text[:nchar]), self.header_type, 3 + nblocks).astype(np.int64)
+            data = _b64decode(text[nchar:])
+        else:
+            data = _b64decode(text)
+            header = np.frombuffer(data, self.header_type, 3 + nblocks).astype(np.int64)
+            data = data[header_bytes:]
+        return self._decompress(header, data, 0, dtype)
+
+    def _decompress(self, header, data, start, dtype):
+        """Decompresses the zlib blocks described by header, starting at byte start of data"""
+        nblocks, block_size, last_size = header[:3]
+        sizes = header[3:]
+        out = bytearray()
+        pos = start
+        for size in sizes:
+            out += zlib.decompress(data[pos:pos + size])
+            pos += size
+        return np.frombuffer(bytes(out), dtype)
+
+@instrumented
+def read_vtu(filename=''):
+    """Reads a VTK XML unstructured grid (.vtu) file, such as the SU2 surface and volume outputs
+
+    Handles ASCII, inline base64 and appended (raw or base64) data, with or without zlib
+    compression. Uncompressed raw appended arrays, which SU2 writes by default, are memory
+    mapped and returned as views of the file, so no data is copied.
+
+    Keyword arguments:
+    filename -- Name of .vtu file.
+
+    Return value:
+    data -- Dictionary containing the grid. Organized as:
+    data =  {   POINTS = numpy array of shape (NumberOfPoints, 3),
+                CONNECTIVITY = flat numpy array with the point indices of all cells,
+                OFFSETS = numpy array with the end of each cell in CONNECTIVITY,
+                TYPES = numpy array with the VTK type of each cell,
+                POINT_DATA = { VAR0 : numpy array of shape (NumberOfPoints, ncomp),
+                               ...},
+                CELL_DATA = { VAR0 : numpy array of shape (NumberOfCells, ncomp),
+                               ...}}
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    assert filename, "Please pass filename as an argument to the function"
+
+    with open(filename, 'rb') as f:
+        raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # the XML part ends where the appended data starts
+    appended = raw.find(b'<AppendedData')
+    if appended < 0:
+        root = ET.fromstring(raw[:])
+        appended_pos = None
+        encoding = None
+    else:
+        tag_end = raw.find(b'>', appended)
+        tag = raw[appended:tag_end + 1].decode('utf-8')
+        encoding = re.search(r'encoding\s*=\s*"([^"]*)"', tag).group(1)
+        appended_pos = raw.find(b'_', tag_end) + 1
+        root = ET.fromstring(raw[:appended] + b'</VTKFile>')
+
+    vtu = _VTUFile(raw, root, appended_pos, encoding)
+    points, connectivity, offsets, types = [], [], [], []
+    point_data, cell_data = {}, {}
+    npoints = 0
+    nconn = 0
+
+    for piece in root.iter('Piece'):
+        n_points = int(piece.get('NumberOfPoints'))
+        n_cells = int(piece.get('NumberOfCells'))
+
+        points.append(vtu.array(piece.find('Points').find('DataArray'), n_points))
+        cells = dict((array.get('Name'), array) for array in piece.find('Cells').iter('DataArray'))
+        conn = vtu.array(cells['connectivity']).reshape(-1)
+        offs = vtu.array(cells['offsets'], n_cells).reshape(-1)
+
+        # shift the cells of later pieces
+        connectivity.append(conn + npoints if npoints else conn)
+        offsets.append(offs + nconn if nconn else offs)
+        types.append(vtu.array(cells['types'], n_cells).reshape(-1))
+        npoints += n_points
+        nconn += conn.size
+
+        for section, store, count in [('PointData', point_data, n_points), ('CellData', cell_data, n_cells)]:
+            node = piece.find(section)
+            if node is None:
+                continue
+            for array in node.iter('DataArray'):
+                store.setdefault(array.get('Name'), []).append(vtu.array(array, count))
+
+    join = lambda arrays: arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+    data = {'POINTS' : join(points),
+            'CONNECTIVITY' : join(connectivity),
+            'OFFSETS' : join(offsets),
+            'TYPES' : join(types),
+            'POINT_DATA' : dict((name, join(arrays)) for name, arrays in point_data.items()),
+            'CELL_DATA' : dict((name, join(arrays)) for name, arrays in cell_data.items())}
+    return data
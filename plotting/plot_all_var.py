@@ -3,39 +3,230 @@
 """Script to plot all variables in a history file.
 This script outputs .png files in a images sub-directory
 
+Usage: plot_all_var.py [options] [history files or run folders]
+
+Without arguments the history file in the working directory is plotted. Folders are
+searched recursively for history files, so a whole run tree can be plotted at once,
+with an images folder next to each history file. Figures are rendered with the Agg
+backend on a pool of worker processes that each reuse a single figure. Figures that
+are newer than their history file are skipped, and with --hash figures whose data
+has not changed are skipped as well. Long histories can be decimated to a target
+number of points per figure with -n.
+
 Author: Jayant Mukhopadhaya
-Last updated: 08/12/2020"""
+Last updated: 10/18/2026"""
 
-from io_su2.file_read_util import *
-import numpy as np
+from optparse import OptionParser
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import os
 import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import os
+from io_su2.file_read_util import *
+from io_su2.decimation import decimate
+import numpy as np
 
 textFontSize = 16
 tickFontSize = 14
 matplotlib.rc('font', size=tickFontSize)
 
-filename = ''
-for file in os.listdir(os.getcwd()):
-    if 'history' in file:
-        filename = file
-if not os.path.isdir("images"):
-    os.mkdir("images")
+# name of the file in each images folder that holds the data hashes of the figures
+HASH_FILE = '.plot_hashes.json'
+
+# figure reused by all the plots of a worker process
+_figure = None
 
-assert filename, "No history file found"
-hist_data = read_history_data(filename)
+def find_history_files(paths):
+    """Returns the history files given directly in paths, or found in the folders in paths"""
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for root, folders, names in os.walk(path):
+            folders.sort()
+            for name in sorted(names):
+                if 'history' in name and os.path.splitext(name)[1] in ['.dat', '.csv']:
+                    files.append(os.path.join(root, name))
+    return files
 
-for var,vec in hist_data.items():
+def image_name(image_dir, var):
+    """Name of the .png file of variable var"""
+    return os.path.join(image_dir, var.replace('/', '_') + "_convergence.png")
+
+def x_variable(filename, hist_data):
+    """Name of the variable that is plotted on the x axis"""
     if 'history_project' in filename:
-        plt.plot(hist_data["EVALUATION"],hist_data[var])
+        return "EVALUATION"
     elif "Iteration" in hist_data.keys():
-        plt.plot(hist_data["Iteration"],hist_data[var])
+        return "Iteration"
+    return "Inner_Iter"
+
+def data_hash(var, x, y):
+    """Hash of the data of a figure, used to skip figures that would not change"""
+    md5 = hashlib.md5(var.encode('utf-8'))
+    md5.update(np.ascontiguousarray(x, dtype=float).tobytes())
+    md5.update(np.ascontiguousarray(y, dtype=float).tobytes())
+    return md5.hexdigest()
+
+def _get_figure():
+    """Returns the figure, axes and line of this worker, created on first use"""
+    global _figure
+    if _figure is None:
+        fig, ax = plt.subplots()
+        line, = ax.plot([], [])
+        ax.set_xlabel('Iteration')
+        _figure = (fig, ax, line)
+    return _figure
+
+def plot_variables(filename, variables, image_dir, hashes=None, points=0, decimation='minmax'):
+    """Plots the variables of a history file, reusing the figure of the worker process
+
+    Keyword arguments:
+    filename -- Name of history file
+    variables -- list of the variables to plot
+    image_dir -- folder the .png files are written to
+    hashes -- dictionary with the data hash of the existing figures. If given, figures
+              whose data has the same hash are not rendered again (default None)
+    points -- largest number of points plotted per figure, 0 plots all points (default 0)
+    decimation -- decimation method, 'minmax' or 'lttb' (default 'minmax')
+
+    Return value:
+    new_hashes -- dictionary with the data hash of every figure that was checked
+    nplots -- number of figures that were rendered
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    hist_data = read_history_data(filename)
+    x = hist_data[x_variable(filename, hist_data)]
+    fig, ax, line = _get_figure()
+
+    new_hashes = {}
+    nplots = 0
+    for var in variables:
+        png = image_name(image_dir, var)
+        xplot, yplot = decimate(x, hist_data[var], points, decimation)
+        if hashes is not None:
+            new_hashes[var] = data_hash(var, xplot, yplot)
+            if hashes.get(var) == new_hashes[var] and os.path.isfile(png):
+                # same data, mark the figure as up to date
+                os.utime(png)
+                continue
+
+        line.set_data(xplot, yplot)
+        ax.relim()
+        ax.autoscale_view()
+        ax.set_ylabel(var)
+        fig.tight_layout()
+        fig.savefig(png)
+        nplots += 1
+    return new_hashes, nplots
+
+def _plot_variables_star(args):
+    return plot_variables(*args)
+
+def plot_all_var(paths=None, processes=None, force=False, use_hash=False, image_folder='images',
+                 points=0, decimation='minmax'):
+    """Plots all variables of one or several history files
+
+    Keyword arguments:
+    paths -- list of history files or folders that are searched for history files. None
+             uses the history file in the working directory (default None)
+    processes -- number of worker processes. None uses all cores, 1 plots serially (default None)
+    force -- render all figures, even if they are up to date (default False)
+    use_hash -- skip figures whose data has not changed since they were rendered, even
+                if the history file is newer (default False)
+    image_folder -- name of the folder next to each history file the figures are
+                    written to (default 'images')
+    points -- largest number of points plotted per figure, 0 plots all points (default 0)
+    decimation -- decimation method, 'minmax' keeps the peaks and 'lttb' the shape of
+                  the series (default 'minmax')
+
+    Return value:
+    nplots -- number of figures that were rendered
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    if not paths:
+        filename = ''
+        for file in os.listdir(os.getcwd()):
+            if 'history' in file:
+                filename = file
+        assert filename, "No history file found"
+        files = [filename]
+    else:
+        files = find_history_files(paths)
+        assert files, "No history file found"
+
+    processes = processes or os.cpu_count() or 1
+    tasks = []
+    all_hashes = {}
+    for filename in files:
+        image_dir = os.path.join(os.path.dirname(filename), image_folder)
+        if not os.path.isdir(image_dir):
+            os.mkdir(image_dir)
+
+        # figures newer than the history file are up to date
+        history_time = os.path.getmtime(filename)
+        variables = [var for var in read_history_header(filename)
+                     if force or not os.path.isfile(image_name(image_dir, var)) or
+                        os.path.getmtime(image_name(image_dir, var)) < history_time]
+        if not variables:
+            continue
+
+        hashes = None
+        if use_hash:
+            hash_file = os.path.join(image_dir, HASH_FILE)
+            all_hashes[hash_file] = {}
+            if os.path.isfile(hash_file):
+                with open(hash_file) as fp:
+                    all_hashes[hash_file] = json.load(fp)
+            hashes = {} if force else all_hashes[hash_file].get(os.path.basename(filename), {})
+
+        # split the variables of each file over the workers
+        nchunks = max(1, min(processes, len(variables)))
+        for i in range(nchunks):
+            tasks.append((filename, variables[i::nchunks], image_dir, hashes, points, decimation))
+
+    if processes == 1 or len(tasks) < 2:
+        results = [_plot_variables_star(task) for task in tasks]
     else:
-        plt.plot(hist_data["Inner_Iter"],hist_data[var])
-    plt.xlabel('Iteration')
-    plt.ylabel(var)
-    plt.tight_layout()
-    plt.savefig("images/"+var.replace('/','_') + "_convergence.png")
-    plt.clf()
-plt.close()
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_plot_variables_star, tasks))
+
+    # store the hashes of the figures that were checked
+    if use_hash:
+        for task, (new_hashes, nplots) in zip(tasks, results):
+            filename, image_dir = task[0], task[2]
+            hash_file = os.path.join(image_dir, HASH_FILE)
+            all_hashes[hash_file].setdefault(os.path.basename(filename), {}).update(new_hashes)
+        for hash_file, hashes in all_hashes.items():
+            with open(hash_file, 'w') as fp:
+                json.dump(hashes, fp)
+
+    return sum(nplots for new_hashes, nplots in results)
+
+def main():
+    parser = OptionParser(usage='usage: %prog [options] [history files or run folders]')
+    parser.add_option("-j", "--processes", dest="processes", type="int", default=0,
+                      help="number of worker processes, all cores by default")
+    parser.add_option("-f", "--force", dest="force", action="store_true", default=False,
+                      help="render all figures, even if they are newer than the history file")
+    parser.add_option("--hash", dest="use_hash", action="store_true", default=False,
+                      help="skip figures whose data did not change, using a hash of the data")
+    parser.add_option("-n", "--points", dest="points", type="int", default=0,
+                      help="largest number of points plotted per figure, 0 plots all points")
+    parser.add_option("--decimation", dest="decimation", default="minmax",
+                      help="decimation method: minmax keeps the peaks, lttb keeps the shape")
+    (options, args) = parser.parse_args()
+
+    nplots = plot_all_var(args, options.processes or None, options.force, options.use_hash,
+                          points=options.points, decimation=options.decimation)
+    print('Rendered ' + str(nplots) + ' figures')
+
+if __name__ == "__main__":
+    main()
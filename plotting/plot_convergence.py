@@ -3,10 +3,16 @@
 """Script to plot convergence history and output a .png file.
 Only plots Density residual against iteration
 
+Usage: plot_convergence.py [-n points] [--decimation minmax|lttb]
+
+Long histories are decimated to about the given number of points before plotting.
+
 Author: Jayant Mukhopadhaya
-Last updated: 08/12/2020"""
+Last updated: 10/18/2026"""
 
+from optparse import OptionParser
 from io_su2.file_read_util import *
+from io_su2.decimation import decimate
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
@@ -16,6 +22,13 @@ textFontSize = 16
 tickFontSize = 14
 matplotlib.rc('font', size=tickFontSize)
 
+parser = OptionParser()
+parser.add_option("-n", "--points", dest="points", type="int", default=0,
+                  help="largest number of points that are plotted, 0 plots all points")
+parser.add_option("--decimation", dest="decimation", default="minmax",
+                  help="decimation method: minmax keeps the peaks, lttb keeps the shape")
+(options, args) = parser.parse_args()
+
 filename = ''
 for file in os.listdir(os.getcwd()):
     if 'history' in file:
@@ -25,7 +38,7 @@ assert filename, "No history file found"
 hist_data = read_history_data(filename)
 
 if "Iteration" in hist_data.keys():
-    plt.plot(hist_data["Iteration"],hist_data["Res_Flow[0]"])
+    plt.plot(*decimate(hist_data["Iteration"],hist_data["Res_Flow[0]"],options.points,options.decimation))
     plt.xlabel('Iteration')
     plt.ylabel('rms[Rho]')
     plt.tight_layout()
@@ -33,7 +46,7 @@ if "Iteration" in hist_data.keys():
 else:
     for var,vec in hist_data.items():
         if "[Rho]" in var or "[A_Rho]" in var:
-            plt.plot(hist_data["Inner_Iter"],hist_data[var])
+            plt.plot(*decimate(hist_data["Inner_Iter"],hist_data[var],options.points,options.decimation))
             plt.xlabel('Iteration')
             plt.ylabel(var)
             plt.tight_layout()
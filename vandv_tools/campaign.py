@@ -0,0 +1,150 @@
+import numpy as np
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from io_su2.file_read_util import *
+
+def find_cases(root = '.', depth = 4):
+    """Finds the run folders of a verification campaign
+
+    Keyword arguments:
+    root -- Root folder of the campaign, i.e. the folder run_verification_study.py was run in
+    depth -- Number of folder levels below root, model/grad/recon/level by default (default 4)
+
+    Return value:
+    cases -- dictionary with (model, grad, recon, level) tuples as keys and the path
+             of the run folder as values. Only folders that contain a history or
+             forces breakdown file are included.
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    cases = {}
+    root = os.path.normpath(root)
+    for path, folders, files in os.walk(root):
+        rel = os.path.relpath(path, root)
+        parts = [] if rel == '.' else rel.split(os.sep)
+        if len(parts) >= depth:
+            # do not descend any further
+            folders[:] = []
+        if len(parts) != depth:
+            continue
+        if any('history' in f or f == 'forces_breakdown.dat' for f in files):
+            cases[tuple(parts)] = path
+    return cases
+
+def load_case(path, history = True, cache = False):
+    """Reads the results of a single run folder
+
+    Keyword arguments:
+    path -- Path of the run folder
+    history -- If True, the full convergence history is included (default True)
+    cache -- Use the binary history cache of read_history_data (default False)
+
+    Return value:
+    case -- dictionary organized as:
+    case = {    'path' : path of the run folder,
+                'forces' : dictionary from get_force_data,
+                'final' : final value of every history variable,
+                'history' : dictionary from read_history_data (if history is True),
+                'mesh' : dictionary from get_mesh_data,
+                'performance' : performance summary of log.out from read_log,
+                'error' : None, or a string with the traceback if the folder could not be parsed }
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    case = {'path' : path, 'error' : None}
+    try:
+        files = sorted(os.listdir(path))
+
+        if 'forces_breakdown.dat' in files:
+            case['forces'] = get_force_data(os.path.join(path, 'forces_breakdown.dat'))
+
+        history_files = [f for f in files if 'history' in f and os.path.splitext(f)[1] in ['.dat', '.csv']]
+        if history_files:
+            hist_data = read_history_data(os.path.join(path, history_files[0]), cache=cache)
+            # final values come from the history that is already in memory
+            case['final'] = dict((var, float(np.ravel(vec)[-1])) for var, vec in hist_data.items())
+            if history:
+                case['history'] = hist_data
+
+        if 'log.out' in files:
+            # only the end of the log is read for the performance summary
+            case['performance'] = read_log(os.path.join(path, 'log.out'), residuals=False)['PERFORMANCE']
+
+        # mesh files are usually links to the mesh family, skip links that are broken
+        mesh_files = [f for f in files if f.endswith('.su2') and os.path.exists(os.path.join(path, f))]
+        if mesh_files:
+            case['mesh'] = get_mesh_data(os.path.join(path, mesh_files[0]))
+    except Exception:
+        case['error'] = traceback.format_exc()
+    return case
+
+def _load_case_star(args):
+    return load_case(*args)
+
+def load_campaign(root = '.', processes = None, history = True, cache = False, depth = 4):
+    """Reads all run folders of a verification campaign in parallel
+
+    Keyword arguments:
+    root -- Root folder of the campaign (default '.')
+    processes -- Number of worker processes. None uses all cores, 1 reads serially (default None)
+    history -- If True, the full convergence histories are included (default True)
+    cache -- Use the binary history cache of read_history_data (default False)
+    depth -- Number of folder levels below root (default 4)
+
+    Return value:
+    data -- dictionary with (model, grad, recon, level) tuples as keys and the case
+            dictionaries from load_case as values. A folder that fails to parse has its
+            traceback in case['error'] and does not stop the other cases from loading.
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    cases = find_cases(root, depth)
+    keys = sorted(cases.keys())
+    args = [(cases[key], history, cache) for key in keys]
+
+    if processes == 1 or len(keys) < 2:
+        results = [_load_case_star(arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(_load_case_star, args))
+
+    return dict(zip(keys, results))
+
+def campaign_table(data, variables = ('CD', 'CL'), source = 'forces'):
+    """Collects scalar results of a campaign into a structured numpy array
+
+    Keyword arguments:
+    data -- campaign dictionary from load_campaign
+    variables -- names of the variables to collect (default ('CD', 'CL'))
+    source -- 'forces' for get_force_data values, 'final' for final history values, or
+              'performance' for the performance summary, e.g. variables=('Mpoints/s',)
+              (default 'forces')
+
+    Return value:
+    table -- structured numpy array with one row per case. Fields are 'model', 'grad',
+             'recon', 'level', 'NPOIN', 'ok' and the requested variables. Missing values
+             and cases with errors are NaN.
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    keys = sorted(data.keys())
+    key_len = max([len(part) for key in keys for part in key] + [1])
+    dtype = [(name, 'U' + str(key_len)) for name in ['model', 'grad', 'recon', 'level']]
+    dtype += [('NPOIN', np.int64), ('ok', bool)] + [(var, np.float64) for var in variables]
+
+    table = np.zeros(len(keys), dtype=dtype)
+    for i, key in enumerate(keys):
+        case = data[key]
+        for name, part in zip(['model', 'grad', 'recon', 'level'], key):
+            table[name][i] = part
+        table['ok'][i] = case['error'] is None
+        table['NPOIN'][i] = case.get('mesh', {}).get('NPOIN', 0)
+        values = case.get(source, {})
+        for var in variables:
+            table[var][i] = values.get(var, np.nan)
+    return table
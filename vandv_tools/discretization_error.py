@@ -80,3 +80,224 @@ def numerical_discretization_error(h,phi,verbose=True):
         error["Error Code"] = 4
         
     return error
+
+
+def _order_function_batch(p,r32,r21,eps32,eps21):
+    """Vectorized order_function and its derivative with respect to p"""
+    s = np.sign(eps32/eps21)
+    a = r21**p
+    b = r32**p
+    q = np.log((a-s)/(b-s))
+    dq = a*np.log(r21)/(a-s) - b*np.log(r32)/(b-s)
+    arg = np.abs(eps32/eps21)+q
+    f = 1/np.log(r21)*np.log(arg) - p
+    df = dq/(arg*np.log(r21)) - 1
+    return f, df
+
+def numerical_discretization_error_batch(h,phi,verbose=False,tol=1e-12,max_iter=50):
+    """Calculate numerical discretization error for many solution triples at once
+    Keyword arguments:
+    h -- array of shape (3,N) containing the three grid sizes h_i for each entry.
+         An array of shape (3,) uses the same grid sizes for all entries.
+    phi -- array of shape (3,N) containing corresponding solutions on each grid phi_i
+    verbose -- print a summary of the error codes (default False)
+    tol -- tolerance of the Newton iteration for the apparent order (default 1e-12)
+    max_iter -- maximum number of Newton iterations (default 50)
+    
+    Return value:
+    error -- dictionary with the same keys as numerical_discretization_error, where every
+             value is an array of size N. Values that are 'NA' or not defined in the
+             scalar function are NaN. "Error Code" is an integer array.
+    
+    The apparent order of all entries is found with a vectorized Newton iteration on
+    the same equation as order_function, starting from p = 2 like the scalar function.
+    The few entries where Newton does not converge are solved with fsolve. Entries for
+    which no apparent order can be found (where the scalar function raises an error) 
+    have a NaN apparent order.
+    
+    Reference:  https://turbmodels.larc.nasa.gov/uncertainty_summary.pdf"""
+    
+    phi = np.asarray(phi,dtype=float)
+    if phi.ndim == 1:
+        phi = phi[:,None]
+    h = np.broadcast_to(np.asarray(h,dtype=float).reshape(3,-1),phi.shape)
+    n = phi.shape[1]
+    
+    # Constants
+    F_s = 1.25
+    C_low = 0.95
+    C_hi = 3.05
+    delta_M = np.max(np.abs([phi[1]-phi[0],phi[2]-phi[1],phi[2]-phi[0]]),axis=0)
+    
+    # Mesh refinement ratios
+    r21 = h[1]/h[0]
+    r32 = h[2]/h[1]
+    
+    # Result ratios
+    eps21 = phi[1] - phi[0]
+    eps32 = phi[2] - phi[1]
+    
+    with np.errstate(divide='ignore',invalid='ignore',over='ignore'):
+        oscillatory = eps32/eps21 < 0.0
+        
+        # Solve for apparent order with Newton's method, only on entries that need it
+        p = np.full(n,2.0)
+        active = ~oscillatory
+        for _ in range(max_iter):
+            if not np.any(active):
+                break
+            f, df = _order_function_batch(p[active],r32[active],r21[active],eps32[active],eps21[active])
+            step = f/df
+            p[active] -= step
+            done = ~np.isfinite(step) | (np.abs(step) <= tol*np.maximum(1.0,np.abs(p[active])))
+            active[np.flatnonzero(active)[done]] = False
+        
+        # fall back to fsolve where Newton failed or did not converge
+        f, df = _order_function_batch(p,r32,r21,eps32,eps21)
+        ratio = eps32/eps21
+        retry = ~oscillatory & (ratio != 0.0) & np.isfinite(ratio) & (active | ~np.isfinite(p) | ~(np.abs(f) <= 1e-8))
+        for i in np.flatnonzero(retry):
+            try:
+                p[i] = fsolve(lambda x: order_function(x[0],r32[i],r21[i],eps32[i],eps21[i]),2)[0]
+            except (ValueError,ZeroDivisionError):
+                p[i] = np.nan
+        p[oscillatory] = np.nan
+        
+        # ASME Guidelines
+        error = {}
+        error["Computed apparent order"] = p
+        error["Relative fine-grid error"] = np.abs((phi[0]-phi[1])/phi[0])
+        error["Extrapolated value"] = (phi[0]*r21**p - phi[1])/(r21**p-1)
+        error["Extrapolated relative fine-grid error"] = np.abs((error["Extrapolated value"]-phi[0])/error["Extrapolated value"])
+        error["Fine-grid convergence index"] = F_s*error["Relative fine-grid error"]/(r21**p - 1)
+        
+        # Extension to ASME Guidelines as presented in https://turbmodels.larc.nasa.gov/uncertainty_summary.pdf
+        code = np.zeros(n,dtype=int)
+        gci_corrected = np.full(n,np.nan)
+        
+        negative = ~oscillatory & (p < 0.0)
+        gci_corrected[negative] = 3.0*delta_M[negative]/np.abs(phi[0][negative])
+        code[negative] = 2
+        
+        low = ~oscillatory & (p < C_low) & (p > 0.0)
+        gci_corrected[low] = np.minimum(error["Fine-grid convergence index"][low],F_s*delta_M[low]/np.abs(phi[0][low]))
+        code[low] = 3
+        
+        high = ~oscillatory & ~low & (p > C_hi)
+        gci_corrected[high] = np.minimum(F_s*error["Relative fine-grid error"][high]/(r21[high]**C_hi - 1),
+                                         F_s*delta_M[high]/np.abs(phi[0][high]))
+        code[high] = 4
+        
+        # Oscillatory convergence
+        gci_corrected[oscillatory] = 3.0*delta_M[oscillatory]/np.abs(phi[0][oscillatory])
+        code[oscillatory] = 1
+        for key in ["Extrapolated value","Extrapolated relative fine-grid error","Fine-grid convergence index"]:
+            error[key][oscillatory] = np.nan
+    
+    error["Fine-grid convergence index, Corrected"] = gci_corrected
+    error["Error Code"] = code
+    
+    if verbose:
+        for c, message in [(1,"Oscillatory convergence"),(2,"Negative apparent order"),
+                           (3,"Apparent order is less than " + str(C_low)),
+                           (4,"Apparent order is greater than " + str(C_hi))]:
+            if np.any(code == c):
+                print("WARNING: " + message + " for " + str(np.sum(code == c)) + " of " + str(n) + " entries")
+    
+    return error
+
+def interpolate_to_stations(coords,values,stations):
+    """Interpolates values known at coords onto stations
+    Keyword arguments:
+    coords -- array of shape (n,) for profiles, or (n,d) for surfaces, with the
+              coordinates where values are known
+    values -- array of shape (n,) with the values at coords
+    stations -- array of shape (m,) or (m,d) with the coordinates to interpolate to
+    
+    Return value:
+    interpolated -- array of shape (m,) with the values at stations
+    
+    Profiles are interpolated linearly with np.interp. Surfaces are interpolated linearly
+    on a Delaunay triangulation of coords, and stations outside of it take the value of 
+    the nearest point."""
+    
+    coords = np.asarray(coords,dtype=float)
+    values = np.asarray(values,dtype=float)
+    stations = np.asarray(stations,dtype=float)
+    
+    if coords.ndim == 1 or coords.shape[1] == 1:
+        coords = coords.reshape(-1)
+        order = np.argsort(coords,kind='stable')
+        return np.interp(stations.reshape(-1),coords[order],values[order])
+    
+    from scipy.interpolate import griddata
+    interpolated = griddata(coords,values,stations,method='linear')
+    outside = np.isnan(interpolated)
+    if np.any(outside):
+        interpolated[outside] = griddata(coords,values,stations[outside],method='nearest')
+    return interpolated
+
+def pointwise_discretization_error(h,coords,values,levels=(0,1,2),verbose=False):
+    """Calculate numerical discretization error at every station of a profile or surface
+    Keyword arguments:
+    h -- sequence with the grid size h_i of each mesh level, ordered from fine to coarse
+    coords -- sequence with the station coordinates of each mesh level, arrays of shape
+              (n_i,) for profiles (e.g. y along an extracted line) or (n_i,d) for surfaces
+    values -- sequence with the values of the quantity at the stations of each mesh level
+    levels -- indices of the three mesh levels used for the error estimate (default (0,1,2))
+    verbose -- print a summary of the error codes (default False)
+    
+    Return value:
+    error -- dictionary from numerical_discretization_error_batch, evaluated at the 
+             stations of the finest of the chosen levels, with two more entries:
+             "Stations" -- coordinates of the stations
+             "Interpolated values" -- array of shape (3,n) with the values of the chosen 
+                                      levels at the stations
+    
+    The coarser levels are interpolated onto the fine-level stations and the apparent
+    order, extrapolated value and GCI are computed for all stations in one pass."""
+    
+    assert len(h) == len(coords) == len(values), "h, coords and values need one entry per mesh level"
+    assert len(h) >= 3 and len(levels) == 3, "three mesh levels are needed"
+    
+    fine = levels[0]
+    stations = np.asarray(coords[fine],dtype=float)
+    phi = np.empty((3,stations.shape[0]))
+    phi[0] = values[fine]
+    for i,level in enumerate(levels[1:]):
+        phi[i+1] = interpolate_to_stations(coords[level],values[level],stations)
+    
+    error = numerical_discretization_error_batch(np.asarray(h,dtype=float)[list(levels)],phi,verbose=verbose)
+    error["Stations"] = stations
+    error["Interpolated values"] = phi
+    return error
+
+def pointwise_error_from_extracts(h,extracts,variable,coordinate='Y',component=None,levels=(0,1,2),verbose=False):
+    """Calculate pointwise numerical discretization error from PVWrapper extraction outputs
+    Keyword arguments:
+    h -- sequence with the grid size h_i of each mesh level, ordered from fine to coarse
+    extracts -- sequence with one dictionary per mesh level, as returned by 
+                PVWrapper.extract_variables_along_axis (or any dictionary with coordinate
+                and variable arrays, e.g. the extracted line csv files)
+    variable -- name of the variable to evaluate, e.g. 'Momentum_X'
+    coordinate -- name of the station coordinate, e.g. 'Y' for a profile at constant x,
+                  or a list of names, e.g. ['X','Z'], for a surface (default 'Y')
+    component -- component of a vector variable, e.g. 0 for Momentum x (default None)
+    levels -- indices of the three mesh levels used for the error estimate (default (0,1,2))
+    verbose -- print a summary of the error codes (default False)
+    
+    Return value:
+    error -- dictionary from pointwise_discretization_error"""
+    
+    coords = []
+    values = []
+    for extract in extracts:
+        if isinstance(coordinate,str):
+            coords.append(np.asarray(extract[coordinate]))
+        else:
+            coords.append(np.column_stack([extract[name] for name in coordinate]))
+        value = np.asarray(extract[variable])
+        if component is not None:
+            value = value[:,component]
+        values.append(value)
+    return pointwise_discretization_error(h,coords,values,levels,verbose)
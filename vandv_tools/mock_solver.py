@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+## \file mock_solver.py
+#  \brief Stand-in for SU2_CFD used to test the study drivers without an SU2 install.
+#  \author J. Mukhopadhaya
+#
+#  The script sleeps between iterations and writes a synthetic convergence
+#  history (history.csv, or history.dat if TABULAR_FORMAT= TECPLOT is set in
+#  the config), screen output in the SU2 format, and a forces_breakdown.dat
+#  file at the end of the run. The history is flushed after every row so
+#  that it can be followed while the "solver" is running.
+#
+#  Usage: mock_solver.py [options] [config_CFD.cfg]
+#
+#  The behavior can be set with --behavior:
+#    converge -- residual drops exponentially and CD/CL settle (default)
+#    stall    -- residual levels off well above the convergence criterion
+#    diverge  -- residual grows until it becomes NaN and the run fails
+#    fail     -- exits with a non-zero exit code after the first iteration
+#    restart  -- stalls for a third of the iterations, then the case is restarted:
+#                the history is written again from the start and converges. The
+#                first rows of the new history are written at once, so it is
+#                already longer than the old one when it is read again.
+
+from optparse import OptionParser
+import math
+import os
+import sys
+import time
+
+def read_config(filename):
+    """Returns the options of a SU2 config file as a dictionary of strings"""
+    config = {}
+    if not filename or not os.path.isfile(filename):
+        return config
+    with open(filename) as fp:
+        for line in fp:
+            if line.startswith('%') or not '=' in line:
+                continue
+            key, value = line.split('=', 1)
+            config[key.strip()] = value.strip()
+    return config
+
+def coefficients(i, behavior, n_iter):
+    """Returns synthetic (rms[Rho], CD, CL) values at iteration i"""
+    if behavior == 'diverge':
+        res = -6.0 + 12.0*i/max(n_iter - 1, 1)
+        if res > 4.0:
+            return float('nan'), float('nan'), float('nan')
+        return res, 0.0029 + 0.01*math.exp(res), -0.0007
+    if behavior == 'stall':
+        res = -6.0 - 2.0*(1.0 - math.exp(-i/20.0)) + 0.05*math.sin(i)
+        return res, 0.00285 + 1e-5*math.sin(i/3.0), -0.0007 + 1e-5*math.cos(i/3.0)
+    # converge and the restarted part of restart
+    res = -6.0 - 8.0*i/max(n_iter - 1, 1)
+    decay = math.exp(-i/10.0)
+    return res, 0.00285 + 0.2*decay, -0.0007 - 0.4*decay
+
+def write_forces_breakdown(filename, cd, cl):
+    """Writes a minimal forces breakdown file that can be read with get_force_data"""
+    with open(filename, 'w') as fp:
+        fp.write('\nForces breakdown:\n\n')
+        for name, value in [('CL', cl), ('CD', cd), ('CMz', 0.0), ('CFx', cd), ('CFy', cl)]:
+            fp.write('Total {}:{:>14.6f} | Pressure (   50%):{:>12.6f} | Friction (   50%):{:>12.6f} | '
+                     'Momentum (    0%):    0.000000\n'.format(name, value, 0.5*value, 0.5*value))
+
+def main():
+    parser = OptionParser(usage='usage: %prog [options] [config_CFD.cfg]')
+    parser.add_option("-n", "--iterations", dest="iterations", type="int", default=100,
+                      help="number of iterations to run")
+    parser.add_option("-d", "--delay", dest="delay", type="float", default=0.01,
+                      help="time in seconds to sleep per iteration")
+    parser.add_option("-b", "--behavior", dest="behavior", default="converge",
+                      help="converge, stall, diverge, fail or restart")
+    (options, args) = parser.parse_args()
+
+    config = read_config(args[0] if args else '')
+    tecplot = 'TECPLOT' in config.get('TABULAR_FORMAT', '').upper()
+    history_name = os.path.splitext(config.get('CONV_FILENAME', 'history'))[0] + ('.dat' if tecplot else '.csv')
+    variables = ['Inner_Iter', 'rms[Rho]', 'CD', 'CL']
+
+    print('Mock solver running ' + str(options.iterations) + ' iterations (' + options.behavior + ')')
+    print('Input mesh file name: ' + config.get('MESH_FILENAME', 'mesh.su2'))
+    print('\n------------------------------ Begin Solver -----------------------------')
+    print('+' + '-'*51 + '+')
+    print('|' + '|'.join('{:>12}'.format(var) for var in variables) + '|')
+    print('+' + '-'*51 + '+')
+    sys.stdout.flush()
+
+    header = ','.join('"' + var + '"' for var in variables)
+    header = 'VARIABLES = \\\n' + header + '\n' if tecplot else header + '\n'
+    restart = options.iterations//3 if options.behavior == 'restart' else 0
+    hist = open(history_name, 'w')
+    hist.write(header)
+    try:
+        for i in range(options.iterations):
+            if restart and i == restart:
+                hist.close()
+                hist = open(history_name, 'w')
+                hist.write(header)
+                print('\nRestarting the case.')
+            res, cd, cl = coefficients(i, 'stall' if i < restart else options.behavior, options.iterations)
+            hist.write(', '.join(['{:d}'.format(i)] + ['{:.10g}'.format(val) for val in (res, cd, cl)]) + '\n')
+            # after a restart, flush only once the new history is longer than the old one
+            if not restart or i < restart or i >= 2*restart:
+                hist.flush()
+            print('|{:>12d}|{:>12.6f}|{:>12.6f}|{:>12.6f}|'.format(i, res, cd, cl))
+            sys.stdout.flush()
+            if math.isnan(res):
+                print('\nError: the solution diverged (NaN residual).')
+                sys.exit(1)
+            if options.behavior == 'fail':
+                print('\nError: mock solver failure.')
+                sys.exit(2)
+            time.sleep(options.delay)
+    finally:
+        hist.close()
+
+    write_forces_breakdown('forces_breakdown.dat', cd, cl)
+    print('\n------------------------- Exit Success (SU2_CFD) ------------------------')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+import numpy as np
+import math
+import time
+from io_su2.file_read_util import HistoryFollower
+
+class _RollingCauchy:
+    """Mean of the relative change |c_i - c_(i-1)|/|c_i| over the last n rows, updated in O(1)"""
+
+    def __init__(self, n):
+        self.n = n
+        self._deltas = np.zeros(n)
+        self._count = 0
+        self._sum = 0.0
+        self._last = None
+
+    @property
+    def full(self):
+        return self._count >= self.n
+
+    @property
+    def value(self):
+        return self._sum/min(self._count, self.n) if self._count else math.inf
+
+    def push(self, c):
+        if self._last is not None:
+            delta = abs(c - self._last)/max(abs(c), 1e-300)
+            i = self._count % self.n
+            self._sum += delta - self._deltas[i]
+            self._deltas[i] = delta
+            self._count += 1
+        self._last = c
+
+class _RollingSlope:
+    """Least squares slope of the last n values per row, updated in O(1).
+
+    The rows of the window are at x = 0..n-1, so only the sums of y and x*y change when
+    the window moves."""
+
+    def __init__(self, n):
+        self.n = n
+        self._values = np.zeros(n)
+        self._count = 0
+        self._sy = 0.0
+        self._sxy = 0.0
+
+    @property
+    def full(self):
+        return self._count >= self.n
+
+    @property
+    def value(self):
+        m = min(self._count, self.n)
+        if m < 2:
+            return 0.0
+        sx = m*(m - 1)/2.0
+        sxx = (m - 1)*m*(2*m - 1)/6.0
+        return (m*self._sxy - sx*self._sy)/(m*sxx - sx*sx)
+
+    def push(self, y):
+        i = self._count % self.n
+        if self._count < self.n:
+            self._sxy += self._count*y
+            self._sy += y
+        else:
+            # every row moves one place to the left, the oldest row drops out
+            dropped = self._values[i]
+            self._sxy += -(self._sy - dropped) + (self.n - 1)*y
+            self._sy += y - dropped
+        self._values[i] = y
+        self._count += 1
+
+class ConvergenceMonitor:
+    """Follows the history file of a running case and flags it as converged, stalled or diverged
+
+    Every update only processes the rows written since the previous update, and each
+    row costs O(1): the Cauchy criterion of every coefficient and the slope of the
+    residual are kept as rolling sums over the last window rows.
+
+    A case is
+    converged -- when the residual reaches residual_min, or when the mean relative change
+                 of every coefficient over the last window rows is below cauchy_eps
+                 (CONV_CAUCHY_ELEMS and CONV_CAUCHY_EPS in SU2)
+    stalled -- when the residual dropped by less than stall_drop orders of magnitude over
+               the last slope_window rows without being converged. A stalled case goes
+               back to running if the residual starts to drop again.
+    diverged -- when a monitored value is NaN or inf, the residual rose more than
+                diverge_rise orders of magnitude above its lowest value, or it rose by
+                more than stall_drop orders of magnitude over the last slope_window rows
+
+    Converged and diverged are final. RANS cases often have residual plateaus of a few
+    hundred iterations early on, so slope_window should be longer than those.
+
+    Keyword arguments:
+    filename -- Name of the history file (.csv or .dat)
+    coefficients -- names of the coefficients used for the Cauchy criterion (default ('CD', 'CL'))
+    residual -- name of the residual, in log10 as written by SU2 (default 'rms[Rho]')
+    window -- number of rows of the Cauchy window (default 100)
+    slope_window -- number of rows over which the residual slope is computed (default 500)
+    cauchy_eps -- Cauchy criterion (default 1e-6)
+    residual_min -- residual value at which the case is converged, None to only use the
+                    Cauchy criterion (default None)
+    stall_drop -- smallest residual drop, in orders of magnitude, over slope_window rows (default 0.1)
+    diverge_rise -- residual rise, in orders of magnitude, that flags a diverged case (default 4.0)
+    start_iter -- number of rows that are ignored at the start, e.g. CONV_STARTITER (default 0)
+
+    Usage:
+    monitor = ConvergenceMonitor('history.csv')
+    status = monitor.update()      # 'running', 'converged', 'stalled' or 'diverged'
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    def __init__(self, filename, coefficients = ('CD', 'CL'), residual = 'rms[Rho]', window = 100,
+                 slope_window = 500, cauchy_eps = 1e-6, residual_min = None, stall_drop = 0.1, diverge_rise = 4.0, start_iter = 0):
+        self.follower = HistoryFollower(filename)
+        self.coefficients = list(coefficients)
+        self.residual = residual
+        self.window = window
+        self.slope_window = slope_window
+        self.cauchy_eps = cauchy_eps
+        self.residual_min = residual_min
+        self.stall_drop = stall_drop
+        self.diverge_rise = diverge_rise
+        self.start_iter = start_iter
+        self.reset()
+
+    def reset(self):
+        """Forget all rows, e.g. when the history file was rewritten"""
+        self.status = 'running'
+        self.rows = 0
+        self._cauchy = [_RollingCauchy(self.window) for coeff in self.coefficients]
+        self._slope = _RollingSlope(self.slope_window)
+        self._lowest = math.inf
+
+    @property
+    def cauchy(self):
+        """Dictionary with the current Cauchy value of every coefficient"""
+        return dict((coeff, rolling.value) for coeff, rolling in zip(self.coefficients, self._cauchy))
+
+    @property
+    def slope(self):
+        """Slope of the residual over the last slope_window rows, in orders of magnitude per row"""
+        return self._slope.value
+
+    def update(self):
+        """Processes the rows written since the last call and returns the status of the case"""
+        rewrites = self.follower.rewrites
+        self.follower.update()
+        if self.follower.rewrites != rewrites:
+            # the follower started over because the file was rewritten, e.g. by a restart
+            self.reset()
+        if len(self.follower) == self.rows:
+            return self.status
+
+        data = self.follower.data
+        missing = [var for var in self.coefficients + [self.residual] if var not in data]
+        assert not missing, "Variables " + str(missing) + " are not in " + self.follower.filename
+        columns = [data[var] for var in self.coefficients + [self.residual]]
+
+        for i in range(self.rows, len(self.follower)):
+            self.rows += 1
+            if self.status in ['converged', 'diverged'] or i < self.start_iter:
+                continue
+            self._push([float(column[i]) for column in columns])
+        return self.status
+
+    def _push(self, values):
+        """Adds one row of (coefficients..., residual) values and updates the status"""
+        if not all(math.isfinite(val) for val in values):
+            self.status = 'diverged'
+            return
+
+        residual = values[-1]
+        for rolling, c in zip(self._cauchy, values[:-1]):
+            rolling.push(c)
+        self._slope.push(residual)
+        self._lowest = min(self._lowest, residual)
+
+        if residual > self._lowest + self.diverge_rise:
+            self.status = 'diverged'
+        elif self.residual_min is not None and residual <= self.residual_min:
+            self.status = 'converged'
+        elif all(rolling.full for rolling in self._cauchy) and \
+             all(rolling.value <= self.cauchy_eps for rolling in self._cauchy):
+            self.status = 'converged'
+        elif self._slope.full and self._slope.value*(self.slope_window - 1) > self.stall_drop:
+            # the residual keeps rising
+            self.status = 'diverged'
+        elif self._slope.full and -self._slope.value*(self.slope_window - 1) < self.stall_drop:
+            self.status = 'stalled'
+        else:
+            self.status = 'running'
+
+    def watch(self, interval = 1.0, timeout = None):
+        """Polls the history file until the case is flagged as converged, stalled or diverged
+
+        Keyword arguments:
+        interval -- time in seconds between polls (default 1.0)
+        timeout -- stop after this many seconds without new rows. None polls forever (default None)
+
+        Return value:
+        status -- status of the case"""
+
+        last_row = time.time()
+        while self.status not in ['converged', 'diverged', 'stalled']:
+            rows = self.rows
+            self.update()
+            if self.rows > rows:
+                last_row = time.time()
+            elif timeout is not None and time.time() - last_row > timeout:
+                break
+            if self.status not in ['converged', 'diverged', 'stalled']:
+                time.sleep(interval)
+        return self.status
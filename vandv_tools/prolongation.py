@@ -0,0 +1,144 @@
+import numpy as np
+import os
+from scipy.spatial import cKDTree, Delaunay
+from io_su2.file_read_util import read_mesh
+from io_su2.restart import read_restart, write_restart
+
+def _idw(tree, values, points, k=4, power=2):
+    """Inverse distance weighted interpolation from the k nearest points of tree"""
+    k = min(k, values.shape[0])
+    dist, index = tree.query(points, k=k)
+    dist = dist.reshape(len(points), k)
+    index = index.reshape(len(points), k)
+    with np.errstate(divide='ignore'):
+        weights = 1.0/dist**power
+    # points that coincide with a source point take its values
+    exact = dist[:, 0] == 0
+    weights[exact] = 0.0
+    weights[exact, 0] = 1.0
+    weights /= weights.sum(axis=1)[:, None]
+    return np.einsum('nk,nkf->nf', weights, values[index])
+
+def interpolate_points(coarse_points, coarse_values, fine_points, method = 'linear', k = 4, power = 2,
+                       chunk_size = 1<<18):
+    """Interpolates point values from one point cloud to another
+
+    All points are located at once: 'linear' uses a Delaunay triangulation of the coarse
+    points and barycentric weights, 'idw' uses a KD-tree and inverse distance weights of
+    the k nearest coarse points. Fine points outside of the triangulation, e.g. on a
+    curved boundary, fall back to inverse distance weighting.
+
+    Keyword arguments:
+    coarse_points -- array of shape (nc, ndim) with the coordinates of the coarse points
+    coarse_values -- array of shape (nc, nfields) with the values at the coarse points
+    fine_points -- array of shape (nf, ndim) with the coordinates of the fine points
+    method -- 'linear' or 'idw' (default 'linear')
+    k -- number of neighbours used by inverse distance weighting (default 4)
+    power -- power of the inverse distance weights (default 2)
+    chunk_size -- number of fine points interpolated at a time, limits the memory
+                  used for the weights (default 262144)
+
+    Return value:
+    fine_values -- array of shape (nf, nfields) with the interpolated values
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    assert method in ['linear', 'idw'], "method has to be 'linear' or 'idw'"
+    coarse_points = np.asarray(coarse_points, dtype=float)
+    coarse_values = np.asarray(coarse_values, dtype=float)
+    fine_points = np.asarray(fine_points, dtype=float)
+    ndim = coarse_points.shape[1]
+
+    tree = cKDTree(coarse_points)
+    if method == 'linear':
+        tri = Delaunay(coarse_points)
+
+    fine_values = np.empty((fine_points.shape[0], coarse_values.shape[1]))
+    for start in range(0, fine_points.shape[0], chunk_size):
+        points = fine_points[start:start + chunk_size]
+        out = fine_values[start:start + chunk_size]
+        if method == 'idw':
+            out[:] = _idw(tree, coarse_values, points, k, power)
+            continue
+
+        simplex = tri.find_simplex(points)
+        inside = simplex >= 0
+        # barycentric coordinates of the points inside the triangulation
+        transform = tri.transform[simplex[inside]]
+        bary = np.einsum('nij,nj->ni', transform[:, :ndim], points[inside] - transform[:, ndim])
+        weights = np.column_stack([bary, 1.0 - bary.sum(axis=1)])
+        vertices = tri.simplices[simplex[inside]]
+        out[inside] = np.einsum('nk,nkf->nf', weights, coarse_values[vertices])
+        if not np.all(inside):
+            out[~inside] = _idw(tree, coarse_values, points[~inside], k, power)
+
+    return fine_values
+
+def prolongate_restart(coarse_restart, fine_mesh, filename = 'solution.dat', method = 'linear', k = 4, power = 2):
+    """Interpolates a SU2 restart onto a finer mesh so that the fine level can be started from it
+
+    The coordinates of the coarse points are taken from the restart. Every field of the
+    restart is interpolated, and the coordinate fields are replaced by the points of the
+    fine mesh, so the fields stay in the order SU2 expects.
+
+    Keyword arguments:
+    coarse_restart -- SU2 restart file (binary or ASCII) of the coarse level
+    fine_mesh -- SU2 mesh file (.su2) of the fine level
+    filename -- name of the binary restart that is written for the fine level, usually
+                SOLUTION_FILENAME of the fine case (default 'solution.dat')
+    method -- 'linear' or 'idw', see interpolate_points (default 'linear')
+    k -- number of neighbours used by inverse distance weighting (default 4)
+    power -- power of the inverse distance weights (default 2)
+
+    Return value:
+    solution -- array of shape (NPOIN, NFIELDS) with the solution that was written
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    restart = read_restart(coarse_restart)
+    variables = restart['VARIABLES']
+    ndime = 0
+    while ndime < min(3, len(variables)) and variables[ndime] == 'xyz'[ndime]:
+        ndime += 1
+    assert ndime > 1, "The restart file " + coarse_restart + " does not start with the point coordinates"
+
+    fine_points = read_mesh(fine_mesh)['POINTS']
+    assert fine_points.shape[1] == ndime, "The mesh " + fine_mesh + " and the restart have different dimensions"
+
+    coarse = np.asarray(restart['DATA'])
+    solution = np.empty((fine_points.shape[0], len(variables)))
+    solution[:, :ndime] = fine_points
+    solution[:, ndime:] = interpolate_points(coarse[:, :ndime], coarse[:, ndime:], fine_points, method, k, power)
+
+    write_restart(filename, variables, solution)
+    return solution
+
+def prolongate_level(konfig, coarse_folder, run_folder, mesh):
+    """Interpolates the restart of the coarser level onto mesh and sets konfig up to start from it
+
+    Keyword arguments:
+    konfig -- SU2 config of the fine level
+    coarse_folder -- run folder of the coarser level, which holds its RESTART_FILENAME
+    run_folder -- run folder of the fine level, SOLUTION_FILENAME is written there
+    mesh -- SU2 mesh file (.su2) of the fine level
+
+    Return value:
+    prolongated -- False if the coarser level has no restart and the fine level starts
+                   from the free-stream
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    coarse_restart = os.path.join(coarse_folder, konfig.get('RESTART_FILENAME', 'restart.dat'))
+    if not os.path.isfile(coarse_restart):
+        print('\t\t\tNo restart found in ' + coarse_folder + ', starting from free-stream')
+        return False
+    solution = os.path.join(run_folder, konfig.get('SOLUTION_FILENAME', 'solution.dat'))
+    print('\t\t\tInterpolating ' + coarse_restart + ' onto ' + mesh)
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+    prolongate_restart(coarse_restart, mesh, solution)
+    konfig.RESTART_SOL = 'YES'
+    return True
@@ -1,28 +1,111 @@
 import numpy as np
-from paraview.simple import *
+from scipy.spatial import cKDTree
+from io_su2.vtu_reader import read_vtu
 
 class PVWrapper:
+    """Point data access for .vtu files
+    Keyword arguments:
+    filename -- name of the .vtu file
+    backend -- 'paraview' to read the file with ParaView, or 'native' to read it
+               with io_su2.vtu_reader, which does not need ParaView (default 'paraview')
 
-    def __init__(self,filename=''):
+    """
+
+    def __init__(self,filename='',backend='paraview'):
+        assert backend in ['paraview','native'], "backend has to be 'paraview' or 'native'"
         self.filename = filename
-        self.reader = XMLUnstructuredGridReader(FileName=filename)
-        self.variables = self.reader.PointArrayStatus
-        self.data = servermanager.Fetch(self.reader)
+        self.backend = backend
+        if backend == 'paraview':
+            # ParaView is only imported when it is used, it is slow to load
+            from paraview.simple import XMLUnstructuredGridReader
+            from paraview import servermanager
+            self.reader = XMLUnstructuredGridReader(FileName=filename)
+            self.variables = self.reader.PointArrayStatus
+            self.data = servermanager.Fetch(self.reader)
+        else:
+            self.reader = None
+            self.data = read_vtu(filename)
+            self.variables = list(self.data['POINT_DATA'].keys())
+        self._tree = None
+        self._axis_trees = {}
+
+    @property
+    def points(self):
+        """numpy array of shape (nP,3) with the point coordinates"""
+        if self.backend == 'native':
+            return self.data['POINTS']
+        return _vtk_to_numpy(self.data.GetPoints().GetData())
+
+    @property
+    def tree(self):
+        """KD-tree over the point coordinates, built on first use"""
+        if self._tree is None:
+            self._tree = cKDTree(self.points)
+        return self._tree
+
+    def _axis_tree(self,axis):
+        """KD-tree over the two coordinates normal to axis, built on first use"""
+        if axis not in self._axis_trees:
+            cols = {'x' : [1,2], 'y' : [0,2], 'z' : [0,1]}[axis]
+            self._axis_trees[axis] = cKDTree(self.points[:,cols])
+        return self._axis_trees[axis]
+
+    def find_nearest(self,locs):
+        """Find the nearest point to each location
+        Keyword arguments:
+        locs -- (x,y,z) tuple, or array of shape (n,3) with several locations
 
-    def extract_all(self):
-        """Extract all variables at location specified
+        Return value:
+        index -- index of the nearest point (array of size n for several locations)
+        dist -- distance to the nearest point (array of size n for several locations)
+        """
+        dist, index = self.tree.query(np.asarray(locs,dtype=float))
+        return index, dist
+
+    def find_points(self,locs,eps=1e-5):
+        """Find the point within eps in every coordinate of each location
         Keyword arguments:
-        loc -- tuple containing the (x,y,z) coordinates of location 
-               (default (0.0,0.0,0.0))
+        locs -- (x,y,z) tuple, or array of shape (n,3) with several locations
         eps -- tolerance for coordinate comparison (default 1e-5)
 
+        Return value:
+        index -- index of the matching point with the lowest index, -1 if there is none
+                 (array of size n for several locations)
+        """
+        locs = np.asarray(locs,dtype=float)
+        matches = self.tree.query_ball_point(locs.reshape(-1,3),eps,p=np.inf)
+        index = np.array([min(m) if m else -1 for m in matches],dtype=np.int64)
+        return index[0] if locs.ndim == 1 else index
+
+    def variable_array(self,var):
+        """numpy view of the point data array of var, of shape (nP,ncomp). No data is copied."""
+        if self.backend == 'native':
+            return self.data['POINT_DATA'][var]
+        var_array = self.data.GetPointData().GetAbstractArray(var)
+        return _vtk_to_numpy(var_array).reshape(-1,var_array.GetNumberOfComponents())
+
+    def extract_all(self,copy=True):
+        """Extract all variables at all points
+        Keyword arguments:
+        copy -- if True, the arrays are float64 copies, like the values of
+                extract_variables_at_index. If False, they are views of the VTK
+                arrays (or of the file for the native backend), so no data is
+                copied and they keep the data type of the file, usually float32
+                (default True)
+        
         Return value: 
-        Dictionary where the keys are variable names and the values are
-        the value of that variable at location specified by loc
+        Dictionary where the keys are variable names and the values are arrays
+        of shape (nP,ncomp) with the value of that variable at every point.
+        'X', 'Y' and 'Z' contain the point coordinates. 
 
         """
-        nP = self.data.GetNumberOfPoints()                
-        return self.extract_variables_at_index(idx=[i for i in range(nP)])
+        points = self.points
+        data_dict = {'X' : points[:,0], 'Y' : points[:,1], 'Z' : points[:,2]}
+        for var in self.variables:
+            data_dict[var] = self.variable_array(var)
+        if copy:
+            data_dict = dict((key,np.array(value,dtype=float)) for key,value in data_dict.items())
+        return data_dict
 
     def extract_variables_at_loc(self,loc=(0.0,0.0,0.0), eps=1e-5):
         """Extract all variables at location specified
@@ -36,18 +119,28 @@ class PVWrapper:
         the value of that variable at location specified by loc
 
         """
-        nP = self.data.GetNumberOfPoints()
-        index = 0
-        for i in range(nP):
-            coords = self.data.GetPoint(i)
-            dx = abs(loc[0]-coords[0])
-            dy = abs(loc[1]-coords[1])
-            dz = abs(loc[2]-coords[2])
-            if dx < eps and dy < eps and dz < eps:
-                index = i
-                break
+        index = self.find_points(loc,eps)
+        if index < 0:
+            index = 0
         
-        return self.extract_variables_at_index(idx=index)
+        return self.extract_variables_at_index(idx=int(index))
+
+    def extract_variables_at_locs(self,locs,eps=1e-5):
+        """Extract all variables at several locations with one batched lookup
+        Keyword arguments:
+        locs -- array of shape (n,3) with the (x,y,z) coordinates of the locations
+        eps -- tolerance for coordinate comparison (default 1e-5)
+
+        Return value: 
+        Dictionary where the keys are variable names and the values are arrays
+        with the value of that variable at each location. Locations without a 
+        point within eps get the values of point 0, like extract_variables_at_loc.
+
+        """
+        index = self.find_points(np.asarray(locs,dtype=float).reshape(-1,3),eps)
+        index[index < 0] = 0
+        
+        return self.extract_variables_at_index(idx=[int(i) for i in index])
 
     def extract_variables_along_axis(self,loc=(0.0,0.0),axis='y', eps=1e-5):
         """Extract all variables along axis at location specified
@@ -63,57 +156,47 @@ class PVWrapper:
 
         """
 
-        if axis == 'x':
-            indx = 1
-            indy = 2
-        elif axis == 'y':
-            indx = 0
-            indy = 2
-        elif axis == 'z':
-            indx = 0
-            indy = 1
-
-
-        nP = self.data.GetNumberOfPoints()
-        inds = []
-        for i in range(nP):
-            coords = self.data.GetPoint(i)
-            dx = abs(loc[0]-coords[indx])
-            dy = abs(loc[1]-coords[indy])
-            if dx < eps and dy < eps:
-                inds.append(i)
+        # points on the line are found with a KD-tree over the two coordinates normal to axis
+        inds = sorted(self._axis_tree(axis).query_ball_point(np.asarray(loc,dtype=float),eps,p=np.inf))
         
         return self.extract_variables_at_index(idx=inds)
 
     def extract_variables_at_index(self,idx=0, eps=1e-5):
+        """Extract all variables at the point index or list of point indices idx
+        
+        Return value: 
+        For a list of indices, a dictionary where the keys are variable names and the
+        values are arrays of shape (n,ncomp). 'X', 'Y' and 'Z' contain the point 
+        coordinates. For a single index, the values are floats, or lists of floats 
+        for vector variables.
+        
+        The VTK arrays are accessed as numpy views and indexed once per variable.
+
+        """
         data_dict = {}
         if isinstance(idx,list):
-            n_ind = len(idx)
-            data_dict['X'] = np.empty(n_ind)
-            data_dict['Y'] = np.empty(n_ind)
-            data_dict['Z'] = np.empty(n_ind)
+            inds = np.asarray(idx,dtype=np.int64)
+            points = self.points[inds]
+            data_dict['X'] = points[:,0].astype(float)
+            data_dict['Y'] = points[:,1].astype(float)
+            data_dict['Z'] = points[:,2].astype(float)
             for var in self.variables:
-                var_array = self.data.GetPointData().GetAbstractArray(var)
-                data_dict[var] = np.empty((n_ind,var_array.GetNumberOfComponents()))
-                for i,ind in enumerate(idx):
-                    data_dict['X'][i] = self.data.GetPoint(ind)[0]
-                    data_dict['Y'][i] = self.data.GetPoint(ind)[1]
-                    data_dict['Z'][i] = self.data.GetPoint(ind)[2]
-                    if var_array.GetNumberOfComponents() > 1:
-                        for j in range(var_array.GetNumberOfComponents()):
-                            data_dict[var][i,j] = var_array.GetComponent(ind,j)
-                    else:
-                        data_dict[var][i] = var_array.GetComponent(ind,0)
+                data_dict[var] = self.variable_array(var)[inds].astype(float)
         else:
 
             for var in self.variables:
-                var_array = self.data.GetPointData().GetAbstractArray(var)
-                if var_array.GetNumberOfComponents() > 1:
-                    extracted_data = []
-                    for i in range(var_array.GetNumberOfComponents()):
-                        extracted_data.append(var_array.GetComponent(idx,i))
-                    data_dict[var] = extracted_data
+                values = self.variable_array(var)[idx]
+                if values.size > 1:
+                    data_dict[var] = values.tolist()
                 else:
-                    data_dict[var] = var_array.GetComponent(idx,0)
+                    data_dict[var] = float(values[0])
         
-        return data_dict
\ No newline at end of file
+        return data_dict
+
+def _vtk_to_numpy(vtk_array):
+    """numpy view of a VTK array"""
+    try:
+        from vtkmodules.util.numpy_support import vtk_to_numpy
+    except ImportError:
+        from paraview.vtk.util.numpy_support import vtk_to_numpy
+    return vtk_to_numpy(vtk_array)
@@ -0,0 +1,166 @@
+import os
+import signal
+import subprocess
+import time
+
+class Case:
+    """A single solver run that is scheduled by run_cases
+
+    Keyword arguments:
+    name -- name used when printing progress, e.g. the run folder
+    run_folder -- working directory of the run. The solver output is written to log.out in
+                  this folder.
+    command -- command to run, as a string or a list of arguments. {cores} is replaced by
+               the number of cores given to the case, e.g. 'mpirun -n {cores} SU2_CFD config_CFD.cfg'
+    cores -- number of cores the case needs, usually NUMBER_PART (default 1)
+    cost -- estimated cost used to order the cases when order='cost', e.g. NPOIN times
+            the number of iterations. Defaults to the number of cores.
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    def __init__(self, name, run_folder, command, cores=1, cost=None):
+        self.name = name
+        self.run_folder = run_folder
+        self.command = command
+        self.cores = cores
+        self.cost = cores if cost is None else cost
+        self.cores_used = 0
+        self.process = None
+        self.returncode = None
+        self.start_time = None
+        self.end_time = None
+        self.monitor = None
+        self.status = None
+
+    def start(self, cores, log_name='log.out'):
+        """Launches the case in its run folder with the given number of cores"""
+        if isinstance(self.command, str):
+            command = self.command.replace('{cores}', str(cores))
+        else:
+            command = [arg.replace('{cores}', str(cores)) for arg in self.command]
+        os.makedirs(self.run_folder, exist_ok=True)
+        self.cores_used = cores
+        self._log = open(os.path.join(self.run_folder, log_name), 'w')
+        self.start_time = time.time()
+        # new session so that the whole process group (shell, mpirun, solver) can be signalled
+        self.process = subprocess.Popen(command, cwd=self.run_folder, stdout=self._log,
+                                        stderr=subprocess.STDOUT, shell=isinstance(command, str),
+                                        start_new_session=True)
+
+    def poll(self):
+        """Returns the return code of the case, or None if it is still running"""
+        if self.returncode is None and self.process is not None:
+            self.returncode = self.process.poll()
+            if self.returncode is not None:
+                self.end_time = time.time()
+                self._log.close()
+        return self.returncode
+
+    def stop(self, sig=signal.SIGTERM):
+        """Sends sig to the process group of the case if it is running and waits for it to exit"""
+        if self.process is not None and self.poll() is None:
+            try:
+                os.killpg(self.process.pid, sig)
+            except ProcessLookupError:
+                pass
+            self.process.wait()
+            self.poll()
+
+def run_cases(cases, core_budget, order='largest', poll_interval=0.5, log_name='log.out', verbose=True,
+              monitor=None, stop_on=(), stop_signal=signal.SIGTERM):
+    """Runs solver cases concurrently without using more than core_budget cores at once
+
+    Cases are packed greedily: whenever cores become free, the pending cases are checked
+    from the largest to the smallest and every case that fits in the free cores is started.
+    A case that needs more cores than the budget is run with the whole budget.
+
+    Keyword arguments:
+    cases -- list of Case objects
+    core_budget -- total number of cores that can be used at the same time
+    order -- 'largest' to start cases with the most cores first, or 'cost' to start
+             cases with the highest cost first (default 'largest')
+    poll_interval -- time in seconds between checks of the running cases (default 0.5)
+    log_name -- name of the file in each run folder that the output is written to (default 'log.out')
+    verbose -- print when cases start and finish (default True)
+    monitor -- function that takes a Case and returns a ConvergenceMonitor (see monitor.py)
+               for it, e.g. lambda case: ConvergenceMonitor(case.run_folder + 'history.csv').
+               The monitors are updated at every poll and their status is stored in
+               case.status. None to not monitor the cases (default None)
+    stop_on -- statuses for which the solver is stopped early, any of 'converged',
+               'stalled' and 'diverged' (default ())
+    stop_signal -- signal sent to the process group of a case that is stopped (default SIGTERM)
+
+    Return value:
+    failed_cases -- list with the run folders of the cases that returned a non-zero exit code.
+                    Cases stopped because they converged are not included, cases stopped
+                    because they stalled or diverged are.
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    assert core_budget > 0, "core_budget has to be positive"
+    assert order in ['largest', 'cost'], "order has to be 'largest' or 'cost'"
+    if order == 'largest':
+        sort_key = lambda case: (case.cores, case.cost)
+    else:
+        sort_key = lambda case: (case.cost, case.cores)
+    pending = sorted(cases, key=sort_key, reverse=True)
+
+    running = []
+    failed_cases = []
+    free = core_budget
+    try:
+        while pending or running:
+            # start every pending case that fits in the free cores, largest first
+            for case in list(pending):
+                cores = min(case.cores, core_budget)
+                if cores <= free:
+                    case.start(cores, log_name)
+                    if monitor is not None:
+                        case.monitor = monitor(case)
+                        case.status = 'running'
+                    free -= cores
+                    pending.remove(case)
+                    running.append(case)
+                    if verbose:
+                        print('Started ' + case.name + ' on ' + str(cores) + ' cores (' + str(free) + ' free)')
+
+            time.sleep(poll_interval)
+
+            # follow the convergence of the running cases and stop them if requested
+            for case in running:
+                if case.monitor is None or case.poll() is not None:
+                    continue
+                # skip the history of a previous run until the solver has rewritten it
+                history = case.monitor.follower.filename
+                if not os.path.isfile(history) or os.path.getmtime(history) < case.start_time:
+                    continue
+                case.status = case.monitor.update()
+                if case.status in stop_on:
+                    if verbose:
+                        print('Stopping ' + case.name + ', ' + case.status + ' after ' +
+                              str(case.monitor.rows) + ' iterations')
+                    case.stop(stop_signal)
+
+            # collect finished cases
+            for case in list(running):
+                if case.poll() is None:
+                    continue
+                running.remove(case)
+                free += case.cores_used
+                if case.monitor is not None and os.path.isfile(case.monitor.follower.filename) and \
+                   os.path.getmtime(case.monitor.follower.filename) >= case.start_time:
+                    case.status = case.monitor.update()
+                if case.returncode != 0 and not (case.status == 'converged' and case.status in stop_on):
+                    failed_cases.append(case.run_folder)
+                if verbose:
+                    print('Finished ' + case.name + ' with exit code ' + str(case.returncode) +
+                          ' after ' + '{:.1f}'.format(case.end_time - case.start_time) + ' s' +
+                          ('' if case.status is None else ' (' + case.status + ')'))
+    finally:
+        # do not leave solvers running if the scheduler is interrupted
+        for case in running:
+            case.stop()
+
+    return failed_cases
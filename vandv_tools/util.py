@@ -20,10 +20,12 @@ def get_mesh_names(path = '', extension = '.su2'):
     return mesh_files
 
 def get_mesh_family_data(meshes, var = 'NPOIN'):
-    ndim = get_mesh_data(meshes[0])['NDIME']
+    # header data of each mesh is scanned once and served from the metadata cache afterwards
+    family_metadata = [mesh_metadata(mesh) for mesh in meshes]
+    ndim = family_metadata[0]['NDIME']
     mesh_data = {'N' : [] , 'h' : []}
-    for mesh in meshes:
-        mesh_data['N'].append(get_mesh_data(mesh,var))
+    for metadata in family_metadata:
+        mesh_data['N'].append(metadata.get(var, 0))
     mesh_data['N'].sort()
     mesh_data['h'] = [(1/i)**(1/ndim) for i in mesh_data['N']]
     return mesh_data
@@ -39,4 +41,134 @@ def calculate_uplus_yplus(y,rho,vel_u,mu):
     utau = np.sqrt(tau_wall/rho[0])
     uplus = vel_u / utau
     yplus = y * np.divide(utau,nu)
-    return uplus,yplus
\ No newline at end of file
+    return uplus,yplus
+
+def _wall_derivative_weights(dy):
+    """Weights of the one-sided finite difference of d/dy at the first point
+
+    Keyword arguments:
+    dy -- numpy array of shape (n, k+1) with the distance of the k+1 stencil points from
+          the first one, dy[:,0] = 0
+
+    Return value:
+    weights -- numpy array of shape (n, k+1). The derivative at the first point is the
+               sum of weights times the values, exact for polynomials of degree k."""
+    k = dy.shape[1] - 1
+    weights = np.empty_like(dy)
+    weights[:, 0] = -np.sum(1.0/dy[:, 1:], axis=1)
+    for j in range(1, k + 1):
+        numerator = np.ones(dy.shape[0])
+        denominator = np.ones(dy.shape[0])
+        for m in range(k + 1):
+            if m == j:
+                continue
+            denominator *= dy[:, j] - dy[:, m]
+            if m != 0:
+                numerator *= -dy[:, m]
+        weights[:, j] = numerator/denominator
+    return weights
+
+def calculate_uplus_yplus_batch(y, rho, vel_u, mu, offsets, order = 2, rho_ref = None, vel_ref = None):
+    """Calculates u+, y+, the friction velocity and the skin friction of many boundary layer profiles
+
+    All profiles are given as flat arrays with offsets, and are sorted by y together in a
+    single sort. The first point of every sorted profile is taken as the wall. The wall shear
+    stress uses a one-sided finite difference of the given order through the first
+    order+1 points, which handles stretched grids. order=1 gives the two-point gradient
+    of calculate_uplus_yplus.
+
+    The results differ from calculate_uplus_yplus in two ways. y+ uses the distance from
+    the first point, y - y[0], where calculate_uplus_yplus uses y itself, so the two only
+    agree when the wall is at y=0. u_tau keeps the sign of the wall shear, so separated
+    profiles get a negative u_tau and finite u+ and y+, where calculate_uplus_yplus
+    gives NaN.
+
+    Keyword arguments:
+    y -- flat numpy array with the wall normal coordinate of the points of all profiles
+    rho -- flat numpy array with the density
+    vel_u -- flat numpy array with the velocity parallel to the wall
+    mu -- flat numpy array with the laminar viscosity
+    offsets -- array of size nprofiles+1, the points of profile i are y[offsets[i]:offsets[i+1]]
+    order -- order of the wall gradient, 1 to 4 (default 2)
+    rho_ref -- reference density for the skin friction. None uses the density of the
+               last point of every profile (default None)
+    vel_ref -- reference velocity for the skin friction. None uses the velocity of the
+               last point of every profile (default None)
+
+    Return value:
+    data -- Dictionary organized as:
+    data = {    'Y' : flat numpy array with y of all profiles, each profile sorted from the wall,
+                'INDEX' : positions of the sorted points in the input arrays,
+                'OFFSETS' : offsets of the profiles, same as the input,
+                'UPLUS' : flat numpy array with u+ of all points,
+                'YPLUS' : flat numpy array with y+ of all points, from the distance to the
+                          first point of the profile and the local kinematic viscosity,
+                'TAU_WALL' : wall shear stress of every profile,
+                'U_TAU' : friction velocity of every profile, negative for negative wall shear,
+                'CF' : skin friction coefficient of every profile }
+    Profiles with fewer than order+1 points get NaN.
+
+    Author: Jayant Mukhopadhaya
+    Last updated: 10/18/2026"""
+
+    assert 1 <= order <= 4, "order has to be between 1 and 4"
+    offsets = np.asarray(offsets, dtype=np.int64)
+    nprof = offsets.size - 1
+    counts = np.diff(offsets)
+
+    # no points: empty point arrays, and NaN for every (empty) profile
+    if len(y) == 0:
+        empty = np.empty(0)
+        nan = np.full(nprof, np.nan)
+        return {'Y' : empty, 'INDEX' : np.empty(0, dtype=np.int64), 'OFFSETS' : offsets,
+                'UPLUS' : empty.copy(), 'YPLUS' : empty.copy(), 'TAU_WALL' : nan,
+                'U_TAU' : nan.copy(), 'CF' : nan.copy()}
+
+    profile = np.repeat(np.arange(nprof), counts)
+
+    # sort every profile from the wall outwards. This is np.lexsort((y, profile)) done as
+    # a quicksort of y followed by a stable sort of the profile index in the smallest
+    # integer type, which numpy does with a radix sort
+    inds = np.argsort(y)
+    inds = inds[np.argsort(profile[inds].astype(np.min_scalar_type(nprof)), kind='stable')]
+    y = np.asarray(y, dtype=float)[inds]
+    rho = np.asarray(rho, dtype=float)[inds]
+    vel_u = np.asarray(vel_u, dtype=float)[inds]
+    mu = np.asarray(mu, dtype=float)[inds]
+    nu = np.divide(mu, rho)
+
+    # stencil of the first order+1 points of every profile
+    valid = counts > order
+    wall = offsets[:-1]
+    stencil = np.minimum(wall[:, None] + np.arange(order + 1), np.maximum(offsets[1:, None] - 1, 0))
+    stencil = stencil[valid]
+    dy = y[stencil] - y[stencil[:, :1]]
+
+    tau_wall = np.full(nprof, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weights = _wall_derivative_weights(dy)
+        tau_wall[valid] = mu[stencil[:, 0]]*np.sum(weights*vel_u[stencil], axis=1)
+
+        rho_wall = np.full(nprof, np.nan)
+        rho_wall[valid] = rho[wall[valid]]
+        utau = np.sign(tau_wall)*np.sqrt(np.abs(tau_wall)/rho_wall)
+
+        last = np.maximum(offsets[1:] - 1, 0)
+        rho_inf = rho[last] if rho_ref is None else rho_ref
+        vel_inf = vel_u[last] if vel_ref is None else vel_ref
+        cf = tau_wall/(0.5*rho_inf*vel_inf**2)
+
+        y_wall = np.full(nprof, np.nan)
+        y_wall[valid] = y[wall[valid]]
+        uplus = vel_u/utau[profile]
+        yplus = (y - y_wall[profile])*utau[profile]/nu
+
+    data = {'Y' : y,
+            'INDEX' : inds,
+            'OFFSETS' : offsets,
+            'UPLUS' : uplus,
+            'YPLUS' : yplus,
+            'TAU_WALL' : tau_wall,
+            'U_TAU' : utau,
+            'CF' : cf}
+    return data